@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Church Data Analysis CLI.
+
+Generates synthetic weekly records for N churches over M weeks, runs data.py
+on them with --run-report, and keeps the median time of each stage and graph
+as a JSON baseline.  A later run can be compared against that baseline, and
+the comparison fails when a stage got slower than the allowed percentage.
+
+Quick examples (run from the terminalVersion/ folder):
+    python benchmark.py run --churches 20 --weeks 520 --output bench/baseline.json
+    python benchmark.py run --churches 20 --weeks 520 --compare bench/baseline.json
+    python benchmark.py compare bench/baseline.json bench/current.json --threshold 15
+    python benchmark.py generate --churches 5 --weeks 104 --output-dir bench/data
+    python benchmark.py run --render-jobs 4 --pdf
+
+Flags that benchmark.py does not know are passed to data.py, so any data.py
+configuration can be benchmarked.  Each run reads its inputs with --no-cache
+and renders with --force-render, so every stage does its full work.
+
+Input formats written by the generator (churches are dealt out in turn):
+    csv        - app export: APP_WEEKLY_COLUMNS headers, ISO dates
+    messy_csv  - aliased headers, "KES 1,234" amounts, day-first dates and
+                 an unknown Remarks column
+    xlsx       - the messy_csv layout with a title row above each church's
+                 sheet
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+import data
+from data import APP_WEEKLY_COLUMNS, log
+
+BENCHMARK_VERSION = 1
+FORMATS = ("csv", "messy_csv", "xlsx")
+INPUT_FILES = {"csv": "app_export.csv", "messy_csv": "messy_export.csv", "xlsx": "messy_workbook.xlsx"}
+# Saturday of the last generated week, fixed so baselines stay comparable.
+LAST_WEEK = pd.Timestamp("2026-03-28")
+DEFAULT_THRESHOLD = 10.0
+# Stages faster than this in both runs are too noisy to fail a comparison.
+DEFAULT_MIN_SECONDS = 0.05
+
+# Headers of the messy formats; each is an alias data.py maps back to the
+# canonical column.  Columns missing here are left out of the messy files.
+MESSY_HEADERS = {
+    "week_start_date": "Week Starting",
+    "church_id": "Church ID",
+    "men": "Males",
+    "women": "Females",
+    "youth": "Youths",
+    "children": "Kids",
+    "sunday_home_church": "Home Church",
+    "tithe": "Tithe (KES)",
+    "offerings": "Offering (KES)",
+    "emergency_collection": "Emergency",
+    "planned_collection": "Planned",
+    "mission_offering": "Mission",
+    "local_church_budget": "Church Budget",
+    "baptisms": "Baptized",
+    "holy_communion": "Holy Comm",
+    "holy_communion_expected": "Expected at HC",
+    "sabbath_school_attendance": "Sabbath School",
+    "visitors_count": "Visitors",
+    "board_business_meeting_attendance": "Board Meeting",
+    "board_business_meeting_expected": "Board Expected",
+    "ambassadors_attendance": "Ambassadors",
+}
+MONEY_COLUMNS = ["tithe", "offerings", "emergency_collection", "planned_collection",
+                 "mission_offering", "local_church_budget"]
+
+
+# ── synthetic data ───────────────────────────────────────────────────────────
+
+def synthetic_records(churches: int, weeks: int, seed: int = 0) -> pd.DataFrame:
+    """Weekly records shaped like the app's export, one row per church and week."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=LAST_WEEK, periods=weeks, freq="7D")
+    church = np.repeat(np.arange(1, churches + 1), weeks)
+    week = np.tile(np.arange(weeks), churches)
+    size = np.repeat(rng.integers(60, 400, churches), weeks)
+    # Slow growth, a yearly cycle and weekly noise around each church's size.
+    scale = size * (1 + week / 1000) * (1 + 0.1 * np.sin(2 * np.pi * week / 52))
+    rows = len(church)
+
+    def heads(share: float) -> np.ndarray:
+        return np.maximum(0, np.round(scale * share * rng.normal(1, 0.08, rows))).astype(int)
+
+    def amount(base: np.ndarray, low: float, high: float) -> np.ndarray:
+        return np.round(base * rng.uniform(low, high, rows), -1)
+
+    men, women, youth, children = heads(0.28), heads(0.34), heads(0.18), heads(0.2)
+    adults = men + women
+    quarter = week % 13 == 12
+    month = week % 4 == 3
+    records = pd.DataFrame({
+        "id": np.arange(1, rows + 1),
+        "church_id": church,
+        "created_by_admin_id": 1,
+        "week_start_date": np.tile(dates, churches),
+        "men": men,
+        "women": women,
+        "youth": youth,
+        "children": children,
+        "sunday_home_church": heads(0.45),
+        "tithe": amount(adults, 150, 250),
+        "offerings": amount(adults, 50, 100),
+        "emergency_collection": np.where(rng.random(rows) < 0.1, amount(adults, 20, 80), 0),
+        "planned_collection": np.where(month, amount(adults, 40, 120), 0),
+        "mission_offering": amount(adults, 5, 20),
+        "local_church_budget": amount(adults, 10, 40),
+        "baptisms": np.where(rng.random(rows) < 0.15, rng.integers(1, 6, rows), 0),
+        "holy_communion": np.where(quarter, np.round(adults * rng.uniform(0.6, 0.9, rows)), 0),
+        "holy_communion_expected": np.where(quarter, adults, 0),
+        "sabbath_school_attendance": np.round((men + women + youth + children) * rng.uniform(0.7, 0.9, rows)),
+        "visitors_count": rng.poisson(6, rows),
+        "board_business_meeting_attendance": np.where(month, rng.integers(8, 16, rows), np.nan),
+        "board_business_meeting_expected": np.where(month, 15, np.nan),
+        "ambassadors_attendance": np.round(youth * rng.uniform(0.3, 0.6, rows)),
+    })
+    records["total_attendance"] = records[data.ATTENDANCE_PARTS].sum(axis=1)
+    records["total_income"] = records[data.INCOME_PARTS].sum(axis=1)
+    records["adult_attendance"] = adults
+    stamps = (records["week_start_date"] + pd.Timedelta(days=1)).dt.strftime("%Y-%m-%dT%H:%M:%S")
+    records["created_at"] = stamps
+    records["updated_at"] = stamps
+    return records[APP_WEEKLY_COLUMNS]
+
+
+def messy_frame(records: pd.DataFrame) -> pd.DataFrame:
+    """The records as a hand-kept spreadsheet exports them."""
+    messy = pd.DataFrame(index=records.index)
+    for column, header in MESSY_HEADERS.items():
+        values = records[column]
+        if column == "week_start_date":
+            values = values.dt.strftime("%d/%m/%Y")
+        elif column in MONEY_COLUMNS:
+            values = values.map(lambda amount: f"KES {amount:,.0f}")
+        messy[header] = values
+    messy["Remarks"] = np.where(records["holy_communion"] > 0, "Communion Sabbath", "")
+    return messy
+
+
+def write_inputs(directory: Path, churches: int, weeks: int, seed: int = 0,
+                 formats: Sequence[str] = FORMATS) -> list[Path]:
+    """Write the synthetic records into *directory*, dealing churches out over *formats*."""
+    directory.mkdir(parents=True, exist_ok=True)
+    records = synthetic_records(churches, weeks, seed)
+    fmt_of = {church: formats[index % len(formats)]
+              for index, church in enumerate(records["church_id"].unique())}
+    chosen = records["church_id"].map(fmt_of)
+    written: list[Path] = []
+    for fmt in dict.fromkeys(formats):
+        rows = records[chosen == fmt]
+        if rows.empty:
+            continue
+        path = directory / INPUT_FILES[fmt]
+        if fmt == "csv":
+            rows.to_csv(path, index=False)
+        elif fmt == "messy_csv":
+            messy_frame(rows).to_csv(path, index=False)
+        else:
+            write_messy_workbook(path, rows)
+        written.append(path)
+    return written
+
+
+def write_messy_workbook(path: Path, records: pd.DataFrame) -> None:
+    """One sheet per church, each with a title row and a blank row above the headers."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for church_id, rows in records.groupby("church_id", sort=True):
+        sheet = workbook.create_sheet(f"Church {church_id}")
+        messy = messy_frame(rows)
+        sheet.append([f"Church {church_id} weekly attendance and giving"])
+        sheet.append([])
+        sheet.append(list(messy.columns))
+        for row in messy.itertuples(index=False):
+            sheet.append([None if pd.isna(value) else value for value in row])
+    workbook.save(path)
+
+
+# ── running ──────────────────────────────────────────────────────────────────
+
+def stage_times(report: dict, process_wall: float) -> dict[str, float]:
+    """Wall seconds per stage and per graph from one data.py --run-report."""
+    times: dict[str, float] = {"process": process_wall, "startup": process_wall - report["wall"]}
+    for span in report["spans"]:
+        if span["stage"] in ("build", "save"):
+            key = f"graph:{span['label']}"
+        else:
+            key = span["stage"]
+        times[key] = times.get(key, 0.0) + span["wall"]
+    return {key: round(value, 6) for key, value in times.items()}
+
+
+def run_data_py(inputs: Path, work_dir: Path, extra_args: Sequence[str], index: int) -> tuple[dict, float]:
+    """Run data.py once over *inputs*; return its run report and the process's wall time."""
+    report_path = work_dir / f"run_{index}.json"
+    command = [sys.executable, str(data.SCRIPT_DIR / "data.py"), "--input", str(inputs),
+               "--graphs", "all", "--no-cache", "--force-render",
+               "--output-dir", str(work_dir / "out"), "--run-report", str(report_path), *extra_args]
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=work_dir, capture_output=True, text=True)
+    wall = time.perf_counter() - started
+    if result.returncode != 0 or not report_path.is_file():
+        raise RuntimeError(f"data.py exited with {result.returncode}: {result.stderr.strip()[-2000:]}")
+    return json.loads(report_path.read_text()), wall
+
+
+def run_benchmark(args: argparse.Namespace, extra_args: Sequence[str]) -> dict:
+    """Generate the inputs, run data.py --repeat times and return the baseline."""
+    with tempfile.TemporaryDirectory(prefix="church_bench_") as temp:
+        work_dir = Path(temp)
+        inputs = Path(args.data_dir) if args.data_dir else work_dir / "inputs"
+        log(f"Writing {args.churches} church(es) × {args.weeks} week(s) to {inputs}…")
+        paths = write_inputs(inputs, args.churches, args.weeks, args.seed, args.formats)
+        runs: list[dict[str, float]] = []
+        versions: dict = {}
+        for index in range(args.repeat):
+            report, wall = run_data_py(inputs, work_dir, extra_args, index)
+            versions = report["versions"]
+            runs.append(stage_times(report, wall))
+            log(f"  run {index + 1}/{args.repeat}: {wall:.2f}s")
+    keys = list(dict.fromkeys(key for run in runs for key in run))
+    return {
+        "benchmark_version": BENCHMARK_VERSION,
+        "written": datetime.now().isoformat(timespec="seconds"),
+        "config": {"churches": args.churches, "weeks": args.weeks, "seed": args.seed,
+                   "formats": list(args.formats), "files": [path.name for path in paths],
+                   "data_args": list(extra_args)},
+        "versions": versions,
+        "repeat": args.repeat,
+        # Median over the runs, so one slow run does not move the baseline.
+        "stages": {key: round(statistics.median(run.get(key, 0.0) for run in runs), 6) for key in keys},
+        "runs": runs,
+    }
+
+
+def write_baseline(path: Path, baseline: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp.write_text(json.dumps(baseline, indent=1))
+    os.replace(temp, path)
+
+
+# ── comparing ────────────────────────────────────────────────────────────────
+
+def compare_baselines(baseline: dict, current: dict, threshold: float,
+                      min_seconds: float = DEFAULT_MIN_SECONDS) -> list[str]:
+    """Print each stage's change and return the stages that regressed by more than *threshold* %."""
+    if baseline.get("config") != current.get("config"):
+        log("Warning: the two runs used different data or data.py flags; changes may not be regressions.")
+    old, new = baseline["stages"], current["stages"]
+    regressed: list[str] = []
+    log(f"  {'stage':<50} {'baseline s':>10} {'current s':>10} {'change':>8}")
+    for key in sorted(old.keys() | new.keys(), key=lambda name: (name.startswith("graph:"), name)):
+        if key not in new or key not in old:
+            log(f"  {key:<50} {old.get(key, '-'):>10} {new.get(key, '-'):>10} {'only one':>8}")
+            continue
+        before, after = old[key], new[key]
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > threshold and max(before, after) >= min_seconds:
+            regressed.append(key)
+            flag = "  REGRESSED"
+        log(f"  {key:<50} {before:>10.3f} {after:>10.3f} {change:>+7.1f}%{flag}")
+    return regressed
+
+
+def report_comparison(baseline: dict, current: dict, threshold: float, min_seconds: float) -> int:
+    regressed = compare_baselines(baseline, current, threshold, min_seconds)
+    if regressed:
+        log(f"Benchmark regressed: {len(regressed)} stage(s) more than {threshold:g}% slower: "
+            f"{', '.join(regressed)}")
+        return 1
+    log(f"No stage is more than {threshold:g}% slower than the baseline.")
+    return 0
+
+
+def read_baseline(path: str) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark data.py on synthetic weekly records.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_data_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument("--churches", type=int, default=10, help="Number of churches.")
+        command.add_argument("--weeks", type=int, default=260, help="Weeks of records per church.")
+        command.add_argument("--seed", type=int, default=0, help="Random seed for the generated values.")
+        command.add_argument("--formats", type=lambda value: value.split(","), default=list(FORMATS),
+                             help=f"Comma-separated input formats to deal churches over ({','.join(FORMATS)}).")
+
+    generate = commands.add_parser("generate", help="Only write the synthetic input files.",
+                                   formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    add_data_options(generate)
+    generate.add_argument("--output-dir", default="bench_data", help="Directory for the generated files.")
+
+    run = commands.add_parser("run", help="Time data.py on synthetic input and write a baseline.",
+                              formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    add_data_options(run)
+    run.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the median is kept.")
+    run.add_argument("--output", default="benchmark.json", help="Baseline JSON file to write.")
+    run.add_argument("--data-dir", default=None,
+                     help="Write and keep the generated inputs here (default: a temporary directory).")
+    run.add_argument("--compare", default=None, metavar="BASELINE",
+                     help="Compare the new results against this baseline and fail on regressions.")
+    add_compare_options(run)
+
+    compare = commands.add_parser("compare", help="Compare two baselines; exit 1 on regressions.",
+                                  formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    compare.add_argument("baseline", help="Earlier baseline JSON.")
+    compare.add_argument("current", help="Newer baseline JSON.")
+    add_compare_options(compare)
+    return parser
+
+
+def add_compare_options(command: argparse.ArgumentParser) -> None:
+    command.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="Fail when a stage is more than this many percent slower.")
+    command.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS,
+                         help="Ignore stages shorter than this in both runs.")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args, extra_args = parser.parse_known_args(argv)
+    if extra_args and args.command != "run":
+        parser.error(f"unrecognized arguments: {' '.join(extra_args)}")
+    if args.command in ("generate", "run"):
+        unknown = sorted(set(args.formats) - set(FORMATS))
+        if unknown:
+            parser.error(f"Unknown format(s): {', '.join(unknown)} (choose from {', '.join(FORMATS)})")
+        if args.churches < 1 or args.weeks < 1:
+            parser.error("--churches and --weeks must be at least 1.")
+
+    if args.command == "generate":
+        for path in write_inputs(Path(args.output_dir), args.churches, args.weeks, args.seed, args.formats):
+            log(f"Generated {path}")
+        return 0
+
+    if args.command == "compare":
+        return report_comparison(read_baseline(args.baseline), read_baseline(args.current),
+                                 args.threshold, args.min_seconds)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+    try:
+        baseline = run_benchmark(args, extra_args)
+    except RuntimeError as exc:
+        log(f"Error: {exc}")
+        return 1
+    write_baseline(Path(args.output), baseline)
+    log(f"Wrote {args.output}")
+    if args.compare:
+        return report_comparison(read_baseline(args.compare), baseline, args.threshold, args.min_seconds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
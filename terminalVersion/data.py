@@ -10,6 +10,10 @@ Quick examples (run from the terminalVersion/ folder):
     python data.py --input data/netFinalData.csv --graphs all --pdf
     python data.py --input data --group attendance --export-clean
     python data.py --input weekly.xlsx --graphs total_attendance_trend,income_distribution
+    python data.py --input data --graphs all --jobs 4
+    python data.py --db app.sqlite --church-id 1 --date-from 2026-01-01 --graphs all
+    python data.py --input data --by church_id --graphs all --pdf
+    python data.py --input data --serve --port 8765
     python data.py --list-graphs
 
 Import template columns (Flutter app):
@@ -38,19 +42,43 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import calendar
+import hashlib
+import html
+import inspect
+import io
+import json
 import os
+import pickle
 import re
 import shutil
+import sqlite3
 import sys
-from dataclasses import dataclass
+import time
+import threading
+import tracemalloc
+import weakref
+from collections import OrderedDict, deque
+from contextlib import closing, contextmanager, nullcontext
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import astuple, dataclass
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Sequence
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence
+from urllib.parse import parse_qs, quote, urlsplit
 
 os.environ.setdefault("MPLCONFIGDIR", "/tmp/matplotlib")
 
 import matplotlib
 from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.dates import AutoDateLocator, ConciseDateFormatter
 from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import TextPath
+from matplotlib.ticker import MaxNLocator
+from matplotlib.transforms import Affine2D, Bbox, IdentityTransform, TransformedBbox
 
 if not os.environ.get("DISPLAY"):
     matplotlib.use("Agg")
@@ -59,10 +87,59 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib.backends.backend_pdf import PdfPages
+from pandas.tseries.api import guess_datetime_format
 
 SUPPORTED_SUFFIXES = {".csv", ".xlsx", ".xls", ".xslx"}
 SCRIPT_DIR = Path(__file__).resolve().parent
 
+# Bump whenever prepare_dataframe or the readers change their output, so stale
+# entries in the parsed-file cache are never reused.
+PARSER_VERSION = 3
+# Likewise for derive_metrics and the cached derived data.
+DERIVE_VERSION = 3
+CACHE_DIR_NAME = ".church_cache"
+DEFAULT_CACHE_MAX_MB = 512
+# Rendered-graph cache inside the output directory.  The source of this file,
+# helpers included, is part of every fingerprint; bump RENDER_VERSION when the
+# output changes for another reason.
+RENDER_CACHE_DIR = ".render_cache"
+RENDER_VERSION = 3
+# Background threads that encode and write rendered figures, and how many
+# figures may wait for them before rendering pauses (each holds a full RGBA
+# buffer).
+RENDER_WRITE_THREADS = 2
+RENDER_WRITE_BACKLOG = 4
+# Time-series graphs draw each line with at most this many points (--max-points);
+# longer histories are downsampled with LTTB.  Markers are dropped from lines
+# longer than TIME_MARKER_LIMIT points, and the x axis gets at most
+# TIME_AXIS_TICKS date ticks.
+DEFAULT_MAX_POINTS = 1000
+TIME_MARKER_LIMIT = 104
+TIME_AXIS_TICKS = 10
+# Heatmaps with more cells than this are drawn without value labels.
+HEATMAP_LABEL_MAX_CELLS = 400
+# Rows in each table --timings prints.
+TIMINGS_TOP = 8
+# Columns --by can split a run on, and the index page it writes.
+BATCH_KEYS = ("church_id", "source_file")
+BATCH_INDEX = "index.html"
+# --serve: the local render server's address, its rendered-image LRU, and
+# the formats and DPI range a request may ask for.
+SERVE_HOST = "127.0.0.1"
+DEFAULT_SERVE_PORT = 8765
+DEFAULT_SERVE_CACHE_MB = 64
+SERVE_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+SERVE_DPI_RANGE = (30, 600)
+
+# Flutter app database (Drift/SQLite) read by --db.
+DB_TABLE = "weekly_records"
+DB_BATCH_ROWS = 5000
+DB_DATETIME_COLUMNS = {"week_start_date", "created_at", "updated_at"}
+
+# pandas 3 copies lazily (copy-on-write) and deprecates the copy keyword;
+# pandas 2 copies eagerly in concat, rename and friends unless passed copy=False.
+NO_COPY: dict[str, bool] = {} if int(pd.__version__.split(".")[0]) >= 3 else {"copy": False}
+
 # ---------------------------------------------------------------------------
 # Church brand palette
 # ---------------------------------------------------------------------------
@@ -153,6 +230,103 @@ SABBATH_ATTENDANCE_PARTS = ["men", "women", "youth", "children"]
 CORE_INCOME_PARTS = ["tithe", "offerings", "emergency_collection", "planned_collection"]
 OPTIONAL_INCOME_PARTS = ["mission_offering", "local_church_budget"]
 INCOME_PARTS = CORE_INCOME_PARTS + OPTIONAL_INCOME_PARTS
+DERIVED_RATE_COLUMNS = [
+    "income_per_attendee",
+    "tithe_per_attendee",
+    "offerings_per_attendee",
+    "regular_income_per_adult",
+    "men_pct",
+    "women_pct",
+    "youth_pct",
+    "children_pct",
+    "home_church_pct",
+    "attendance_growth",
+    "income_growth",
+    "tithe_growth",
+    "men_women_ratio",
+    "adult_young_ratio",
+    "tithe_offerings_ratio",
+]
+# Metrics in the correlation heatmap and tables/correlation_matrix.csv.
+CORRELATION_COLUMNS = [
+    "men", "women", "youth", "children", "sunday_home_church",
+    "total_attendance", "tithe", "offerings", "total_income",
+    "baptisms", "holy_communion", "sabbath_school_attendance",
+]
+GROWTH_COLUMNS = {
+    "total_attendance": "attendance_growth",
+    "total_income": "income_growth",
+    "tithe": "tithe_growth",
+}
+DERIVED_ONLY_COLUMNS = [
+    "sabbath_attendance",
+    "source_total_attendance",
+    "total_with_home_church",
+    "young_attendance",
+    "core_income",
+    "regular_income",
+    "special_collections",
+    "source_total_income",
+    *DERIVED_RATE_COLUMNS,
+]
+# Derived columns computed only when a run reads them, as (kind, columns read).
+# Kinds: "pair" adds two columns treating NaN as 0, "sum" is _row_sum,
+# "ratio" divides, "percent" divides times 100, and "growth" compares with the
+# partition's previous row.  Entries only read columns listed before them.
+LAZY_DERIVED_COLUMNS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "young_attendance": ("pair", ("youth", "children")),
+    "core_income": ("sum", tuple(CORE_INCOME_PARTS)),
+    "regular_income": ("pair", ("tithe", "offerings")),
+    "special_collections": ("pair", ("emergency_collection", "planned_collection")),
+    "income_per_attendee": ("ratio", ("total_income", "total_attendance")),
+    "tithe_per_attendee": ("ratio", ("tithe", "total_attendance")),
+    "offerings_per_attendee": ("ratio", ("offerings", "total_attendance")),
+    "regular_income_per_adult": ("ratio", ("regular_income", "adult_attendance")),
+    "men_pct": ("percent", ("men", "sabbath_attendance")),
+    "women_pct": ("percent", ("women", "sabbath_attendance")),
+    "youth_pct": ("percent", ("youth", "sabbath_attendance")),
+    "children_pct": ("percent", ("children", "sabbath_attendance")),
+    "home_church_pct": ("percent", ("sunday_home_church", "total_attendance")),
+    "attendance_growth": ("growth", ("total_attendance",)),
+    "income_growth": ("growth", ("total_income",)),
+    "tithe_growth": ("growth", ("tithe",)),
+    "men_women_ratio": ("ratio", ("men", "women")),
+    "adult_young_ratio": ("ratio", ("adult_attendance", "young_attendance")),
+    "tithe_offerings_ratio": ("ratio", ("tithe", "offerings")),
+}
+LAZY_ATTR = "lazy_derived"
+SABBATH_VOTES_ATTR = "sabbath_total_votes"
+DERIVE_POOL_MIN_ROWS = 250_000
+PARTITION_SCAN_ROWS = 1024
+DERIVE_INPUT_COLUMNS = ATTENDANCE_PARTS + INCOME_PARTS + ["total_attendance", "total_income", "adult_attendance"]
+
+# --compact storage: head counts become nullable small integers and text
+# metadata becomes categorical.  It is the default from COMPACT_MIN_ROWS rows.
+HEAD_COUNT_COLUMNS = [
+    "men",
+    "women",
+    "youth",
+    "children",
+    "sunday_home_church",
+    "sabbath_school_attendance",
+    "visitors_count",
+    "ambassadors_attendance",
+    "adult_attendance",
+    "young_attendance",
+    "sabbath_attendance",
+    "total_attendance",
+    "total_with_home_church",
+    "source_total_attendance",
+    "baptisms",
+    "holy_communion",
+    "holy_communion_expected",
+    "board_business_meeting_attendance",
+    "board_business_meeting_expected",
+]
+CATEGORICAL_COLUMNS = ["source_file", "source_sheet", "source_table", "granularity", "source"]
+SMALL_INTEGER_DTYPES = {"unsigned": ["uint8", "uint16", "uint32"], "signed": ["int8", "int16", "int32"]}
+COMPACT_ATTR = "compact"
+COMPACT_MIN_ROWS = 250_000
 
 NUMERIC_COLUMNS = {
     "id",
@@ -307,11 +481,184 @@ ALIASES: dict[str, list[str]] = {
 
 ALIAS_LOOKUP = {alias: canonical for canonical, aliases in ALIASES.items() for alias in aliases}
 
+# Canonical columns the readers keep; anything else is skipped at read time
+# unless --keep-unknown-columns is given.
+KNOWN_COLUMNS = set(ALIASES).union(APP_WEEKLY_COLUMNS, OPTIONAL_METADATA_COLUMNS)
+
 
 def log(message: str) -> None:
     print(message)
 
 
+class MemoryReport:
+    """
+    Per-stage allocation accounting for --mem-report.
+
+    While disabled, stage() is a no-op.  Once started, tracemalloc runs for
+    the rest of the process and each stage records its net allocation (what
+    it left behind, summed over calls) and its peak above the level it
+    started at (the largest over calls).  Stages may nest: the outer stage's
+    net excludes what its inner stages left behind, while its peak includes
+    theirs.  Allocations in --jobs / --derive-jobs worker processes are not
+    traced.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.input_bytes = 0
+        self.peak = 0
+        self._stages: dict[str, list[int]] = {}
+        self._open: list[list[int]] = []
+
+    def start(self) -> None:
+        tracemalloc.start()
+        self.enabled = True
+
+    def stage(self, name: str):
+        """Context manager that traces the allocations of one load stage."""
+        return self._traced(name) if self.enabled else nullcontext()
+
+    @contextmanager
+    def _traced(self, name: str) -> Iterator[None]:
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        if self._open:
+            self._open[-1][1] = max(self._open[-1][1], peak)
+        tracemalloc.reset_peak()
+        # [start, peak, net of nested stages]
+        frame = [current, current, 0]
+        self._open.append(frame)
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.peak = max(self.peak, peak)
+            self._open.pop()
+            frame[1] = max(frame[1], peak)
+            if self._open:
+                self._open[-1][1] = max(self._open[-1][1], frame[1])
+                self._open[-1][2] += current - frame[0]
+            totals = self._stages.setdefault(name, [0, 0, 0])
+            totals[0] += 1
+            totals[1] += current - frame[0] - frame[2]
+            totals[2] = max(totals[2], frame[1] - frame[0])
+
+    def report(self) -> None:
+        """Log each stage's calls, net allocation and peak, then the process's peak RSS."""
+        mb = 1024 * 1024
+        log("Memory report (tracemalloc, per stage):")
+        log(f"  {'stage':<20} {'calls':>5} {'net MB':>9} {'peak MB':>9}")
+        for name, (calls, net, peak) in self._stages.items():
+            log(f"  {name:<20} {calls:>5} {net / mb:>9.1f} {peak / mb:>9.1f}")
+        current, peak = tracemalloc.get_traced_memory() if self.enabled else (0, 0)
+        log(f"  traced: {current / mb:.1f} MB now, {max(self.peak, peak) / mb:.1f} MB at peak")
+        rss = peak_rss()
+        if rss is None:
+            log("  peak RSS: not available on this platform")
+            return
+        line = f"  peak RSS: {rss / mb:.1f} MB"
+        if self.input_bytes:
+            line += f" ({rss / self.input_bytes:.1f}x the {self.input_bytes / mb:.1f} MB of input)"
+        log(line)
+
+
+MEMORY = MemoryReport()
+
+
+def peak_rss() -> Optional[int]:
+    """This process's peak resident set size in bytes, or None without the resource module."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class RunTimings:
+    """
+    Timed spans of a run, for --timings and --run-report.
+
+    span(stage, label) records how long a block took (wall and this
+    process's CPU time) and the peak RSS the process had reached when it
+    ended.  It costs a few clock reads, so spans are always recorded.  Spans
+    may nest; each keeps its depth and they are listed in the order they
+    finished.  Spans recorded in --jobs and --render-jobs worker processes
+    are sent back and added with extend(), carrying the worker's pid.  PNG
+    writes on FigureWriter threads fall outside the "save" spans.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: list[dict] = []
+        self._depth = 0
+
+    @contextmanager
+    def span(self, stage: str, label: str = "") -> Iterator[None]:
+        wall, cpu = time.perf_counter(), time.process_time()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.spans.append({
+                "stage": stage,
+                "label": label,
+                "start": round(wall - self.started, 6),
+                "wall": round(time.perf_counter() - wall, 6),
+                "cpu": round(time.process_time() - cpu, 6),
+                "peak_rss": peak_rss(),
+                "depth": self._depth,
+                "pid": os.getpid(),
+            })
+
+    def extend(self, spans: Iterable[dict]) -> None:
+        self.spans.extend(spans)
+
+    def stages(self) -> list[tuple[str, int, float, float]]:
+        """(stage, spans, wall, CPU) per stage, slowest first."""
+        totals: dict[str, list] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span["stage"], [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += span["wall"]
+            entry[2] += span["cpu"]
+        return sorted(((stage, *entry) for stage, entry in totals.items()), key=lambda row: -row[2])
+
+    def graphs(self) -> list[tuple[str, float, float]]:
+        """(graph id, build wall, save wall) per rendered graph, slowest first."""
+        totals: dict[str, list[float]] = {}
+        for span in self.spans:
+            if span["stage"] in ("build", "save"):
+                entry = totals.setdefault(span["label"], [0.0, 0.0])
+                entry[span["stage"] == "save"] += span["wall"]
+        return sorted(((graph_id, *entry) for graph_id, entry in totals.items()), key=lambda row: -sum(row[1:]))
+
+    def write(self, path: Path) -> None:
+        """Write every span, with run totals and library versions, as JSON."""
+        report = {
+            "written": datetime.now().isoformat(timespec="seconds"),
+            "argv": sys.argv[1:],
+            "versions": {"python": sys.version.split()[0], "pandas": pd.__version__,
+                         "numpy": np.__version__, "matplotlib": matplotlib.__version__},
+            "wall": round(time.perf_counter() - self.started, 6),
+            "cpu": round(time.process_time(), 6),
+            "peak_rss": peak_rss(),
+            "spans": self.spans,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            temp.write_text(json.dumps(report, indent=1))
+            os.replace(temp, path)
+        except Exception as exc:
+            log(f"Warning: could not write run report {path}: {exc}")
+
+
+TIMINGS = RunTimings()
+
+
 def normalize_name(name: object) -> str:
     """Return a stable snake_case-ish key for matching loose spreadsheet headers."""
     text = str(name).strip().replace("\n", " ").replace("\r", " ")
@@ -327,13 +674,25 @@ def canonical_column_name(name: object) -> str:
     return ALIAS_LOOKUP.get(normalized, normalized)
 
 
-def detect_header_row(raw: pd.DataFrame, scan_rows: int = 30) -> Optional[int]:
-    """Find a likely header row in a raw Excel sheet that may contain title rows."""
+def is_known_column(name: object) -> bool:
+    return canonical_column_name(name) in KNOWN_COLUMNS
+
+
+def log_unknown_columns(path: Path, unknown: Sequence[str]) -> None:
+    """Report the columns a reader skipped, once per file."""
+    names = list(dict.fromkeys(unknown))
+    if names:
+        shown = ", ".join(names[:8]) + (", …" if len(names) > 8 else "")
+        log(f"Note: {path.name}: skipped {len(names)} unknown column(s): {shown}")
+
+
+def detect_header_row(rows: Sequence[Sequence[object]], scan_rows: int = 30) -> Optional[int]:
+    """Find a likely header row among the leading rows of an Excel sheet that may contain title rows."""
     best_idx: Optional[int] = None
     best_score = 0
-    for idx in range(min(len(raw), scan_rows)):
+    for idx, row in enumerate(rows[:scan_rows]):
         tokens: set[str] = set()
-        for value in raw.iloc[idx].tolist():
+        for value in row:
             if value is None:
                 continue
             text = str(value).strip()
@@ -347,180 +706,833 @@ def detect_header_row(raw: pd.DataFrame, scan_rows: int = 30) -> Optional[int]:
     return best_idx
 
 
+def _coalesce_block(df: pd.DataFrame, groups: list[list[int]], dtype: np.dtype) -> np.ndarray:
+    """Coalesce same-dtype column groups into one 2-D array, first non-null wins."""
+    members = sorted({position for positions in groups for position in positions})
+    row = {position: index for index, position in enumerate(members)}
+    source = df if len(members) == df.shape[1] else df.iloc[:, members]
+    # Work on the transpose so each column is a contiguous row.
+    base = np.ascontiguousarray(source.to_numpy(dtype=dtype).T)
+    values = base[[row[positions[0]] for positions in groups]]
+    for rank in range(1, max(len(positions) for positions in groups)):
+        targets = [index for index, positions in enumerate(groups) if len(positions) > rank]
+        current = values[targets]
+        fill = base[[row[groups[index][rank]] for index in targets]]
+        np.copyto(current, fill, where=pd.isna(current))
+        values[targets] = current
+    return values.T
+
+
 def combine_duplicate_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Merge duplicate canonical columns, preferring the first non-empty value."""
-    result = pd.DataFrame(index=df.index)
+    """
+    Merge duplicate canonical columns, preferring the first non-empty value.
+
+    Positions are grouped by name.  Groups whose members share one NumPy dtype
+    are coalesced together as a single 2-D block per dtype; groups with mixed or
+    extension dtypes fall back to Series.combine_first.  A frame whose columns
+    are already unique is returned unchanged.
+    """
+    if df.columns.is_unique:
+        return df
+    groups: dict[object, list[int]] = {}
     for position, column in enumerate(df.columns):
-        series = df.iloc[:, position]
-        if column in result.columns:
-            result[column] = result[column].combine_first(series)
+        groups.setdefault(column, []).append(position)
+
+    dtypes = df.dtypes.tolist()
+    blocks: dict[np.dtype, list[object]] = {}
+    mixed: list[object] = []
+    for column, positions in groups.items():
+        kinds = {dtypes[position] for position in positions}
+        dtype = next(iter(kinds))
+        if len(kinds) == 1 and isinstance(dtype, np.dtype):
+            blocks.setdefault(dtype, []).append(column)
         else:
-            result[column] = series
-    return result
+            mixed.append(column)
+
+    parts: list[pd.DataFrame | pd.Series] = []
+    for dtype, columns in blocks.items():
+        values = _coalesce_block(df, [groups[column] for column in columns], dtype)
+        parts.append(pd.DataFrame(values, index=df.index, columns=columns))
+    for column in mixed:
+        positions = groups[column]
+        series = df.iloc[:, positions[0]]
+        for position in positions[1:]:
+            series = series.combine_first(df.iloc[:, position])
+        parts.append(series.rename(column))
+
+    result = pd.concat(parts, axis=1) if len(parts) > 1 else parts[0]
+    if isinstance(result, pd.Series):
+        result = result.to_frame()
+    return result[list(groups)] if list(result.columns) != list(groups) else result
 
 
 def canonicalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+    # A shallow copy is enough: only the labels change, never the values.
+    df = df.copy(deep=False)
     df.columns = [canonical_column_name(column) for column in df.columns]
     return combine_duplicate_columns(df)
 
 
+NULL_TOKENS = {"nan", "none", "null", "-"}
+CURRENCY_PREFIX = r"^[A-Z]{2,4}\s+"
+
+
 def clean_number(value: object) -> object:
     if value is None:
         return np.nan
     text = str(value).strip()
-    if not text or text.lower() in {"nan", "none", "null", "-"}:
+    if not text or text.lower() in NULL_TOKENS:
         return np.nan
     text = text.replace(",", "")
-    text = re.sub(r"^[A-Z]{2,4}\s+", "", text)
+    text = re.sub(CURRENCY_PREFIX, "", text)
     return text
 
 
+def clean_numeric_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized equivalent of ``pd.to_numeric(series.map(clean_number))``.
+
+    int64/float64 columns are returned as-is.  Anything else is stringified the
+    way clean_number does, factorized, and only the distinct strings are run
+    through the pandas string methods before being broadcast back by code.
+    """
+    if series.dtype in (np.dtype("int64"), np.dtype("float64")):
+        return series
+    codes, uniques = pd.factorize(series.astype(str))
+    text = pd.Series(uniques, dtype=object).str.strip()
+    missing = text.eq("") | text.str.lower().isin(NULL_TOKENS)
+    text = text.str.replace(",", "", regex=False).str.replace(CURRENCY_PREFIX, "", regex=True)
+    numbers = pd.to_numeric(text.where(~missing, np.nan), errors="coerce").to_numpy()
+    values = pd.api.extensions.take(numbers, codes, allow_fill=True)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
 def coerce_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+    # Assigning a column replaces its array rather than writing into it, so the
+    # shallow copy leaves the caller's frame untouched.
+    df = df.copy(deep=False)
     for column in NUMERIC_COLUMNS.intersection(df.columns):
-        df[column] = pd.to_numeric(df[column].map(clean_number), errors="coerce")
+        series = df[column]
+        cleaned = clean_numeric_series(series)
+        if cleaned is not series:
+            df[column] = cleaned
     return df
 
 
-def parse_date_series(series: pd.Series, force_year: Optional[int] = None) -> pd.Series:
-    """Parse ISO dates, day-first dates, and Excel serial dates."""
-    if pd.api.types.is_numeric_dtype(series):
+DAYFIRST_PATTERN = r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$"
+# Text pd.to_datetime skips when it picks the sample used to guess a format.
+DATE_SAMPLE_SKIP = {"", "NaT", "nat", "NAT", "nan", "NaN", "NAN", "now", "today"}
+
+# (dayfirst, strftime format or None) per file signature and column, so every
+# chunk or sheet of a file is parsed the same way without guessing again.
+_DATE_FORMATS: dict[tuple, tuple[bool, Optional[str]]] = {}
+
+
+def infer_date_format(text: pd.Series, weights: np.ndarray, total: int) -> tuple[bool, Optional[str], bool]:
+    """
+    Decide day-first and one explicit strftime format for stripped date text.
+
+    text holds a column's distinct values in order of first appearance and
+    weights their row counts.  Day-first wins when most of the column's rows
+    look like 12/03/2026; the format is guessed from the first usable value,
+    as pd.to_datetime would.  The last item says whether such a value existed.
+    """
+    matches = text.str.match(DAYFIRST_PATTERN, na=False).to_numpy(dtype=bool)
+    dayfirst = bool(total) and weights[matches].sum() / total > 0.5
+    for value in text:
+        if isinstance(value, str) and value not in DATE_SAMPLE_SKIP:
+            return dayfirst, guess_datetime_format(value, dayfirst=dayfirst), True
+    return dayfirst, None, False
+
+
+def force_series_year(parsed: pd.Series, year: int) -> pd.Series:
+    """
+    Move every date into year, keeping month, day and time of day.  Feb 29
+    becomes Feb 28 when year is not a leap year.
+    """
+    values = parsed.to_numpy()
+    missing = np.isnat(values)
+    values = np.where(missing, np.zeros(1, dtype=values.dtype), values)
+    days = values.astype("M8[D]")
+    months = values.astype("M8[M]")
+    month_index = (months - values.astype("M8[Y]")).astype(np.int64)
+    day_index = (days - months.astype("M8[D]")).astype(np.int64)
+    if not calendar.isleap(year):
+        day_index[(month_index == 1) & (day_index == 28)] = 27
+    start = (np.datetime64(str(year), "Y").astype("M8[M]") + month_index).astype("M8[D]")
+    moved = (start + day_index).astype(values.dtype) + (values - days.astype(values.dtype))
+    moved[missing] = np.datetime64("NaT")
+    return pd.Series(moved, index=parsed.index, name=parsed.name)
+
+
+def parse_date_series(series: pd.Series, force_year: Optional[int] = None,
+                      format_key: Optional[tuple] = None) -> pd.Series:
+    """
+    Parse ISO dates, day-first dates, and Excel serial dates.
+
+    Text is parsed once per distinct value with one explicit strftime format.
+    When format_key is given (a file signature plus column), the inferred
+    format is remembered and reused for later chunks or sheets of that file.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        parsed = series
+    elif pd.api.types.is_numeric_dtype(series):
         numeric = series.dropna()
         if not numeric.empty and numeric.median() > 10000:
             parsed = pd.to_datetime(series, unit="D", origin="1899-12-30", errors="coerce")
         else:
             parsed = pd.to_datetime(series, errors="coerce")
     else:
-        raw = series.astype(str).str.strip()
-        dayfirst_pattern = r"^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}$"
-        dayfirst = raw.str.match(dayfirst_pattern, na=False).mean() > 0.5
-        parsed = pd.to_datetime(raw, errors="coerce", dayfirst=dayfirst)
+        codes, uniques = pd.factorize(series)
+        text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+        if format_key is not None and format_key in _DATE_FORMATS:
+            dayfirst, date_format = _DATE_FORMATS[format_key]
+        else:
+            weights = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            dayfirst, date_format, sampled = infer_date_format(text, weights, len(series))
+            if format_key is not None and sampled:
+                _DATE_FORMATS[format_key] = (dayfirst, date_format)
+        if date_format is not None:
+            dates = pd.to_datetime(text, errors="coerce", format=date_format)
+        else:
+            dates = pd.to_datetime(text, errors="coerce", dayfirst=dayfirst)
+        dates = dates.dt.tz_localize(None)
+        if force_year is not None:
+            dates = force_series_year(dates, force_year)
+        return pd.Series(pd.api.extensions.take(dates.array, codes, allow_fill=True),
+                         index=series.index, name=series.name)
 
     parsed = parsed.dt.tz_localize(None)
     if force_year is not None:
-        parsed = parsed.apply(lambda value: value.replace(year=force_year) if pd.notna(value) else value)
+        parsed = force_series_year(parsed, force_year)
     return parsed
 
 
-def safe_divide(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
-    denominator = denominator.replace(0, np.nan)
-    return numerator / denominator
+@dataclass(frozen=True)
+class SabbathTotalVotes:
+    """
+    Counts behind looks_like_sabbath_total: rows where a source total,
+    the Sabbath-only sum and the app total are all present, and how many of
+    those match each sum.  Counts from separate batches of rows add up, so
+    appended weeks only need their own rows counted.
+    """
 
+    compared: int = 0
+    sabbath: int = 0
+    app: int = 0
 
-def ensure_numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
-    if column not in df.columns:
-        df[column] = np.nan
-    return pd.to_numeric(df[column], errors="coerce")
+    def __add__(self, other: "SabbathTotalVotes") -> "SabbathTotalVotes":
+        return SabbathTotalVotes(self.compared + other.compared, self.sabbath + other.sabbath, self.app + other.app)
 
+    @property
+    def prefers_sabbath(self) -> bool:
+        if not self.compared:
+            return False
+        return self.sabbath / self.compared > 0.6 and self.sabbath > self.app
 
-def sum_existing(df: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
-    available = [column for column in columns if column in df.columns]
-    if not available:
-        return pd.Series(np.nan, index=df.index, dtype="float64")
-    return df[available].apply(pd.to_numeric, errors="coerce").sum(axis=1, min_count=1)
+
+def count_sabbath_total_votes(existing, sabbath_total, app_total) -> SabbathTotalVotes:
+    existing, sabbath_total, app_total = (
+        np.asarray(values, dtype="float64") for values in (existing, sabbath_total, app_total)
+    )
+    comparable = ~(np.isnan(existing) | np.isnan(sabbath_total) | np.isnan(app_total))
+    existing = existing[comparable]
+    return SabbathTotalVotes(
+        int(comparable.sum()),
+        int(np.isclose(existing, sabbath_total[comparable], rtol=0.01, atol=1).sum()),
+        int(np.isclose(existing, app_total[comparable], rtol=0.01, atol=1).sum()),
+    )
 
 
-def looks_like_sabbath_total(existing: pd.Series, sabbath_total: pd.Series, app_total: pd.Series) -> bool:
+def looks_like_sabbath_total(existing, sabbath_total, app_total) -> bool:
     """Detect legacy totals that excluded Sunday Home Church attendance."""
-    comparable = pd.DataFrame(
-        {"existing": existing, "sabbath": sabbath_total, "app": app_total}
-    ).dropna()
-    if comparable.empty:
-        return False
-    sabbath_matches = np.isclose(comparable["existing"], comparable["sabbath"], rtol=0.01, atol=1).mean()
-    app_matches = np.isclose(comparable["existing"], comparable["app"], rtol=0.01, atol=1).mean()
-    return sabbath_matches > 0.6 and sabbath_matches > app_matches
+    return count_sabbath_total_votes(existing, sabbath_total, app_total).prefers_sabbath
+
+
+def partition_codes(df: pd.DataFrame) -> tuple[np.ndarray, list[Optional[tuple]]]:
+    """
+    Assign each row to the partition derive_metrics works within:
+    ("church_id", id) where the church is known, else ("source_file", name),
+    else None.  Codes follow the sorted keys (churches, then files, then None),
+    so any subset of the rows orders its partitions the same way.
+    """
+    if "church_id" in df.columns:
+        church_codes, church_ids = pd.factorize(pd.to_numeric(df["church_id"], errors="coerce"), sort=True)
+    else:
+        church_codes, church_ids = np.full(len(df), -1), pd.Index([])
+    if "source_file" in df.columns:
+        file_codes, files = pd.factorize(df["source_file"].where(church_codes < 0), sort=True)
+    else:
+        file_codes, files = np.full(len(df), -1), pd.Index([])
+    codes = np.where(
+        church_codes >= 0,
+        church_codes,
+        np.where(file_codes >= 0, len(church_ids) + file_codes, len(church_ids) + len(files)),
+    )
+    keys = [("church_id", value) for value in church_ids.tolist()]
+    keys += [("source_file", value) for value in files.tolist()]
+    return codes, keys + [None]
+
+
+def _partition_votes(existing: np.ndarray, sabbath_total: np.ndarray, app_total: np.ndarray,
+                     codes: np.ndarray, keys: Sequence[Optional[tuple]]) -> dict[Optional[tuple], SabbathTotalVotes]:
+    """count_sabbath_total_votes per partition, for partitions with comparable rows."""
+    comparable = ~(np.isnan(existing) | np.isnan(sabbath_total) | np.isnan(app_total))
+    codes = codes[comparable]
+    existing = existing[comparable]
+    counts = [
+        np.bincount(codes, minlength=len(keys)),
+        np.bincount(codes[np.isclose(existing, sabbath_total[comparable], rtol=0.01, atol=1)], minlength=len(keys)),
+        np.bincount(codes[np.isclose(existing, app_total[comparable], rtol=0.01, atol=1)], minlength=len(keys)),
+    ]
+    return {
+        keys[code]: SabbathTotalVotes(int(counts[0][code]), int(counts[1][code]), int(counts[2][code]))
+        for code in np.flatnonzero(counts[0])
+    }
+
+
+def _integer_dtype(dtype) -> bool:
+    return pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _row_sum(parts: Sequence[np.ndarray]) -> np.ndarray:
+    """Row-wise sum that skips NaN and is NaN where every part is, like ``sum(axis=1, min_count=1)``."""
+    total = np.zeros(len(parts[0]))
+    seen = np.zeros(len(parts[0]), dtype=bool)
+    for values in parts:
+        present = ~np.isnan(values)
+        total += np.where(present, values, 0.0)
+        seen |= present
+    total[~seen] = np.nan
+    return total
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divide element-wise, treating zero denominators as missing."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return numerator / np.where(denominator == 0, np.nan, denominator)
 
 
-def derive_metrics(df: pd.DataFrame) -> pd.DataFrame:
-    """Add app-style totals plus analysis-only helper columns."""
-    df = df.copy()
+def _small_codes(codes: np.ndarray) -> np.ndarray:
+    """Narrow non-negative codes to int16 when they fit, where NumPy's stable argsort is a radix sort."""
+    return codes.astype("int16") if codes.max(initial=0) < 2 ** 15 else codes
 
-    for column in APP_WEEKLY_COLUMNS:
-        if column not in df.columns:
-            df[column] = np.nan
 
+def _derive_order(df: pd.DataFrame, codes: np.ndarray) -> np.ndarray:
+    """Row order by week_start_date (missing last), then partition code, then input position."""
+    week_codes, weeks = pd.factorize(df["week_start_date"], sort=True)
+    week_codes[week_codes < 0] = len(weeks)
+    order = np.argsort(_small_codes(codes), kind="stable")
+    return order[np.argsort(_small_codes(week_codes)[order], kind="stable")]
+
+
+def _previous_in_partition(codes: np.ndarray) -> np.ndarray:
+    """For rows already in date order, the position of the previous row with the same code (-1 if none)."""
+    grouped = np.argsort(_small_codes(codes), kind="stable")
+    previous = np.full(len(codes), -1)
+    same = codes[grouped[1:]] == codes[grouped[:-1]]
+    previous[grouped[1:][same]] = grouped[:-1][same]
+    return previous
+
+
+def _growth(values: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """``pct_change(fill_method=None) * 100`` against each row's previous row."""
+    growth = np.full(len(values), np.nan)
+    has_previous = previous >= 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth[has_previous] = (values[has_previous] / values[previous[has_previous]] - 1) * 100
+    return growth
+
+
+def _sorted_for_derive(df: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray, list[Optional[tuple]]]:
+    """
+    Coerce the numeric columns and sort rows into derive order; returns the
+    frame, codes and keys.  Rows already in derive order are not copied.
+    """
+    df = df.copy(deep=False)
+    df.index = pd.RangeIndex(len(df))
     for column in NUMERIC_COLUMNS.intersection(df.columns):
-        df[column] = pd.to_numeric(df[column], errors="coerce")
+        if not pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+    codes, keys = partition_codes(df)
+    order = _derive_order(df, codes)
+    if np.array_equal(order, np.arange(len(order))):
+        return df, codes, keys
+    df = df.take(order)
+    df.index = pd.RangeIndex(len(df))
+    return df, codes[order], keys
+
+
+def _lazy_closure(columns: Optional[Iterable[str]]) -> list[str]:
+    """
+    The LAZY_DERIVED_COLUMNS needed to provide columns (all of them for None),
+    including the lazy columns those read, in evaluation order.
+    """
+    if columns is None:
+        return list(LAZY_DERIVED_COLUMNS)
+    needed: set[str] = set()
+    stack = [column for column in columns if column in LAZY_DERIVED_COLUMNS]
+    while stack:
+        name = stack.pop()
+        if name not in needed:
+            needed.add(name)
+            stack.extend(column for column in LAZY_DERIVED_COLUMNS[name][1] if column in LAZY_DERIVED_COLUMNS)
+    return [name for name in LAZY_DERIVED_COLUMNS if name in needed]
+
+
+def _lazy_column(name: str, value: Callable[[str], np.ndarray], integer: Callable[[str], bool],
+                 previous: Optional[np.ndarray]) -> np.ndarray:
+    """
+    One LAZY_DERIVED_COLUMNS column.  value(column) returns a column as float64
+    with NaN for missing values and integer(column) whether it is int64;
+    previous is _previous_in_partition's result, used for growth columns.
+    """
+    kind, inputs = LAZY_DERIVED_COLUMNS[name]
+    if kind == "growth":
+        return _growth(value(inputs[0]), previous)
+    if kind == "ratio":
+        return _divide(value(inputs[0]), value(inputs[1]))
+    if kind == "percent":
+        return _divide(value(inputs[0]), value(inputs[1])) * 100
+    if kind == "pair":
+        data = sum(np.where(np.isnan(part), 0.0, part) for part in map(value, inputs))
+    else:
+        data = _row_sum([value(column) for column in inputs])
+    return data.astype("int64") if all(integer(column) for column in inputs) else data
+
 
-    df["sabbath_attendance"] = sum_existing(df, SABBATH_ATTENDANCE_PARTS)
-    computed_total_attendance = sum_existing(df, ATTENDANCE_PARTS)
+def _derived_columns(df: pd.DataFrame, codes: np.ndarray, keys: Sequence[Optional[tuple]],
+                     sabbath_votes: Optional[Mapping[Optional[tuple], SabbathTotalVotes]] = None,
+                     lazy: Sequence[str] = tuple(LAZY_DERIVED_COLUMNS),
+                     ) -> tuple[dict[str, pd.Series], list[str], np.ndarray, dict[Optional[tuple], SabbathTotalVotes]]:
+    """
+    The single-pass kernel behind derive_metrics, for rows already in derive
+    order.  Returns the total/sum columns, the names and values (one 2-D
+    array) of the rate, percentage and growth columns, and the rows' Sabbath
+    total votes per partition.  Of the LAZY_DERIVED_COLUMNS only those in lazy
+    are computed.
+    """
+    def column(name: str) -> pd.Series:
+        if name in df.columns:
+            return df[name]
+        return pd.Series(np.nan, index=df.index, dtype="float64")
 
-    if "total_attendance" in df.columns and df["total_attendance"].notna().any():
-        df["source_total_attendance"] = df["total_attendance"]
-        if looks_like_sabbath_total(df["total_attendance"], df["sabbath_attendance"], computed_total_attendance):
-            df["total_attendance"] = computed_total_attendance.combine_first(df["total_attendance"])
+    values = {name: column(name).to_numpy(dtype="float64", na_value=np.nan) for name in DERIVE_INPUT_COLUMNS}
+    integer = {name: _integer_dtype(column(name).dtype) for name in DERIVE_INPUT_COLUMNS}
+
+    def result(data: np.ndarray, is_integer: bool) -> pd.Series:
+        return pd.Series(data.astype("int64") if is_integer else data, index=df.index)
+
+    def summed(parts: Sequence[str]) -> pd.Series:
+        return result(_row_sum([values[name] for name in parts]), all(integer[name] for name in parts))
+
+    def filled_pair(left: str, right: str) -> pd.Series:
+        data = np.where(np.isnan(values[left]), 0.0, values[left]) + np.where(np.isnan(values[right]), 0.0, values[right])
+        return result(data, integer[left] and integer[right])
+
+    derived: dict[str, pd.Series] = {}
+
+    def derived_value(name: str) -> np.ndarray:
+        if name in derived:
+            return derived[name].to_numpy(dtype="float64", na_value=np.nan)
+        return values[name]
+
+    def derived_integer(name: str) -> bool:
+        return _integer_dtype(derived[name].dtype) if name in derived else integer[name]
+
+    derived["sabbath_attendance"] = summed(SABBATH_ATTENDANCE_PARTS)
+    computed_total_attendance = summed(ATTENDANCE_PARTS)
+
+    existing_total = column("total_attendance")
+    votes: dict[Optional[tuple], SabbathTotalVotes] = {}
+    if not np.isnan(values["total_attendance"]).all():
+        derived["source_total_attendance"] = existing_total
+        votes = _partition_votes(values["total_attendance"], derived["sabbath_attendance"].to_numpy(dtype="float64"),
+                                 computed_total_attendance.to_numpy(dtype="float64"), codes, keys)
+        prior = sabbath_votes or {}
+        prefers_sabbath = np.array([
+            (votes.get(key, SabbathTotalVotes()) + prior.get(key, SabbathTotalVotes())).prefers_sabbath
+            for key in keys
+        ])[codes]
+        if prefers_sabbath.all():
+            derived["total_attendance"] = computed_total_attendance.combine_first(existing_total)
+        elif not prefers_sabbath.any():
+            derived["total_attendance"] = existing_total.combine_first(computed_total_attendance)
         else:
-            df["total_attendance"] = df["total_attendance"].combine_first(computed_total_attendance)
+            derived["total_attendance"] = computed_total_attendance.combine_first(existing_total).where(
+                prefers_sabbath, existing_total.combine_first(computed_total_attendance))
     else:
-        df["total_attendance"] = computed_total_attendance
+        derived["total_attendance"] = computed_total_attendance
 
-    df["total_with_home_church"] = computed_total_attendance
-    if "adult_attendance" in df.columns:
-        existing_adult = pd.to_numeric(df["adult_attendance"], errors="coerce")
-    else:
-        existing_adult = pd.Series(np.nan, index=df.index, dtype="float64")
-    derived_adult = ensure_numeric_column(df, "men").fillna(0) + ensure_numeric_column(df, "women").fillna(0)
-    df["adult_attendance"] = existing_adult.combine_first(derived_adult)
-    df["young_attendance"] = ensure_numeric_column(df, "youth").fillna(0) + ensure_numeric_column(df, "children").fillna(0)
-
-    df["core_income"] = sum_existing(df, CORE_INCOME_PARTS)
-    df["regular_income"] = ensure_numeric_column(df, "tithe").fillna(0) + ensure_numeric_column(df, "offerings").fillna(0)
-    df["special_collections"] = (
-        ensure_numeric_column(df, "emergency_collection").fillna(0)
-        + ensure_numeric_column(df, "planned_collection").fillna(0)
-    )
+    derived["total_with_home_church"] = computed_total_attendance
+    derived["adult_attendance"] = column("adult_attendance").combine_first(filled_pair("men", "women"))
+
+    rate_names = []
+    for name in lazy:
+        if LAZY_DERIVED_COLUMNS[name][0] in ("pair", "sum"):
+            derived[name] = pd.Series(_lazy_column(name, derived_value, derived_integer, None), index=df.index)
+        else:
+            rate_names.append(name)
 
-    computed_total_income = sum_existing(df, INCOME_PARTS)
-    if "total_income" in df.columns and df["total_income"].notna().any():
-        df["source_total_income"] = df["total_income"]
+    computed_total_income = summed(INCOME_PARTS)
+    if not np.isnan(values["total_income"]).all():
+        derived["source_total_income"] = column("total_income")
         # The app derives totalIncome from its component fields, including the
         # newer optional giving streams when present.
-        df["total_income"] = computed_total_income.combine_first(df["total_income"])
+        derived["total_income"] = computed_total_income.combine_first(column("total_income"))
     else:
-        df["total_income"] = computed_total_income
-
-    df["income_per_attendee"] = safe_divide(df["total_income"], df["total_attendance"])
-    df["tithe_per_attendee"] = safe_divide(df["tithe"], df["total_attendance"])
-    df["offerings_per_attendee"] = safe_divide(df["offerings"], df["total_attendance"])
-    df["regular_income_per_adult"] = safe_divide(df["regular_income"], df["adult_attendance"])
-
-    pct_denominator = df["sabbath_attendance"].replace(0, np.nan)
-    for source, target in [
-        ("men", "men_pct"),
-        ("women", "women_pct"),
-        ("youth", "youth_pct"),
-        ("children", "children_pct"),
-    ]:
-        df[target] = safe_divide(df[source], pct_denominator) * 100
-
-    if "sunday_home_church" in df.columns:
-        df["home_church_pct"] = safe_divide(df["sunday_home_church"], df["total_attendance"]) * 100
-
-    df = df.sort_values("week_start_date", na_position="last").reset_index(drop=True)
-    df["attendance_growth"] = df["total_attendance"].pct_change(fill_method=None) * 100
-    df["income_growth"] = df["total_income"].pct_change(fill_method=None) * 100
-    df["tithe_growth"] = df["tithe"].pct_change(fill_method=None) * 100
-    df["men_women_ratio"] = safe_divide(df["men"], df["women"])
-    df["adult_young_ratio"] = safe_divide(df["adult_attendance"], df["young_attendance"])
-    df["tithe_offerings_ratio"] = safe_divide(df["tithe"], df["offerings"])
+        derived["total_income"] = computed_total_income
 
+    growth = any(LAZY_DERIVED_COLUMNS[name][0] == "growth" for name in rate_names)
+    previous = _previous_in_partition(codes) if growth else None
+    rates = np.empty((len(rate_names), len(df)))
+    for row, name in enumerate(rate_names):
+        rates[row] = _lazy_column(name, derived_value, derived_integer, previous)
+    return derived, rate_names, rates, votes
+
+
+def _attach_derived(df: pd.DataFrame, derived: dict[str, pd.Series], rate_names: list[str], rates: np.ndarray,
+                    votes: dict[Optional[tuple], SabbathTotalVotes]) -> pd.DataFrame:
+    """
+    Replace derived columns df already has and append the rest (plus missing
+    app columns) as one block.  LAZY_DERIVED_COLUMNS left out are recorded
+    as pending in attrs for ensure_derived.
+    """
+    missing = [column for column in APP_WEEKLY_COLUMNS if column not in df.columns]
+    derived = dict(derived)
+    for name in [name for name in derived if name in df.columns]:
+        df[name] = derived.pop(name)
+    new_rates = []
+    for row, name in enumerate(rate_names):
+        if name in df.columns:
+            df[name] = rates[row]
+        else:
+            new_rates.append(row)
+    block = {name: pd.Series(np.nan, index=df.index, dtype="float64") for name in missing}
+    block.update(derived)
+    rate_frame = pd.DataFrame(rates[new_rates].T, index=df.index,
+                              columns=[rate_names[row] for row in new_rates], copy=False)
+    df = pd.concat([df, *(series.rename(name, **NO_COPY) for name, series in block.items()), rate_frame],
+                   axis=1, **NO_COPY)
+    df.attrs[SABBATH_VOTES_ATTR] = (len(df), {key: astuple(count) for key, count in votes.items()})
+    pending = [name for name in LAZY_DERIVED_COLUMNS if name not in df.columns]
+    if pending:
+        df.attrs[LAZY_ATTR] = {"pending": pending, "gaps": ()}
     return df
 
 
-def prepare_dataframe(df: pd.DataFrame, source_file: str, source_sheet: Optional[str], force_year: Optional[int]) -> pd.DataFrame:
-    df = df.dropna(axis=0, how="all").dropna(axis=1, how="all")
+def _derive_in_pool(df: pd.DataFrame, codes: np.ndarray, keys: list[Optional[tuple]],
+                    sabbath_votes: Optional[Mapping[Optional[tuple], SabbathTotalVotes]], jobs: int,
+                    lazy: Sequence[str]) -> pd.DataFrame:
+    """
+    derive_metrics with whole partitions spread over a process pool, balanced
+    by row count.  Workers receive only the input columns of their rows, in
+    derive order, and send back only the derived columns, which are scattered
+    into place.
+    """
+    sizes = np.bincount(codes, minlength=len(keys))
+    group_of_code = np.minimum((np.cumsum(sizes) - sizes) * jobs // len(df), jobs - 1)
+    group_of_row = group_of_code[codes]
+    inputs = [column for column in DERIVE_INPUT_COLUMNS if column in df.columns]
+    groups = [np.flatnonzero(group_of_row == group) for group in range(jobs)]
+    groups = [rows for rows in groups if rows.size]
+    with ProcessPoolExecutor(max_workers=len(groups)) as pool:
+        futures = [
+            pool.submit(_derived_columns, df[inputs].take(rows).reset_index(drop=True), codes[rows], keys,
+                        sabbath_votes, lazy)
+            for rows in groups
+        ]
+        parts = [future.result() for future in futures]
+
+    derived: dict[str, pd.Series] = {}
+    for name in dict.fromkeys(name for part, _, _, _ in parts for name in part):
+        pieces = [part.get(name) for part, _, _, _ in parts]
+        integer = all(piece is not None and _integer_dtype(piece.dtype) for piece in pieces)
+        values = np.empty(len(df), dtype="int64" if integer else "float64")
+        for rows, piece in zip(groups, pieces):
+            if piece is None:
+                values[rows] = np.nan
+            else:
+                # Integer pieces have no missing values (and pandas 2 rejects a NaN na_value for them).
+                values[rows] = piece.to_numpy(dtype=values.dtype) if integer else piece.to_numpy(
+                    dtype=values.dtype, na_value=np.nan)
+        derived[name] = pd.Series(values, index=df.index)
+    rate_names = parts[0][1]
+    rates = np.empty((len(rate_names), len(df)))
+    votes: dict[Optional[tuple], SabbathTotalVotes] = {}
+    for rows, (_, _, part_rates, part_votes) in zip(groups, parts):
+        rates[:, rows] = part_rates
+        votes.update(part_votes)
+    return _attach_derived(df, derived, rate_names, rates, votes)
+
+
+def derive_metrics(df: pd.DataFrame, sabbath_votes: Optional[Mapping[Optional[tuple], SabbathTotalVotes]] = None,
+                   jobs: int = 1, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Add app-style totals plus analysis-only helper columns.
+
+    Rows are partitioned by partition_codes (church_id, or source_file where
+    the church is unknown).  Growth compares each week with the same
+    partition's previous week, and the looks_like_sabbath_total decision is
+    made per partition.  The result is ordered by week_start_date, then
+    partition, then input order, with a fresh RangeIndex.
+
+    The component columns are pulled into float64 arrays once and every
+    derived column is computed on them in a single pass; the new columns are
+    attached as one block.  Totals stay int64 where the pandas
+    column-at-a-time formulation kept them int64.
+
+    With jobs > 1, frames of at least DERIVE_POOL_MIN_ROWS rows and more than
+    one partition are derived in a process pool (see _derive_in_pool).
+    sabbath_votes are earlier vote counts per partition that are added to
+    these rows' own (append_metrics passes the history's); the rows' own
+    counts are kept in ``attrs``.
+
+    columns names the derived columns the caller will read; of the
+    LAZY_DERIVED_COLUMNS only those (and what they read) are computed, plus
+    any df already has.  The rest can be added later with ensure_derived.
+    None computes everything.
+    """
+    df, codes, keys = _sorted_for_derive(df)
+    lazy = _lazy_closure(None if columns is None else [*columns, *df.columns])
+    if jobs > 1 and len(df) >= DERIVE_POOL_MIN_ROWS and len(np.unique(codes)) > 1:
+        return _derive_in_pool(df, codes, keys, sabbath_votes, jobs, lazy)
+    return _attach_derived(df, *_derived_columns(df, codes, keys, sabbath_votes, lazy))
+
+
+def _derived_position(columns: Sequence[object], name: str) -> int:
+    """
+    Where derive_metrics would have placed the DERIVED_ONLY_COLUMNS entry name
+    among columns: within their trailing run of derived-only columns, in
+    DERIVED_ONLY_COLUMNS order.
+    """
+    rank = DERIVED_ONLY_COLUMNS.index(name)
+    position = len(columns)
+    while (position and columns[position - 1] in DERIVED_ONLY_COLUMNS
+           and DERIVED_ONLY_COLUMNS.index(columns[position - 1]) > rank):
+        position -= 1
+    return position
+
+
+def ensure_derived(df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Compute, in place, the LAZY_DERIVED_COLUMNS among columns (every pending
+    one for None) that derive_metrics left out, plus the lazy columns they
+    read, and return df.  Columns are inserted where a full derive_metrics
+    would have put them, so later calls only pay for what is still missing.
+
+    df must still be in derive order.  Rows dropped since derive_metrics are
+    covered by the "gaps" load_data records: growth after a dropped row stays
+    NaN, as it was before the drop.  A compact_frame frame is read through its
+    original dtypes, and its column record is kept in step.
+    """
+    record = df.attrs.get(LAZY_ATTR)
+    if not record:
+        return df
+    needed = [name for name in _lazy_closure(columns) if name in record["pending"]]
+    if not needed:
+        return df
+    compact = df.attrs.get(COMPACT_ATTR)
+    dtypes = compact["dtypes"] if compact else {}
+
+    def value(name: str) -> np.ndarray:
+        if name in df.columns:
+            return df[name].to_numpy(dtype="float64", na_value=np.nan)
+        return np.full(len(df), np.nan)
+
+    def integer(name: str) -> bool:
+        return name in df.columns and _integer_dtype(dtypes.get(name, df[name].dtype))
+
+    previous = None
+    if any(LAZY_DERIVED_COLUMNS[name][0] == "growth" for name in needed):
+        previous = _previous_in_partition(partition_codes(df)[0])
+        previous[list(record["gaps"])] = -1
+    for name in needed:
+        df.insert(_derived_position(df.columns, name), name, _lazy_column(name, value, integer, previous))
+        if compact:
+            order = list(compact["columns"])
+            order.insert(_derived_position(order, name), name)
+            compact = {**compact, "columns": order}
+            df.attrs[COMPACT_ATTR] = compact
+    pending = [name for name in record["pending"] if name not in needed]
+    if pending:
+        df.attrs[LAZY_ATTR] = {**record, "pending": pending}
+    else:
+        del df.attrs[LAZY_ATTR]
+    return df
+
+
+def _growth_gaps(df: pd.DataFrame, kept: np.ndarray, gaps: Sequence[int]) -> tuple[int, ...]:
+    """
+    The growth gaps of df's kept rows, as positions among them: rows whose
+    previous row in their partition is not kept, plus the kept ones of gaps.
+    """
+    previous = _previous_in_partition(partition_codes(df)[0])
+    lost = kept & (previous >= 0) & ~kept[previous]
+    lost[list(gaps)] = True
+    return tuple(np.flatnonzero(lost[kept]).tolist())
+
+
+def _sabbath_votes(derived: pd.DataFrame) -> dict[Optional[tuple], SabbathTotalVotes]:
+    """Votes per partition recorded by derive_metrics, recounted when the frame has changed size since."""
+    recorded = derived.attrs.get(SABBATH_VOTES_ATTR)
+    if recorded is not None and recorded[0] == len(derived):
+        return {key: SabbathTotalVotes(*counts) for key, counts in recorded[1].items()}
+    if "source_total_attendance" not in derived.columns:
+        return {}
+    codes, keys = partition_codes(derived)
+    return _partition_votes(*(derived[column].to_numpy(dtype="float64", na_value=np.nan) for column in (
+        "source_total_attendance", "sabbath_attendance", "total_with_home_church")), codes, keys)
+
+
+def _derive_inputs(derived: pd.DataFrame) -> pd.DataFrame:
+    """Recover derive_metrics input from its output (source totals restored, helper columns dropped)."""
+    raw = derived.drop(columns=[column for column in DERIVED_ONLY_COLUMNS if column in derived.columns])
+    for total in ("total_attendance", "total_income"):
+        source = f"source_{total}"
+        raw[total] = derived[source] if source in derived.columns else np.nan
+    raw.attrs = {}
+    return raw
+
+
+def _partition_neighbour(church: np.ndarray, files: Optional[np.ndarray], position: int,
+                         key: Optional[tuple], step: int) -> int:
+    """
+    Nearest row before (step=-1) or after (step=1) position that belongs to
+    key's partition, or -1.  Scans outward in doubling windows, so a match a
+    few weeks away costs a few small comparisons rather than a full column.
+    """
+    window = PARTITION_SCAN_ROWS
+    start, stop = position, position + 1
+    while True:
+        low, high = (max(start - window, 0), start) if step < 0 else (stop, min(stop + window, len(church)))
+        if low >= high:
+            return -1
+        church_part = church[low:high]
+        if key is not None and key[0] == "church_id":
+            hits = church_part == key[1]
+        else:
+            hits = pd.isna(church_part)
+            if files is not None:
+                hits &= pd.isna(files[low:high]) if key is None else files[low:high] == key[1]
+        found = np.flatnonzero(hits)
+        if found.size:
+            return low + int(found[-1] if step < 0 else found[0])
+        start, stop = low, high
+        window *= 2
+
+
+def append_metrics(derived: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Extend a derive_metrics() frame with raw rows for new weeks.
+
+    Only the new rows are derived, using each partition's vote counts from the
+    history, and merged into place by week_start_date (after history rows of
+    the same week).  Growth is then recomputed just for the new rows and the
+    next row of their partition.  If a partition's Sabbath-total decision
+    flips once the new rows' votes are added, the whole frame is derived
+    again.  The result equals derive_metrics() over the history's input plus
+    new_rows, except that rows sharing a week_start_date may be ordered
+    differently.  LAZY_DERIVED_COLUMNS still pending in the history stay
+    pending.
+    """
+    if new_rows.empty:
+        return derived
+    if derived.empty:
+        return derive_metrics(new_rows)
+
+    lazy = derived.attrs.get(LAZY_ATTR)
+    computed = [name for name in LAZY_DERIVED_COLUMNS if not lazy or name not in lazy["pending"]]
+    history_votes = _sabbath_votes(derived)
+    fresh = derive_metrics(new_rows, sabbath_votes=history_votes, columns=computed)
+    flipped = any(
+        (history_votes.get(key, SabbathTotalVotes()) + votes).prefers_sabbath
+        != history_votes.get(key, SabbathTotalVotes()).prefers_sabbath
+        for key, votes in _sabbath_votes(fresh).items()
+    )
+    dates = derived["week_start_date"].to_numpy()
+    new_dates = fresh["week_start_date"].to_numpy()
+    if flipped or not np.issubdtype(dates.dtype, np.datetime64) or not np.issubdtype(new_dates.dtype, np.datetime64):
+        return derive_metrics(pd.concat([_derive_inputs(derived), new_rows], ignore_index=True, sort=False),
+                              columns=computed)
+
+    votes = dict(history_votes)
+    for key, counts in _sabbath_votes(fresh).items():
+        votes[key] = votes.get(key, SabbathTotalVotes()) + counts
+    fresh_codes, fresh_keys = partition_codes(fresh)
+    history_rows, total_rows = len(derived), len(derived) + len(fresh)
+    placed = np.searchsorted(dates, new_dates.astype(dates.dtype), side="right") + np.arange(len(fresh))
+    merged = pd.concat([derived, fresh], ignore_index=True, sort=False)
+    if placed[0] != history_rows:
+        order = np.empty(total_rows, dtype="int64")
+        is_new = np.zeros(total_rows, dtype=bool)
+        is_new[placed] = True
+        order[placed] = np.arange(history_rows, total_rows)
+        order[~is_new] = np.arange(history_rows)
+        merged = merged.take(order).reset_index(drop=True)
+
+    church = merged["church_id"].to_numpy() if "church_id" in merged.columns else np.full(total_rows, np.nan)
+    files = merged["source_file"].to_numpy() if "source_file" in merged.columns else None
+    dirty: dict[int, Optional[tuple]] = {}
+    for position, code in zip(placed.tolist(), fresh_codes.tolist()):
+        key = fresh_keys[code]
+        dirty[position] = key
+        following = _partition_neighbour(church, files, position, key, 1)
+        if following >= 0:
+            dirty[following] = key
+    positions = np.array(sorted(dirty))
+    previous = np.array([_partition_neighbour(church, files, position, dirty[position], -1) for position in positions])
+    for source, target in GROWTH_COLUMNS.items():
+        if target not in merged.columns:
+            continue
+        values = merged[source].to_numpy()
+        growth = np.full(len(positions), np.nan)
+        has_previous = previous >= 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth[has_previous] = (values[positions[has_previous]].astype("float64")
+                                    / values[previous[has_previous]].astype("float64") - 1) * 100
+        merged.iloc[positions, merged.columns.get_loc(target)] = growth
+    merged.attrs[SABBATH_VOTES_ATTR] = (total_rows, {key: astuple(count) for key, count in votes.items()})
+    if lazy:
+        merged.attrs[LAZY_ATTR] = {"pending": lazy["pending"], "gaps": ()}
+    else:
+        merged.attrs.pop(LAZY_ATTR, None)
+    return merged
+
+
+def drop_empty(df: pd.DataFrame) -> pd.DataFrame:
+    """df without its all-empty rows and columns; df itself, uncopied, when it has none."""
+    present = df.notna()
+    rows = present.any(axis=1).to_numpy()
+    columns = present.any(axis=0).to_numpy()
+    if rows.all() and columns.all():
+        return df
+    return df.iloc[np.flatnonzero(rows), np.flatnonzero(columns)]
+
+
+def prepare_dataframe(df: pd.DataFrame, source_file: str, source_sheet: Optional[str], force_year: Optional[int],
+                      signature: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Normalize one raw sheet or CSV frame.  Each step replaces whole columns of
+    a frame this function owns, so the data is copied only where values change
+    (or empty rows go).  Every row kept gets a source_file, so no row can turn
+    all-empty after the first pass.
+    """
+    with MEMORY.stage("drop empty"):
+        df = drop_empty(df)
     if df.empty:
         return df
 
-    df = canonicalize_columns(df)
-    if IGNORED_COLUMNS.intersection(df.columns):
-        df = df.drop(columns=[column for column in IGNORED_COLUMNS if column in df.columns])
-    df = coerce_numeric_columns(df)
+    with MEMORY.stage("canonicalize"):
+        df = canonicalize_columns(df)
+        for column in IGNORED_COLUMNS.intersection(df.columns):
+            del df[column]
+    with MEMORY.stage("coerce numeric"):
+        df = coerce_numeric_columns(df)
 
     if "week_start_date" in df.columns:
-        df["week_start_date"] = parse_date_series(df["week_start_date"], force_year)
+        format_key = None if signature is None else (*signature, source_sheet, "week_start_date")
+        with MEMORY.stage("parse dates"):
+            df["week_start_date"] = parse_date_series(df["week_start_date"], force_year, format_key)
     else:
         df["week_start_date"] = pd.NaT
 
@@ -533,80 +1545,645 @@ def prepare_dataframe(df: pd.DataFrame, source_file: str, source_sheet: Optional
             df["source_sheet"] = df["source_sheet"].combine_first(pd.Series(source_sheet, index=df.index))
         else:
             df["source_sheet"] = source_sheet
+    return df
 
-    return df.dropna(axis=0, how="all")
 
+def file_signature(path: Path) -> tuple[str, int, int]:
+    """(resolved path, size, mtime) — changes whenever the file's content may have."""
+    stat = path.stat()
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns
 
-def read_csv_file(path: Path, force_year: Optional[int]) -> list[pd.DataFrame]:
-    df = pd.read_csv(path)
-    return [prepare_dataframe(df, path.name, None, force_year)]
 
+def read_csv_file(path: Path, force_year: Optional[int], chunk_rows: int = 0,
+                  keep_unknown_columns: bool = False) -> list[pd.DataFrame]:
+    """
+    Read a CSV whole, or with chunk_rows > 0 stream it chunk_rows rows at a
+    time.  Only known columns (see KNOWN_COLUMNS) are parsed unless
+    keep_unknown_columns is set; streaming always parses known columns only
+    and prepares each chunk on its own, so memory follows the chunk size
+    rather than the file size.
+    """
+    unknown: list[str] = []
+
+    def wanted(name: object) -> bool:
+        if is_known_column(name):
+            return True
+        if canonical_column_name(name) not in IGNORED_COLUMNS:
+            unknown.append(str(name))
+        return False
+
+    signature = file_signature(path)
+    if chunk_rows <= 0:
+        with MEMORY.stage("read"):
+            df = pd.read_csv(path, usecols=None if keep_unknown_columns else wanted)
+        log_unknown_columns(path, unknown)
+        return [prepare_dataframe(df, path.name, None, force_year, signature)]
 
-def read_excel_file(path: Path, force_year: Optional[int]) -> list[pd.DataFrame]:
     frames: list[pd.DataFrame] = []
-    xls = pd.ExcelFile(path)
-    for sheet in xls.sheet_names:
-        raw = pd.read_excel(xls, sheet_name=sheet, header=None)
-        raw = raw.dropna(axis=0, how="all").dropna(axis=1, how="all")
-        if raw.empty:
-            continue
+    with pd.read_csv(path, chunksize=chunk_rows, usecols=wanted) as reader:
+        while True:
+            with MEMORY.stage("read"):
+                chunk = next(reader, None)
+            if chunk is None:
+                break
+            prepared = prepare_dataframe(chunk, path.name, None, force_year, signature)
+            if not prepared.empty:
+                frames.append(prepared)
+    log_unknown_columns(path, unknown)
+    return frames
+
+
+# Cell text pandas' Excel reader treats as missing, plus openpyxl's error codes.
+EXCEL_NA_STRINGS = {
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    "#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!",
+}
+
+
+def _excel_cell(value: object) -> object:
+    """Convert one openpyxl cell value the way pd.read_excel would."""
+    if value is None or (isinstance(value, str) and value in EXCEL_NA_STRINGS):
+        return np.nan
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _trim_row(row: list[object]) -> list[object]:
+    while row and pd.isna(row[-1]):
+        row.pop()
+    return row
+
+
+def _openpyxl_sheet_rows(sheet) -> Iterable[list[object]]:
+    """Stream converted rows from a read-only worksheet, trailing blanks trimmed."""
+    sheet.reset_dimensions()
+    for values in sheet.iter_rows(values_only=True):
+        yield _trim_row([_excel_cell(value) for value in values])
 
-        header_idx = detect_header_row(raw)
+
+def _unnamed_columns(header: list[object]) -> list[object]:
+    """Name and de-duplicate header cells like pd.read_excel(header=0)."""
+    names: list[object] = []
+    counts: dict[object, int] = {}
+    for position, value in enumerate(header):
+        name = f"Unnamed: {position}" if pd.isna(value) else value
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        names.append(name)
+        counts[name] = count + 1
+    return names
+
+
+def _object_frame(rows: list[list[object]], width: int, index: Optional[list[int]] = None) -> pd.DataFrame:
+    data = [row + [np.nan] * (width - len(row)) for row in rows]
+    return pd.DataFrame(data, index=index, columns=range(width), dtype=object)
+
+
+def frame_from_sheet_rows(rows: Iterable[list[object]], scan_rows: int = 30,
+                          unknown: Optional[list[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Build one sheet's frame from a single pass over its rows.
+
+    Blank rows are dropped as they stream past, the first scan_rows non-blank
+    rows are scored by detect_header_row, and everything below the winning row
+    becomes the data.  Without a header row the sheet's first row is used, as
+    pd.read_excel(header=0) would.  Index labels are the 0-based sheet row
+    numbers of the data rows.
+
+    When an ``unknown`` list is passed, only columns whose header is a known
+    column are kept: every later row is cut down to those positions as it is
+    read, and the other non-blank header names are appended to the list.
+    """
+    numbered = enumerate(rows)
+    first: list[object] = []
+    kept: list[list[object]] = []
+    labels: list[int] = []
+    for number, row in numbered:
+        if number == 0:
+            first = row
+        if row:
+            kept.append(row)
+            labels.append(number)
+            if len(kept) == scan_rows:
+                break
+    if not kept:
+        return None
+
+    header_idx = detect_header_row(kept, scan_rows)
+    if header_idx is None:
+        header, names = first, _unnamed_columns(first)
+    else:
+        header = names = kept[header_idx]
+
+    positions: Optional[list[int]] = None
+    if unknown is not None:
+        positions = [index for index, name in enumerate(names) if is_known_column(name)]
+        unknown.extend(
+            str(header[index]).strip() for index in sorted(set(range(len(header))).difference(positions))
+            if not pd.isna(header[index])
+            and canonical_column_name(header[index]) not in IGNORED_COLUMNS
+        )
+        kept = [[row[index] if index < len(row) else np.nan for index in positions] for row in kept]
+    for number, row in numbered:
+        if row:
+            if positions is not None:
+                row = [row[index] if index < len(row) else np.nan for index in positions]
+            kept.append(row)
+            labels.append(number)
+
+    if positions is None:
+        width = max(len(row) for row in kept)
         if header_idx is None:
-            df = pd.read_excel(xls, sheet_name=sheet)
+            columns = _unnamed_columns(first + [np.nan] * (width - len(first)))
         else:
-            df = raw.iloc[header_idx + 1 :].copy()
-            df.columns = raw.iloc[header_idx].tolist()
+            columns = names + [np.nan] * (width - len(names))
+    else:
+        width = len(positions)
+        columns = [names[index] for index in positions]
+
+    if header_idx is None:
+        start = 1 if labels[0] == 0 else 0
+        body, index = kept[start:], [label - 1 for label in labels[start:]]
+    else:
+        body, index = kept[header_idx + 1 :], labels[header_idx + 1 :]
+    df = _object_frame(body, width, index)
+    if header_idx is None:
+        df = df.infer_objects()
+    else:
+        # pd.read_excel(header=None) infers each column over the whole sheet,
+        # so title and header rows keep most columns object-typed.
+        above = _object_frame(kept[: header_idx + 1], width)
+        for position in range(width):
+            dtype = pd.concat([above[position], df[position]]).infer_objects().dtype
+            if dtype != object:
+                df[position] = df[position].astype(dtype)
+    df.columns = columns
+    return df
+
+
+def _excel_sheet_rows(path: Path) -> Iterable[tuple[str, Iterable[list[object]]]]:
+    """Yield (sheet name, row stream) pairs, reading each sheet exactly once."""
+    if path.suffix.lower() == ".xls":
+        with pd.ExcelFile(path) as xls:
+            for sheet in xls.sheet_names:
+                raw = pd.read_excel(xls, sheet_name=sheet, header=None)
+                yield str(sheet), (_trim_row(row) for row in raw.astype(object).values.tolist())
+        return
 
-        prepared = prepare_dataframe(df, path.name, str(sheet), force_year)
+    from openpyxl import load_workbook
+
+    with path.open("rb") as handle:
+        workbook = load_workbook(handle, read_only=True, data_only=True, keep_links=False)
+        try:
+            for sheet in workbook.worksheets:
+                yield sheet.title, _openpyxl_sheet_rows(sheet)
+        finally:
+            workbook.close()
+
+
+def read_excel_file(path: Path, force_year: Optional[int],
+                    keep_unknown_columns: bool = False) -> list[pd.DataFrame]:
+    frames: list[pd.DataFrame] = []
+    unknown: Optional[list[str]] = None if keep_unknown_columns else []
+    signature = file_signature(path)
+    for sheet, rows in _excel_sheet_rows(path):
+        with MEMORY.stage("read"):
+            df = frame_from_sheet_rows(rows, unknown=unknown)
+        if df is None:
+            continue
+
+        prepared = prepare_dataframe(df, path.name, sheet, force_year, signature)
         if not prepared.empty:
             frames.append(prepared)
+    log_unknown_columns(path, unknown or [])
     return frames
 
 
 def resolve_input_paths(inputs: Sequence[str]) -> list[Path]:
-    paths: list[Path] = []
-    for value in inputs:
-        path = Path(value).expanduser()
-        if not path.is_absolute() and not path.exists():
-            path = SCRIPT_DIR / path
-        if path.is_dir():
-            for suffix in SUPPORTED_SUFFIXES:
-                paths.extend(sorted(path.glob(f"*{suffix}")))
-        elif path.exists():
-            paths.append(path)
-        else:
-            log(f"Warning: input path does not exist: {path}")
+    with TIMINGS.span("resolve inputs"):
+        paths: list[Path] = []
+        for value in inputs:
+            path = Path(value).expanduser()
+            if not path.is_absolute() and not path.exists():
+                path = SCRIPT_DIR / path
+            if path.is_dir():
+                for suffix in sorted(SUPPORTED_SUFFIXES):
+                    paths.extend(sorted(path.glob(f"*{suffix}")))
+            elif path.exists():
+                paths.append(path)
+            else:
+                log(f"Warning: input path does not exist: {path}")
 
-    unique_paths: list[Path] = []
-    seen: set[Path] = set()
-    for path in paths:
-        resolved = path.resolve()
-        if resolved not in seen and path.suffix.lower() in SUPPORTED_SUFFIXES:
-            unique_paths.append(path)
-            seen.add(resolved)
-    return unique_paths
+        unique_paths: list[Path] = []
+        seen: set[Path] = set()
+        for path in paths:
+            resolved = path.resolve()
+            if resolved not in seen and path.suffix.lower() in SUPPORTED_SUFFIXES:
+                unique_paths.append(path)
+                seen.add(resolved)
+        return unique_paths
 
 
-def load_data(paths: Sequence[Path], force_year: Optional[int]) -> pd.DataFrame:
-    frames: list[pd.DataFrame] = []
-    for path in paths:
-        suffix = path.suffix.lower()
+@dataclass(frozen=True)
+class ReadOptions:
+    """Reader settings that change prepared output, and so the cache key."""
+    force_year: Optional[int] = None
+    chunk_rows: int = 0
+    keep_unknown_columns: bool = False
+
+
+def read_input_file(path: Path, options: ReadOptions) -> list[pd.DataFrame]:
+    """Read one CSV/XLSX input into prepared frames (one per non-empty sheet or CSV chunk)."""
+    suffix = path.suffix.lower()
+    with TIMINGS.span("read", path.name):
+        if suffix == ".csv":
+            return read_csv_file(path, options.force_year, options.chunk_rows, options.keep_unknown_columns)
+        if suffix in {".xlsx", ".xls", ".xslx"}:
+            return read_excel_file(path, options.force_year, options.keep_unknown_columns)
+        return []
+
+
+def _read_in_worker(path: Path, options: ReadOptions) -> tuple[list[pd.DataFrame], list[dict]]:
+    """read_input_file in a --jobs worker, plus the timing spans it recorded."""
+    mark = len(TIMINGS.spans)
+    frames = read_input_file(path, options)
+    return frames, TIMINGS.spans[mark:]
+
+
+class ParsedFileCache:
+    """
+    On-disk cache of prepare_dataframe output, one entry per input file.
+
+    Entries are keyed by (resolved path, size, mtime, ReadOptions, PARSER_VERSION)
+    and stored with pandas' pickle format, which keeps each frame's column
+    blocks as binary NumPy arrays.  A "derived" entry per (ReadOptions,
+    RecordFilter) additionally holds the last derive_metrics result together
+    with the signatures of the files it covers.  Hits touch the entry's mtime so prune() can
+    evict the least recently used entries once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, rebuild: bool = False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rebuild = rebuild
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, path: Path, options: ReadOptions) -> Path:
+        key = "|".join(map(str, (*file_signature(path), options, PARSER_VERSION)))
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
+    def load(self, path: Path, options: ReadOptions) -> Optional[list[pd.DataFrame]]:
+        if self.rebuild:
+            self.misses += 1
+            return None
+        try:
+            entry = self.entry_path(path, options)
+            with MEMORY.stage("cache load"), TIMINGS.span("cache load", path.name):
+                frames = pd.read_pickle(entry)
+            os.utime(entry)
+        except Exception:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return frames
+
+    def store(self, path: Path, options: ReadOptions, frames: list[pd.DataFrame]) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entry = self.entry_path(path, options)
+            temp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+            pd.to_pickle(frames, temp)
+            os.replace(temp, entry)
+        except Exception as exc:
+            log(f"Warning: could not cache {path}: {exc}")
+
+    def derived_entry_path(self, key: tuple) -> Path:
+        digest = hashlib.sha1("|".join(map(str, ("derived", *key, PARSER_VERSION, DERIVE_VERSION))).encode()).hexdigest()
+        return self.directory / f"derived-{digest}.pkl"
+
+    def load_derived(self, key: tuple) -> Optional[tuple[list[tuple], pd.DataFrame]]:
+        """The file signatures and derive_metrics output stored by the last run with this key."""
+        if self.rebuild:
+            return None
         try:
-            if suffix == ".csv":
-                frames.extend(read_csv_file(path, force_year))
-            elif suffix in {".xlsx", ".xls", ".xslx"}:
-                frames.extend(read_excel_file(path, force_year))
+            entry = self.derived_entry_path(key)
+            with MEMORY.stage("cache load"), TIMINGS.span("cache load", "derived data"):
+                stored = pd.read_pickle(entry)
+            os.utime(entry)
+        except Exception:
+            return None
+        return stored["signatures"], stored["frame"]
+
+    def store_derived(self, key: tuple, signatures: list[tuple], frame: pd.DataFrame) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entry = self.derived_entry_path(key)
+            temp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+            pd.to_pickle({"signatures": signatures, "frame": frame}, temp)
+            os.replace(temp, entry)
         except Exception as exc:
-            log(f"Warning: could not read {path}: {exc}")
+            log(f"Warning: could not cache derived data: {exc}")
+
+    def prune(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        if not self.directory.is_dir():
+            return
+        entries = [(entry.stat(), entry) for entry in self.directory.glob("*.pkl")]
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= stat.st_size
+
+
+def _read_paths(paths: Sequence[Path], options: ReadOptions, jobs: int) -> list[Optional[list[pd.DataFrame]]]:
+    """Read each path, returning None (after the usual warning) for failures."""
+    results: list[Optional[list[pd.DataFrame]]] = []
+    if jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            try:
+                results.append(read_input_file(path, options))
+            except Exception as exc:
+                log(f"Warning: could not read {path}: {exc}")
+                results.append(None)
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        futures = [pool.submit(_read_in_worker, path, options) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                frames, spans = future.result()
+                TIMINGS.extend(spans)
+                results.append(frames)
+            except Exception as exc:
+                log(f"Warning: could not read {path}: {exc}")
+                results.append(None)
+    return results
 
-    if not frames:
-        return pd.DataFrame()
 
-    combined = pd.concat(frames, ignore_index=True, sort=False)
-    combined = combine_duplicate_columns(combined)
-    combined = derive_metrics(combined)
+def read_input_files(paths: Sequence[Path], options: ReadOptions, jobs: int = 1,
+                     cache: Optional[ParsedFileCache] = None) -> list[pd.DataFrame]:
+    """
+    Read every input path, in order.  Files found in the cache are loaded from
+    it; the rest are parsed, in a process pool when jobs > 1 and more than one
+    file needs parsing.  Frames are always returned in path order and a file
+    that fails only produces the usual warning.
+    """
+    return [frame for frames in read_each_input(paths, options, jobs, cache) if frames for frame in frames]
 
+
+def read_each_input(paths: Sequence[Path], options: ReadOptions, jobs: int = 1,
+                    cache: Optional[ParsedFileCache] = None) -> list[Optional[list[pd.DataFrame]]]:
+    """read_input_files, keeping each path's frames apart (None for a file that failed)."""
+    per_path: list[Optional[list[pd.DataFrame]]] = [
+        cache.load(path, options) if cache is not None else None for path in paths
+    ]
+    pending = [index for index, frames in enumerate(per_path) if frames is None]
+    parsed = _read_paths([paths[index] for index in pending], options, jobs)
+    for index, frames in zip(pending, parsed):
+        per_path[index] = frames
+        if cache is not None and frames is not None:
+            cache.store(paths[index], options, frames)
+    if cache is not None and pending:
+        cache.prune()
+    return per_path
+
+
+@dataclass(frozen=True)
+class RecordFilter:
+    """
+    Restrict loaded records to some churches and/or a week_start_date range
+    (both ends inclusive).  --db inputs push the filter into SQL; file inputs
+    are filtered after loading.
+    """
+    church_ids: tuple[int, ...] = ()
+    date_from: Optional[pd.Timestamp] = None
+    date_to: Optional[pd.Timestamp] = None
+
+    @property
+    def date_end(self) -> Optional[pd.Timestamp]:
+        """Exclusive upper bound: the day after date_to."""
+        return None if self.date_to is None else self.date_to.normalize() + pd.Timedelta(days=1)
+
+    def is_empty(self) -> bool:
+        return not self.church_ids and self.date_from is None and self.date_to is None
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.is_empty():
+            return df
+        mask = pd.Series(True, index=df.index)
+        if self.church_ids:
+            church = df["church_id"] if "church_id" in df.columns else pd.Series(np.nan, index=df.index)
+            mask &= pd.to_numeric(church, errors="coerce").isin(self.church_ids)
+        dates = pd.to_datetime(df["week_start_date"], errors="coerce")
+        if self.date_from is not None:
+            mask &= dates >= self.date_from.normalize()
+        if self.date_end is not None:
+            mask &= dates < self.date_end
+        return df[mask]
+
+
+def _sql_name(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _local_epoch(value: pd.Timestamp) -> int:
+    """Unix seconds of local midnight, matching how Drift stores DateTime."""
+    return int(value.normalize().to_pydatetime().timestamp())
+
+
+def _db_datetimes(series: pd.Series) -> pd.Series:
+    """
+    Decode a Drift DateTime column: unix seconds by default, ISO-8601 text
+    when the app stores DateTime values as text.  Both become local time.
+    """
+    local_tz = datetime.now().astimezone().tzinfo
+    numbers = pd.to_numeric(series, errors="coerce")
+    parsed = pd.to_datetime(numbers, unit="s", utc=True).dt.tz_convert(local_tz).dt.tz_localize(None)
+    text = series.where(numbers.isna() & series.notna())
+    if text.notna().any():
+        from_text = pd.to_datetime(text, errors="coerce", format="ISO8601")
+        if from_text.dt.tz is not None:
+            from_text = from_text.dt.tz_convert(local_tz).dt.tz_localize(None)
+        parsed = parsed.combine_first(from_text)
+    return parsed
+
+
+def _db_query(columns: Sequence[str], record_filter: RecordFilter) -> tuple[str, list[object]]:
+    """SELECT the app columns of DB_TABLE, pushing the record filter into WHERE."""
+    canonical = {canonical_column_name(column): column for column in columns}
+    selected = [column for column in APP_WEEKLY_COLUMNS if column in canonical]
+    select = ", ".join(f"{_sql_name(canonical[column])} AS {_sql_name(column)}" for column in selected)
+
+    clauses: list[str] = []
+    params: list[object] = []
+    if record_filter.church_ids and "church_id" in canonical:
+        marks = ", ".join("?" for _ in record_filter.church_ids)
+        clauses.append(f"{_sql_name(canonical['church_id'])} IN ({marks})")
+        params.extend(record_filter.church_ids)
+    if "week_start_date" in canonical:
+        date = _sql_name(canonical["week_start_date"])
+        for bound, op in [(record_filter.date_from, ">="), (record_filter.date_end, "<")]:
+            if bound is None:
+                continue
+            clauses.append(f"((typeof({date}) = 'integer' AND {date} {op} ?) "
+                           f"OR (typeof({date}) = 'text' AND {date} {op} ?))")
+            params.extend([_local_epoch(bound), bound.strftime("%Y-%m-%d")])
+
+    sql = f"SELECT {select} FROM {_sql_name(DB_TABLE)}"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    return sql, params
+
+
+def read_database(path: Path, force_year: Optional[int],
+                  record_filter: Optional[RecordFilter] = None) -> list[pd.DataFrame]:
+    """
+    Read weekly_records from the Flutter app's SQLite database.
+
+    Column names (camelCase or Drift's snake_case) are mapped onto
+    APP_WEEKLY_COLUMNS, church_id and date filters run inside SQLite, and rows
+    are fetched DB_BATCH_ROWS at a time.
+    """
+    record_filter = record_filter or RecordFilter()
+    uri = path.expanduser().resolve().as_uri() + "?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({_sql_name(DB_TABLE)})")]
+        if not columns:
+            raise ValueError(f"no {DB_TABLE} table")
+        sql, params = _db_query(columns, record_filter)
+        cursor = conn.execute(sql, params)
+        names = [description[0] for description in cursor.description]
+        batches: list[pd.DataFrame] = []
+        with MEMORY.stage("read"):
+            while True:
+                rows = cursor.fetchmany(DB_BATCH_ROWS)
+                if not rows:
+                    break
+                batches.append(pd.DataFrame.from_records(rows, columns=names))
+
+    if not batches:
+        return []
+    with MEMORY.stage("concat"):
+        df = pd.concat(batches, ignore_index=True) if len(batches) > 1 else batches[0]
+    del batches
+    for column in DB_DATETIME_COLUMNS.intersection(df.columns):
+        df[column] = _db_datetimes(df[column])
+    df["source_table"] = DB_TABLE
+    prepared = prepare_dataframe(df, path.name, None, force_year)
+    return [prepared] if not prepared.empty else []
+
+
+def _combine_frames(frames: list[pd.DataFrame], record_filter: Optional[RecordFilter]) -> pd.DataFrame:
+    """
+    Stack the prepared frames into one frame with a fresh RangeIndex.  The
+    list is emptied, so the per-file frames are freed as soon as the combined
+    one exists, and a lone frame is reused rather than copied.
+    """
+    with MEMORY.stage("concat"):
+        if len(frames) == 1:
+            combined = frames.pop()
+            combined.index = pd.RangeIndex(len(combined))
+        else:
+            combined = pd.concat(frames, ignore_index=True, sort=False)
+        frames.clear()
+    with MEMORY.stage("combine duplicates"):
+        combined = combine_duplicate_columns(combined)
+    if record_filter is not None and not record_filter.is_empty():
+        with MEMORY.stage("filter"):
+            combined = record_filter.apply(combined).reset_index(drop=True)
+    return combined
+
+
+def _derive_with_cache(paths: Sequence[Path], options: ReadOptions, jobs: int, cache: ParsedFileCache,
+                       record_filter: Optional[RecordFilter], derive_jobs: int = 1,
+                       columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    derive_metrics over every path, starting from the previous run's derived
+    frame when all of its files are still inputs and unchanged.  Then only the
+    files added since are read, and their rows go through append_metrics, so
+    a weekly refresh costs the new weeks rather than the whole history.  A
+    reused frame may lack some of columns; load_data adds them.  Files that
+    could not be read are left out of the stored signatures, so the next run
+    tries them again.
+    """
+    key = (options, record_filter)
+    signatures = [file_signature(path) for path in paths]
+    previous = cache.load_derived(key)
+    if previous is not None and set(previous[0]) <= set(signatures):
+        known = set(previous[0])
+        added = [(path, signature) for path, signature in zip(paths, signatures) if signature not in known]
+        derived = previous[1]
+        if not added:
+            log("Note: inputs unchanged, reusing the cached derived data")
+            return derived
+        per_path = read_each_input([path for path, _ in added], options, jobs, cache)
+        read = [*previous[0], *(signature for (_, signature), frames in zip(added, per_path) if frames is not None)]
+        frames = [frame for frames in per_path if frames for frame in frames]
+        if frames:
+            new_rows = _combine_frames(frames, record_filter)
+            with MEMORY.stage("derive"), TIMINGS.span("derive", "append"):
+                derived = append_metrics(derived, new_rows)
+        log(f"Note: appended {len(added)} new file(s) to the cached derived data")
+    else:
+        per_path = read_each_input(paths, options, jobs, cache)
+        read = [signature for signature, frames in zip(signatures, per_path) if frames is not None]
+        frames = [frame for frames in per_path if frames for frame in frames]
+        if not frames:
+            return pd.DataFrame()
+        # No local keeps the combined frame, so derive_metrics can free it
+        # once it has the rows in derive order.
+        with MEMORY.stage("derive"), TIMINGS.span("derive"):
+            derived = derive_metrics(_combine_frames(frames, record_filter), jobs=derive_jobs, columns=columns)
+    cache.store_derived(key, read, derived)
+    cache.prune()
+    return derived
+
+
+def load_data(paths: Sequence[Path], force_year: Optional[int], jobs: int = 1,
+              cache: Optional[ParsedFileCache] = None, databases: Sequence[Path] = (),
+              record_filter: Optional[RecordFilter] = None, chunk_rows: int = 0,
+              keep_unknown_columns: bool = False, derive_jobs: int = 1,
+              compact: Optional[bool] = None, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Read, combine and derive every input.  compact=True stores the result with
+    compact_frame, False never does, and None (the default) does so for
+    frames of at least COMPACT_MIN_ROWS rows.  columns limits the
+    LAZY_DERIVED_COLUMNS computed up front (None computes them all); the
+    others can be added later with ensure_derived.
+    """
+    if columns is not None:
+        columns = list(columns)
+    options = ReadOptions(force_year, chunk_rows, keep_unknown_columns)
+    if cache is not None and not databases:
+        combined = _derive_with_cache(paths, options, jobs, cache, record_filter, derive_jobs, columns)
+        if combined.empty:
+            return pd.DataFrame()
+    else:
+        frames = read_input_files(paths, options, jobs, cache)
+        for database in databases:
+            try:
+                with TIMINGS.span("read", database.name):
+                    frames.extend(read_database(database, force_year, record_filter))
+            except Exception as exc:
+                log(f"Warning: could not read {database}: {exc}")
+
+        if not frames:
+            return pd.DataFrame()
+        with MEMORY.stage("derive"), TIMINGS.span("derive"):
+            combined = derive_metrics(_combine_frames(frames, record_filter), jobs=derive_jobs, columns=columns)
+    return _finish_load(combined, columns, compact)
+
+
+def _finish_load(combined: pd.DataFrame, columns: Optional[list[str]], compact: Optional[bool]) -> pd.DataFrame:
+    """load_data's last steps on a derived frame: drop rows without any metric, add columns, compact."""
     metric_columns = [
         "men",
         "women",
@@ -621,15 +2198,176 @@ def load_data(paths: Sequence[Path], force_year: Optional[int]) -> pd.DataFrame:
         "holy_communion",
         "sabbath_school_attendance",
     ]
-    has_metric = combined[[c for c in metric_columns if c in combined.columns]].notna().any(axis=1)
-    return combined[has_metric].reset_index(drop=True)
+    with MEMORY.stage("select rows"):
+        has_metric = combined[[c for c in metric_columns if c in combined.columns]].notna().any(axis=1)
+        if not has_metric.all():
+            lazy = combined.attrs.get(LAZY_ATTR)
+            if lazy and any(name in lazy["pending"] for name in GROWTH_COLUMNS.values()):
+                # Growth after a dropped row was NaN; ensure_derived must not
+                # compare with the kept row before it instead.
+                lazy = {**lazy, "gaps": _growth_gaps(combined, has_metric.to_numpy(), lazy["gaps"])}
+            combined = combined[has_metric].reset_index(drop=True)
+            if lazy:
+                combined.attrs[LAZY_ATTR] = lazy
+    with MEMORY.stage("derive"), TIMINGS.span("derive", "on demand"):
+        ensure_derived(combined, columns)
+    if compact or (compact is None and len(combined) >= COMPACT_MIN_ROWS):
+        with MEMORY.stage("compact"):
+            combined = compact_frame(combined)
+    return combined
+
+
+def _small_integer_array(values: np.ndarray) -> Optional[pd.api.extensions.ExtensionArray]:
+    """values as the smallest nullable integer array that holds them, or None if one is not a whole number."""
+    missing = np.isnan(values)
+    present = values[~missing]
+    if not present.size or not np.isfinite(present).all() or (present % 1).any():
+        return None
+    low, high = present.min(), present.max()
+    for name in SMALL_INTEGER_DTYPES["unsigned" if low >= 0 else "signed"]:
+        info = np.iinfo(name)
+        if info.min <= low and high <= info.max:
+            return pd.arrays.IntegerArray(np.where(missing, 0, values).astype(name), missing)
+    return None
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    df with narrower storage (--compact).  HEAD_COUNT_COLUMNS become nullable
+    small integers and CATEGORICAL_COLUMNS categoricals; APP_WEEKLY_COLUMNS
+    that are entirely NaN are dropped and kept only as names ("virtual"
+    columns).  The original dtypes, column order and the bytes saved are
+    recorded in attrs, so expand_frame can hand consumers exactly the frame
+    load_data would have returned.
+    """
+    if COMPACT_ATTR in df.attrs:
+        return df
+    before = int(df.memory_usage(deep=True).sum())
+    compact = df.copy(deep=False)
+    dtypes: dict[str, object] = {}
+    virtual = [
+        column for column in APP_WEEKLY_COLUMNS
+        if column in df.columns and df[column].dtype == np.dtype("float64") and df[column].isna().all()
+    ]
+    for column in virtual:
+        del compact[column]
+    for column in HEAD_COUNT_COLUMNS:
+        if column not in compact.columns or compact[column].dtype not in (np.dtype("int64"), np.dtype("float64")):
+            continue
+        values = _small_integer_array(compact[column].to_numpy(dtype="float64"))
+        if values is not None:
+            dtypes[column] = compact[column].dtype
+            compact[column] = pd.Series(values, index=compact.index)
+    for column in CATEGORICAL_COLUMNS:
+        if column in compact.columns and pd.api.types.is_string_dtype(compact[column]):
+            dtypes[column] = compact[column].dtype
+            compact[column] = compact[column].astype("category")
+    after = int(compact.memory_usage(deep=True).sum())
+    compact.attrs[COMPACT_ATTR] = {"columns": list(df.columns), "dtypes": dtypes, "virtual": virtual,
+                                   "saved_bytes": before - after}
+    return compact
+
+
+# id of each frame expand_frame returned -> the compact frame it was expanded from.
+_EXPANDED_FROM: dict[int, weakref.ref] = {}
+
+
+def expand_frame(df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Undo compact_frame: original dtypes, virtual columns back as NaN, original
+    column order.  With columns, only those of them the frame had are
+    expanded and returned, so a consumer pays for the columns it reads and
+    not for the whole frame.  A frame that was never compacted is returned
+    as it is.
+    """
+    record = df.attrs.get(COMPACT_ATTR)
+    if record is None:
+        return df
+    order = record["columns"]
+    if columns is not None:
+        wanted = set(columns)
+        order = [column for column in order if column in wanted]
+    # Built in one go: assigning into a column selection warns on pandas 2.
+    stored = {column: df[column].astype(record["dtypes"][column]) if column in record["dtypes"] else df[column]
+              for column in order if column in df.columns}
+    expanded = pd.DataFrame(stored, index=df.index, **NO_COPY).reindex(columns=order, **NO_COPY)
+    expanded.attrs = {key: value for key, value in df.attrs.items() if key != COMPACT_ATTR}
+    _EXPANDED_FROM[id(expanded)] = weakref.ref(df)
+    weakref.finalize(expanded, _EXPANDED_FROM.pop, id(expanded), None)
+    return expanded
+
+
+def expanded_source(df: pd.DataFrame) -> pd.DataFrame:
+    """The compact frame expand_frame made df from, or df itself."""
+    ref = _EXPANDED_FROM.get(id(df))
+    source = ref() if ref is not None else None
+    return df if source is None else source
+
+
+class FrameStats:
+    """
+    Per-run cache of the statistics the summary tables and the graphs share:
+    each column's non-null count (behind has_data), describe() tables and
+    the correlation matrix of CORRELATION_COLUMNS.  It follows one frame at
+    a time, held by weak reference, and starts over when handed another.
+    Frames expand_frame returned count as the compact frame they came from,
+    so under --compact the tables and every graph share one cache; the
+    statistics are computed from that frame, expanding only what they read.
+    ensure_derived only adds columns to a frame, so what is cached for its
+    existing columns stays valid.
+    """
+
+    def __init__(self) -> None:
+        self._frame: Optional[weakref.ref] = None
+        self._counts: dict[str, int] = {}
+        self._describe: dict[tuple[str, ...], pd.DataFrame] = {}
+        self._correlation: Optional[pd.DataFrame] = None
+
+    def clear(self) -> None:
+        self._frame = None
+        self._counts.clear()
+        self._describe.clear()
+        self._correlation = None
+
+    def _follow(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = expanded_source(df)
+        if self._frame is None or self._frame() is not df:
+            self.clear()
+            self._frame = weakref.ref(df)
+        return df
+
+    def count(self, df: pd.DataFrame, column: str) -> int:
+        """Non-null values in df[column], 0 when the column is missing."""
+        df = self._follow(df)
+        if column not in self._counts:
+            self._counts[column] = int(df[column].count()) if column in df.columns else 0
+        return self._counts[column]
+
+    def describe(self, df: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+        df = self._follow(df)
+        key = tuple(columns)
+        if key not in self._describe:
+            self._describe[key] = expand_frame(df, key)[list(key)].describe()
+        return self._describe[key]
+
+    def correlation(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pearson correlation of the CORRELATION_COLUMNS that have data.  Each
+        pair uses the rows where both are present, so any subset of it equals
+        the correlation of that subset.
+        """
+        df = self._follow(df)
+        if self._correlation is None:
+            available = [column for column in CORRELATION_COLUMNS if self.count(df, column)]
+            self._correlation = expand_frame(df, available)[available].corr(numeric_only=True)
+        return self._correlation
+
+
+STATS = FrameStats()
 
 
 def has_data(df: pd.DataFrame, columns: Iterable[str]) -> bool:
-    for column in columns:
-        if column not in df.columns or df[column].dropna().empty:
-            return False
-    return True
+    return all(STATS.count(df, column) for column in columns)
 
 
 def date_labels(df: pd.DataFrame) -> list[str]:
@@ -711,6 +2449,104 @@ def add_mean_line(ax: Axes, series: pd.Series, label: str = "Average") -> None:
         ax.axhline(mean, linestyle="--", linewidth=1, color="#555555", label=label)
 
 
+# ---------------------------------------------------------------------------
+# Time axis shared by the weekly trend builders
+# ---------------------------------------------------------------------------
+
+# Point budget for the current run's time-series lines (0 = no downsampling).
+_max_points = DEFAULT_MAX_POINTS
+
+
+def set_max_points(points: int) -> None:
+    global _max_points
+    _max_points = max(0, points)
+
+
+def time_axis(df: pd.DataFrame) -> np.ndarray:
+    """
+    x values for df's rows: week_start_date as datetime64, so the axis is a
+    real time scale, or 1-based row numbers when no row has a usable date.
+    Rows with an unreadable date are NaT and are left out of the lines.
+    """
+    if "week_start_date" in df.columns:
+        dates = pd.to_datetime(df["week_start_date"], errors="coerce")
+        if dates.notna().any():
+            return dates.to_numpy(dtype="datetime64[ns]")
+    return np.arange(1, len(df) + 1)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the threshold points largest-triangle-three-buckets keeps of
+    (x, y): the first and the last, and from each of threshold - 2 equal
+    buckets in between the point making the largest triangle with the point
+    kept before it and the mean of the next bucket.  Unlike a stride, it
+    keeps peaks and dips.  x must be ascending and both must be finite.
+    """
+    n = len(x)
+    if threshold <= 2 or n <= threshold:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    bounds = np.append(edges, n)
+    counts = np.diff(bounds)
+    x_means = np.add.reduceat(x, bounds[:-1]) / counts
+    y_means = np.add.reduceat(y, bounds[:-1]) / counts
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        # The mean of the next bucket; the last one looks ahead to the final point.
+        cx, cy = x_means[bucket + 1], y_means[bucket + 1]
+        ax_, ay = x[a], y[a]
+        area = np.abs((ax_ - cx) * (y[start:stop] - ay) - (ax_ - x[start:stop]) * (cy - ay))
+        a = start + int(np.argmax(area))
+        keep[bucket + 1] = a
+    return keep
+
+
+def downsample(x: np.ndarray, *ys: Iterable[float]) -> tuple[np.ndarray, ...]:
+    """
+    x and each of ys as float arrays, cut to the run's point budget with
+    LTTB.  Several ys (stacked areas) share the points chosen for their sum.
+    Rows with a missing x or y are dropped only when downsampling, so short
+    series keep their gaps.
+    """
+    values = [pd.to_numeric(pd.Series(y), errors="coerce").to_numpy(dtype=float, na_value=np.nan) for y in ys]
+    if not _max_points or len(x) <= _max_points:
+        return (x, *values)
+    # Days (or row numbers), so the triangle areas stay well within float range.
+    position = (x.astype("datetime64[ns]").astype(np.int64) / 86_400e9
+                if np.issubdtype(x.dtype, np.datetime64) else x.astype(float))
+    total = np.sum(values, axis=0)
+    finite = np.isfinite(total)
+    if np.issubdtype(x.dtype, np.datetime64):
+        finite &= ~np.isnat(x)
+    valid = np.flatnonzero(finite)
+    chosen = valid[lttb_indices(position[valid], total[valid], _max_points)]
+    return (x[chosen], *(value[chosen] for value in values))
+
+
+def plot_time_series(ax: Axes, x: np.ndarray, y: Iterable[float], *args, **kwargs) -> list:
+    """ax.plot(x, y, ...) downsampled to the point budget, without markers on long lines."""
+    xs, ys = downsample(x, y)
+    lines = ax.plot(xs, ys, *args, **kwargs)
+    if len(xs) > TIME_MARKER_LIMIT:
+        for line in lines:
+            line.set_marker("None")
+    return lines
+
+
+def format_time_axis(ax: Axes, x: np.ndarray) -> None:
+    """Date ticks thinned to at most TIME_AXIS_TICKS with concise labels, or integer row ticks."""
+    if np.issubdtype(x.dtype, np.datetime64):
+        locator = AutoDateLocator(minticks=3, maxticks=TIME_AXIS_TICKS)
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(ConciseDateFormatter(locator))
+    else:
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=TIME_AXIS_TICKS, integer=True))
+
+
 # ---------------------------------------------------------------------------
 # ── NEW PRESENTATION GRAPHS ─────────────────────────────────────────────────
 # These builders read the raw XLSX source files from a `data/` sub-folder
@@ -737,6 +2573,66 @@ def _find_xlsx(pattern: str) -> Optional[Path]:
     return None
 
 
+class WorkbookRegistry:
+    """
+    Per-run cache of the presentation workbooks in data/.
+
+    rows() parses the active sheet of each file once and hands the same row
+    tuples to every builder; frame() memoizes a loader's DataFrame per file.
+    Entries are keyed by resolved path and mtime, so an edited workbook is
+    re-read.  Cached frames are shared between builders and must not be
+    modified in place.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[tuple[Path, int], Optional[list[tuple]]] = {}
+        self._frames: dict[tuple[Path, int, str], Optional[pd.DataFrame]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._frames.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: Path) -> tuple[Path, int]:
+        return path.resolve(), path.stat().st_mtime_ns
+
+    def rows(self, path: Path) -> Optional[list[tuple]]:
+        """Return the active sheet's rows as value tuples, or None without one."""
+        key = self._key(path)
+        if key in self._rows:
+            self.hits += 1
+            return self._rows[key]
+        self.misses += 1
+        from openpyxl import load_workbook
+        wb = load_workbook(path, read_only=True)
+        try:
+            ws = wb.active
+            rows = None if ws is None else list(ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
+        self._rows[key] = rows
+        return rows
+
+    def frame(self, path: Path,
+              loader: Callable[[Path], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """Return loader(path), calling it at most once per file and loader."""
+        key = (*self._key(path), loader.__name__)
+        if key in self._frames:
+            self.hits += 1
+            return self._frames[key]
+        self.misses += 1
+        frame = loader(path)
+        self._frames[key] = frame
+        return frame
+
+
+WORKBOOKS = WorkbookRegistry()
+
+
 # ── 1. Sabbath School group bar chart ───────────────────────────────────────
 
 def plot_sabbath_school_groups(df: pd.DataFrame) -> Optional[Figure]:
@@ -768,12 +2664,9 @@ def plot_sabbath_school_groups(df: pd.DataFrame) -> Optional[Figure]:
 
 
 def _sabbath_school_from_xlsx(path: Path) -> Optional[Figure]:
-    from openpyxl import load_workbook
-    wb = load_workbook(path, read_only=True)
-    ws = wb.active
-    if ws is None:
+    rows = WORKBOOKS.rows(path)
+    if rows is None:
         return None
-    rows = list(ws.iter_rows(values_only=True))
 
     # Locate header row (contains "GROUP" or datetime objects in same row)
     header_row = None
@@ -883,12 +2776,9 @@ def plot_sabbath_school_totals_trend(df: pd.DataFrame) -> Optional[Figure]:
 def _sabbath_school_totals_from_xlsx(path: Path) -> Optional[Figure]:
     import datetime
 
-    from openpyxl import load_workbook
-    wb = load_workbook(path, read_only=True)
-    ws = wb.active
-    if ws is None:
+    rows = WORKBOOKS.rows(path)
+    if rows is None:
         return None
-    rows = list(ws.iter_rows(values_only=True))
 
     # Collect all date columns and their TOTAL IN CHURCH COMPOUND rows
     header_row = None
@@ -968,16 +2858,17 @@ def _load_home_church_xlsx() -> Optional[pd.DataFrame]:
     path = _find_xlsx("home church")
     if path is None:
         return None
+    return WORKBOOKS.frame(path, _parse_home_church_xlsx)
+
+
+def _parse_home_church_xlsx(path: Path) -> Optional[pd.DataFrame]:
     try:
-        from openpyxl import load_workbook
-        wb = load_workbook(path, read_only=True)
-        ws = wb.active
-        if ws is None:
-            return None
-        rows = list(ws.iter_rows(values_only=True))
+        rows = WORKBOOKS.rows(path)
     except Exception as exc:
         log(f"Note: could not open Home Church XLSX ({exc}).")
         return None
+    if rows is None:
+        return None
 
     records = []
     for row in rows[12:]:          # first 12 rows are headers / metadata
@@ -1074,16 +2965,17 @@ def _load_business_meeting_xlsx() -> Optional[pd.DataFrame]:
     path = _find_xlsx("business attendance")
     if path is None:
         return None
+    return WORKBOOKS.frame(path, _parse_business_meeting_xlsx)
+
+
+def _parse_business_meeting_xlsx(path: Path) -> Optional[pd.DataFrame]:
     try:
-        from openpyxl import load_workbook
-        wb = load_workbook(path, read_only=True)
-        ws = wb.active
-        if ws is None:
-            return None
-        rows = list(ws.iter_rows(values_only=True))
+        rows = WORKBOOKS.rows(path)
     except Exception as exc:
         log(f"Note: could not open Business Meeting XLSX ({exc}).")
         return None
+    if rows is None:
+        return None
 
     records = []
     for row in rows:
@@ -1170,12 +3062,9 @@ def plot_active_leaders_board(df: pd.DataFrame) -> Optional[Figure]:
 
 
 def _board_meeting_from_xlsx(path: Path) -> Optional[Figure]:
-    from openpyxl import load_workbook
-    wb = load_workbook(path, read_only=True)
-    ws = wb.active
-    if ws is None:
+    rows = WORKBOOKS.rows(path)
+    if rows is None:
         return None
-    rows = list(ws.iter_rows(values_only=True))
 
     months, attended, expected = [], [], []
     MONTH_NAMES = {"january", "february", "march", "april", "may", "june",
@@ -1278,22 +3167,23 @@ def plot_demographic_trends_styled(df: pd.DataFrame) -> Optional[Figure]:
     if len(columns) < 2:
         return None
 
-    labels  = date_labels(df)
+    x       = time_axis(df)
     markers = ["o", "s", "^", "D"]
     colors  = [C_NAVY, C_ROSE, C_GREEN, C_GOLD]
 
     fig, ax = make_church_fig(figsize=(12, 5.5))
     for col, marker, color in zip(columns, markers, colors):
-        ax.plot(labels, df[col], f"{marker}-",
-                color=color, linewidth=2.5, markersize=7,
-                label=col.title(), zorder=3)
-        ax.fill_between(labels, df[col], alpha=0.06, color=color)
+        xs, ys = downsample(x, df[col])
+        plot_time_series(ax, xs, ys, f"{marker}-",
+                         color=color, linewidth=2.5, markersize=7,
+                         label=col.title(), zorder=3)
+        ax.fill_between(xs, ys, alpha=0.06, color=color)
 
     church_style(fig, ax, "Weekly Sabbath Attendance by Category — Q1 2026")
     ax.set_ylabel("Attendance Count", fontsize=10)
     ax.set_xlabel("Sabbath Date", fontsize=10)
     ax.legend(fontsize=9.5, framealpha=0.9, edgecolor=C_GREY, loc="upper left")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     add_watermark(fig)
     return fig
 
@@ -1305,18 +3195,20 @@ def plot_financial_trend_styled(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["tithe", "offerings"]):
         return None
 
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = make_church_fig(figsize=(12, 5))
-    ax.fill_between(labels, df["tithe"].fillna(0),    alpha=0.18, color=C_NAVY)
-    ax.fill_between(labels, df["offerings"].fillna(0), alpha=0.18, color=C_GOLD)
-    ax.plot(labels, df["tithe"],    "o-",  color=C_NAVY, linewidth=2.5, markersize=7,
-            label="Tithe", zorder=3)
-    ax.plot(labels, df["offerings"], "s--", color=C_GOLD, linewidth=2.5, markersize=7,
-            label="Offerings", zorder=3)
+    tithe_x, tithe = downsample(x, df["tithe"])
+    offerings_x, offerings = downsample(x, df["offerings"])
+    ax.fill_between(tithe_x, np.nan_to_num(tithe),         alpha=0.18, color=C_NAVY)
+    ax.fill_between(offerings_x, np.nan_to_num(offerings), alpha=0.18, color=C_GOLD)
+    plot_time_series(ax, tithe_x, tithe,         "o-",  color=C_NAVY, linewidth=2.5, markersize=7,
+                     label="Tithe", zorder=3)
+    plot_time_series(ax, offerings_x, offerings, "s--", color=C_GOLD, linewidth=2.5, markersize=7,
+                     label="Offerings", zorder=3)
     church_style(fig, ax, "Weekly Tithe & Offerings — Q1 2026")
     ax.set_ylabel("KES", fontsize=10)
     ax.legend(fontsize=9.5, framealpha=0.9, edgecolor=C_GREY)
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     add_watermark(fig)
     return fig
 
@@ -1327,16 +3219,17 @@ def _load_holy_communion_xlsx() -> Optional[pd.DataFrame]:
     path = _find_xlsx("holy communion")
     if path is None:
         return None
+    return WORKBOOKS.frame(path, _parse_holy_communion_xlsx)
+
+
+def _parse_holy_communion_xlsx(path: Path) -> Optional[pd.DataFrame]:
     try:
-        from openpyxl import load_workbook
-        wb = load_workbook(path, read_only=True)
-        ws = wb.active
-        if ws is None:
-            return None
-        rows = list(ws.iter_rows(values_only=True))
+        rows = WORKBOOKS.rows(path)
     except Exception as exc:
         log(f"Note: could not open Holy Communion XLSX ({exc}).")
         return None
+    if rows is None:
+        return None
 
     records = []
     for row in rows:
@@ -1390,12 +3283,12 @@ def plot_holy_communion_per_home_church(df: pd.DataFrame) -> Optional[Figure]:
 def plot_total_attendance_trend(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["total_attendance"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.plot(labels, df["total_attendance"], marker="o", linewidth=2.2, color="#2563eb")
+    plot_time_series(ax, x, df["total_attendance"], marker="o", linewidth=2.2, color="#2563eb")
     add_mean_line(ax, df["total_attendance"])
     configure_axes(ax, "Total Attendance Trend", "Attendance")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1404,12 +3297,12 @@ def plot_demographic_trends(df: pd.DataFrame) -> Optional[Figure]:
     columns = [c for c in ATTENDANCE_PARTS if has_data(df, [c])]
     if len(columns) < 2:
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
     for column in columns:
-        ax.plot(labels, df[column], marker="o", linewidth=1.8, label=column.replace("_", " ").title())
+        plot_time_series(ax, x, df[column], marker="o", linewidth=1.8, label=column.replace("_", " ").title())
     configure_axes(ax, "Attendance Trends by Group", "Attendance")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1479,12 +3372,12 @@ def plot_demographic_percentage_trends(df: pd.DataFrame) -> Optional[Figure]:
     columns = ["men_pct", "women_pct", "youth_pct", "children_pct"]
     if not has_data(df, columns):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
     for column in columns:
-        ax.plot(labels, df[column], marker="o", linewidth=1.8, label=column.replace("_pct", "").title())
+        plot_time_series(ax, x, df[column], marker="o", linewidth=1.8, label=column.replace("_pct", "").title())
     configure_axes(ax, "Demographic Percentage Trends", "Share of Sabbath Attendance (%)")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1502,12 +3395,12 @@ def plot_average_demographic_percentage(df: pd.DataFrame) -> Optional[Figure]:
 def plot_sabbath_school_trend(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["sabbath_school_attendance"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.plot(labels, df["sabbath_school_attendance"], marker="o", linewidth=2, color="#7c3aed")
+    plot_time_series(ax, x, df["sabbath_school_attendance"], marker="o", linewidth=2, color="#7c3aed")
     add_mean_line(ax, df["sabbath_school_attendance"])
     configure_axes(ax, "Sabbath School Attendance Trend", "Attendance")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1526,12 +3419,12 @@ def plot_visitors_trend(df: pd.DataFrame) -> Optional[Figure]:
 def plot_tithe_offerings_trend(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["tithe", "offerings"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.plot(labels, df["tithe"], marker="o", linewidth=2, label="Tithe")
-    ax.plot(labels, df["offerings"], marker="s", linewidth=2, label="Offerings")
+    plot_time_series(ax, x, df["tithe"], marker="o", linewidth=2, label="Tithe")
+    plot_time_series(ax, x, df["offerings"], marker="s", linewidth=2, label="Offerings")
     configure_axes(ax, "Tithe vs Offerings Trend", "Amount")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1540,11 +3433,11 @@ def plot_income_composition(df: pd.DataFrame) -> Optional[Figure]:
     columns = [c for c in INCOME_PARTS if has_data(df, [c])]
     if len(columns) < 2:
         return None
-    labels = date_labels(df)
+    x, *parts = downsample(time_axis(df), *(df[c].fillna(0) for c in columns))
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.stackplot(labels, [df[c].fillna(0) for c in columns], labels=[c.replace("_", " ").title() for c in columns], alpha=0.85)
+    ax.stackplot(x, parts, labels=[c.replace("_", " ").title() for c in columns], alpha=0.85)
     configure_axes(ax, "Income Composition over Time", "Amount")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend(loc="upper left")
     return fig
 
@@ -1565,15 +3458,15 @@ def plot_income_distribution(df: pd.DataFrame) -> Optional[Figure]:
 def plot_income_vs_attendance_dual(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["total_attendance", "total_income"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax1 = plt.subplots(figsize=(11, 5))
     ax2 = ax1.twinx()
-    ax1.plot(labels, df["total_attendance"], marker="o", color="#2563eb", label="Attendance")
-    ax2.plot(labels, df["total_income"], marker="s", color="#16a34a", label="Income")
+    plot_time_series(ax1, x, df["total_attendance"], marker="o", color="#2563eb", label="Attendance")
+    plot_time_series(ax2, x, df["total_income"], marker="s", color="#16a34a", label="Income")
     ax1.set_title("Total Attendance vs Total Income")
     ax1.set_ylabel("Attendance")
     ax2.set_ylabel("Income")
-    ax1.tick_params(axis="x", rotation=25)
+    format_time_axis(ax1, x)
     lines, labels_combined = [], []
     for axis in (ax1, ax2):
         handles, axis_labels = axis.get_legend_handles_labels()
@@ -1622,12 +3515,12 @@ def plot_per_capita_metrics(df: pd.DataFrame) -> Optional[Figure]:
     columns = ["income_per_attendee", "tithe_per_attendee", "offerings_per_attendee"]
     if not has_data(df, columns):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
     for column in columns:
-        ax.plot(labels, df[column], marker="o", linewidth=1.8, label=column.replace("_", " ").title())
+        plot_time_series(ax, x, df[column], marker="o", linewidth=1.8, label=column.replace("_", " ").title())
     configure_axes(ax, "Per Capita Giving Metrics", "Amount")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1658,12 +3551,12 @@ def plot_ratio_trends(df: pd.DataFrame) -> Optional[Figure]:
     columns = ["men_women_ratio", "adult_young_ratio", "tithe_offerings_ratio"]
     if not has_data(df, columns):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
     for column in columns:
-        ax.plot(labels, df[column], marker="o", linewidth=1.8, label=column.replace("_", " ").title())
+        plot_time_series(ax, x, df[column], marker="o", linewidth=1.8, label=column.replace("_", " ").title())
     configure_axes(ax, "Ratio Trends", "Ratio")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1682,11 +3575,11 @@ def plot_baptisms_trend(df: pd.DataFrame) -> Optional[Figure]:
 def plot_holy_communion_trend(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["holy_communion"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.plot(labels, df["holy_communion"], marker="o", linewidth=2, color="#9333ea")
+    plot_time_series(ax, x, df["holy_communion"], marker="o", linewidth=2, color="#9333ea")
     configure_axes(ax, "Holy Communion Attendance", "Attendance")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     return fig
 
 
@@ -1707,12 +3600,12 @@ def plot_holy_communion_expected_vs_attended(df: pd.DataFrame) -> Optional[Figur
 def plot_ambassadors_trend(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["ambassadors_attendance"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.plot(labels, df["ambassadors_attendance"], marker="o", linewidth=2, color="#f59e0b")
+    plot_time_series(ax, x, df["ambassadors_attendance"], marker="o", linewidth=2, color="#f59e0b")
     add_mean_line(ax, df["ambassadors_attendance"])
     configure_axes(ax, "Ambassadors Attendance Trend", "Attendance")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1720,12 +3613,12 @@ def plot_ambassadors_trend(df: pd.DataFrame) -> Optional[Figure]:
 def plot_board_business_meeting_trend(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["board_business_meeting_attendance"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.plot(labels, df["board_business_meeting_attendance"], marker="o", linewidth=2, color="#0ea5e9")
+    plot_time_series(ax, x, df["board_business_meeting_attendance"], marker="o", linewidth=2, color="#0ea5e9")
     add_mean_line(ax, df["board_business_meeting_attendance"])
     configure_axes(ax, "Board/Business Meeting Attendance", "Attendance")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1759,15 +3652,15 @@ def plot_attendance_income_scatter(df: pd.DataFrame) -> Optional[Figure]:
 def dual_axis(df: pd.DataFrame, primary: str, secondary: str, title: str) -> Optional[Figure]:
     if not has_data(df, [primary, secondary]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, ax1 = plt.subplots(figsize=(11, 5))
     ax2 = ax1.twinx()
-    ax1.plot(labels, df[primary], marker="o", color="#2563eb", label=primary.replace("_", " ").title())
-    ax2.plot(labels, df[secondary], marker="s", color="#f97316", label=secondary.replace("_", " ").title())
+    plot_time_series(ax1, x, df[primary], marker="o", color="#2563eb", label=primary.replace("_", " ").title())
+    plot_time_series(ax2, x, df[secondary], marker="s", color="#f97316", label=secondary.replace("_", " ").title())
     ax1.set_title(title)
     ax1.set_ylabel(primary.replace("_", " ").title())
     ax2.set_ylabel(secondary.replace("_", " ").title())
-    ax1.tick_params(axis="x", rotation=25)
+    format_time_axis(ax1, x)
     ax1.grid(True, alpha=0.25)
     lines, labels_combined = [], []
     for axis in (ax1, ax2):
@@ -1779,38 +3672,51 @@ def dual_axis(df: pd.DataFrame, primary: str, secondary: str, title: str) -> Opt
 
 
 def plot_correlation_heatmap(df: pd.DataFrame) -> Optional[Figure]:
-    columns = [
-        "men",
-        "women",
-        "youth",
-        "children",
-        "sunday_home_church",
-        "total_attendance",
-        "tithe",
-        "offerings",
-        "total_income",
-        "baptisms",
-        "holy_communion",
-        "sabbath_school_attendance",
-    ]
-    available = [column for column in columns if has_data(df, [column])]
-    if len(available) < 3:
+    corr = STATS.correlation(df)
+    if len(corr) < 3:
         return None
-    corr = df[available].corr(numeric_only=True)
+    return correlation_heatmap(corr, "Metric Correlation Heatmap")
+
+
+def correlation_heatmap(corr: pd.DataFrame, title: str) -> Figure:
     fig, ax = plt.subplots(figsize=(10, 8))
     image = ax.imshow(corr, cmap="coolwarm", vmin=-1, vmax=1)
-    ax.set_xticks(np.arange(len(available)))
-    ax.set_yticks(np.arange(len(available)))
-    ax.set_xticklabels([c.replace("_", " ").title() for c in available], rotation=45, ha="right")
-    ax.set_yticklabels([c.replace("_", " ").title() for c in available])
-    for row in range(len(available)):
-        for col in range(len(available)):
-            ax.text(col, row, f"{corr.iloc[row, col]:.2f}", ha="center", va="center", fontsize=8)
-    ax.set_title("Metric Correlation Heatmap")
+    ax.set_xticks(np.arange(len(corr.columns)))
+    ax.set_yticks(np.arange(len(corr.index)))
+    ax.set_xticklabels([c.replace("_", " ").title() for c in corr.columns], rotation=45, ha="right")
+    ax.set_yticklabels([c.replace("_", " ").title() for c in corr.index])
+    if corr.size <= HEATMAP_LABEL_MAX_CELLS:
+        cell_labels(ax, corr.to_numpy(), "{:.2f}", fontsize=8)
+    ax.set_title(title)
     fig.colorbar(image, ax=ax, shrink=0.8)
     return fig
 
 
+def cell_labels(ax: Axes, values: np.ndarray, fmt: str, fontsize: float) -> PathCollection:
+    """
+    Write fmt.format(value) centred on each cell of a matrix drawn with
+    imshow, as one collection of glyph outlines rather than a Text artist
+    per cell.  Each distinct label is laid out once.
+    """
+    prop = FontProperties(size=fontsize)
+    glyphs: dict[str, matplotlib.path.Path] = {}
+    paths, offsets = [], []
+    for (row, col), value in np.ndenumerate(values):
+        label = fmt.format(value)
+        if label not in glyphs:
+            path = TextPath((0, 0), label, prop=prop)
+            (x0, y0), (x1, y1) = path.get_extents().get_points()
+            glyphs[label] = path.transformed(Affine2D().translate(-(x0 + x1) / 2, -(y0 + y1) / 2))
+        paths.append(glyphs[label])
+        offsets.append((col, row))
+    # Glyphs are sized in points; size 1 scales them by dpi / 72 when drawn.
+    labels = PathCollection(paths, sizes=[1], offsets=offsets, offset_transform=ax.transData,
+                            transform=IdentityTransform(), facecolors=matplotlib.rcParams["text.color"],
+                            edgecolors="none")
+    ax.add_collection(labels, autolim=False)
+    return labels
+
+
 def plot_distribution_histograms(df: pd.DataFrame) -> Optional[Figure]:
     columns = [
         "men",
@@ -1844,14 +3750,14 @@ def plot_distribution_histograms(df: pd.DataFrame) -> Optional[Figure]:
 def plot_attendance_moving_average(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["total_attendance"]) or len(df) < 2:
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     window = min(4, max(2, len(df) // 3 or 2))
     moving = df["total_attendance"].rolling(window=window, min_periods=1).mean()
     fig, ax = plt.subplots(figsize=(11, 5))
-    ax.plot(labels, df["total_attendance"], marker="o", label="Actual")
-    ax.plot(labels, moving, marker="s", linewidth=2.2, label=f"{window}-Week Moving Average")
+    plot_time_series(ax, x, df["total_attendance"], marker="o", label="Actual")
+    plot_time_series(ax, x, moving, marker="s", linewidth=2.2, label=f"{window}-Week Moving Average")
     configure_axes(ax, "Attendance Moving Average", "Attendance")
-    ax.tick_params(axis="x", rotation=25)
+    format_time_axis(ax, x)
     ax.legend()
     return fig
 
@@ -1880,16 +3786,16 @@ def plot_attendance_forecast(df: pd.DataFrame) -> Optional[Figure]:
 def plot_summary_dashboard(df: pd.DataFrame) -> Optional[Figure]:
     if not has_data(df, ["total_attendance", "total_income"]):
         return None
-    labels = date_labels(df)
+    x = time_axis(df)
     fig, axes = plt.subplots(2, 2, figsize=(13, 8))
 
-    axes[0, 0].plot(labels, df["total_attendance"], marker="o", color="#2563eb")
+    plot_time_series(axes[0, 0], x, df["total_attendance"], marker="o", color="#2563eb")
     configure_axes(axes[0, 0], "Attendance", "Count")
-    axes[0, 0].tick_params(axis="x", rotation=25)
+    format_time_axis(axes[0, 0], x)
 
-    axes[0, 1].plot(labels, df["total_income"], marker="s", color="#16a34a")
+    plot_time_series(axes[0, 1], x, df["total_income"], marker="s", color="#16a34a")
     configure_axes(axes[0, 1], "Income", "Amount")
-    axes[0, 1].tick_params(axis="x", rotation=25)
+    format_time_axis(axes[0, 1], x)
 
     attendance_cols = [c for c in ATTENDANCE_PARTS if has_data(df, [c])]
     attendance_totals = [df[c].sum() for c in attendance_cols]
@@ -1918,6 +3824,8 @@ class GraphSpec:
     filename: str
     builder: GraphBuilder
     description: str
+    # Data columns the builder reads; derived ones are computed for it on demand.
+    columns: tuple[str, ...]
 
 
 GRAPH_SPECS: dict[str, GraphSpec] = {
@@ -1928,6 +3836,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "total_attendance_trend.png",
         plot_total_attendance_trend,
         "Line chart of app-style total attendance over time.",
+        ("week_start_date", "total_attendance"),
     ),
     "demographic_trends": GraphSpec(
         "demographic_trends",
@@ -1936,6 +3845,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "demographic_trends.png",
         plot_demographic_trends,
         "Multi-line weekly trend for attendance groups.",
+        ("week_start_date", "men", "women", "youth", "children", "sunday_home_church"),
     ),
     "attendance_by_group": GraphSpec(
         "attendance_by_group",
@@ -1944,6 +3854,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "attendance_by_group.png",
         plot_attendance_by_group,
         "Grouped bar chart for Men/Women/Youth/Children/Home Church.",
+        ("week_start_date", "men", "women", "youth", "children", "sunday_home_church"),
     ),
     "attendance_distribution": GraphSpec(
         "attendance_distribution",
@@ -1952,6 +3863,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "attendance_distribution.png",
         plot_attendance_distribution,
         "Pie chart of aggregate attendance mix.",
+        ("men", "women", "youth", "children", "sunday_home_church"),
     ),
     "attendance_growth": GraphSpec(
         "attendance_growth",
@@ -1960,6 +3872,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "attendance_growth.png",
         plot_attendance_growth,
         "Week-over-week attendance growth percentage.",
+        ("week_start_date", "attendance_growth"),
     ),
     "adult_vs_young": GraphSpec(
         "adult_vs_young",
@@ -1968,6 +3881,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "adult_vs_young.png",
         plot_adult_vs_young,
         "Grouped bar chart of adults against youth and children.",
+        ("week_start_date", "adult_attendance", "young_attendance"),
     ),
     "demographic_percentage_trends": GraphSpec(
         "demographic_percentage_trends",
@@ -1976,6 +3890,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "demographic_percentage_trends.png",
         plot_demographic_percentage_trends,
         "Weekly percentage share of Sabbath attendance groups.",
+        ("week_start_date", "men_pct", "women_pct", "youth_pct", "children_pct"),
     ),
     "average_demographic_percentage": GraphSpec(
         "average_demographic_percentage",
@@ -1984,6 +3899,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "average_demographic_percentage.png",
         plot_average_demographic_percentage,
         "Average percentage share for Men/Women/Youth/Children.",
+        ("men_pct", "women_pct", "youth_pct", "children_pct"),
     ),
     "sabbath_school_trend": GraphSpec(
         "sabbath_school_trend",
@@ -1992,6 +3908,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "sabbath_school_trend.png",
         plot_sabbath_school_trend,
         "Trend for optional Sabbath School attendance.",
+        ("week_start_date", "sabbath_school_attendance"),
     ),
     "visitors_trend": GraphSpec(
         "visitors_trend",
@@ -2000,6 +3917,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "visitors_trend.png",
         plot_visitors_trend,
         "Weekly visitor counts when available.",
+        ("week_start_date", "visitors_count"),
     ),
     "ambassadors_trend": GraphSpec(
         "ambassadors_trend",
@@ -2008,6 +3926,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "ambassadors_trend.png",
         plot_ambassadors_trend,
         "Weekly ambassadors attendance when available.",
+        ("week_start_date", "ambassadors_attendance"),
     ),
     "tithe_offerings_trend": GraphSpec(
         "tithe_offerings_trend",
@@ -2016,6 +3935,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "tithe_offerings_trend.png",
         plot_tithe_offerings_trend,
         "Line chart comparing tithe and offerings over time.",
+        ("week_start_date", "tithe", "offerings"),
     ),
     "income_composition": GraphSpec(
         "income_composition",
@@ -2024,6 +3944,10 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "income_composition.png",
         plot_income_composition,
         "Stacked area chart of giving streams.",
+        (
+            "week_start_date", "tithe", "offerings", "emergency_collection", "planned_collection",
+            "mission_offering", "local_church_budget",
+        ),
     ),
     "income_distribution": GraphSpec(
         "income_distribution",
@@ -2032,6 +3956,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "income_distribution.png",
         plot_income_distribution,
         "Pie chart of aggregate income mix.",
+        ("tithe", "offerings", "emergency_collection", "planned_collection", "mission_offering", "local_church_budget"),
     ),
     "income_vs_attendance": GraphSpec(
         "income_vs_attendance",
@@ -2040,6 +3965,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "income_vs_attendance.png",
         plot_income_vs_attendance_dual,
         "Dual-axis trend for attendance and income.",
+        ("week_start_date", "total_attendance", "total_income"),
     ),
     "tithe_vs_offerings_week": GraphSpec(
         "tithe_vs_offerings_week",
@@ -2048,6 +3974,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "tithe_vs_offerings_week.png",
         lambda df: pairwise_bar(df, "tithe", "offerings", "Tithe vs Offerings per Week"),
         "Grouped bar comparison of tithe and offerings.",
+        ("week_start_date", "tithe", "offerings"),
     ),
     "regular_vs_total_income": GraphSpec(
         "regular_vs_total_income",
@@ -2056,6 +3983,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "regular_vs_total_income.png",
         plot_regular_vs_total_income,
         "Grouped bar comparison of regular income and total income.",
+        ("week_start_date", "regular_income", "total_income"),
     ),
     "income_growth": GraphSpec(
         "income_growth",
@@ -2064,6 +3992,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "income_growth.png",
         plot_income_growth,
         "Week-over-week total income growth percentage.",
+        ("week_start_date", "income_growth"),
     ),
     "per_capita_metrics": GraphSpec(
         "per_capita_metrics",
@@ -2072,6 +4001,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "per_capita_metrics.png",
         plot_per_capita_metrics,
         "Income, tithe, and offerings per attendee.",
+        ("week_start_date", "income_per_attendee", "tithe_per_attendee", "offerings_per_attendee"),
     ),
     "tithe_per_attendee": GraphSpec(
         "tithe_per_attendee",
@@ -2080,6 +4010,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "tithe_per_attendee.png",
         plot_tithe_per_attendee,
         "Bar chart of tithe divided by total attendance.",
+        ("week_start_date", "tithe_per_attendee"),
     ),
     "regular_income_per_adult": GraphSpec(
         "regular_income_per_adult",
@@ -2088,6 +4019,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "regular_income_per_adult.png",
         plot_regular_income_per_adult,
         "Bar chart of tithe plus offerings per adult attendee.",
+        ("week_start_date", "regular_income_per_adult"),
     ),
     "ratio_trends": GraphSpec(
         "ratio_trends",
@@ -2096,6 +4028,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "ratio_trends.png",
         plot_ratio_trends,
         "Men:Women, Adult:Young, and Tithe:Offerings ratios.",
+        ("week_start_date", "men_women_ratio", "adult_young_ratio", "tithe_offerings_ratio"),
     ),
     "baptisms_trend": GraphSpec(
         "baptisms_trend",
@@ -2104,6 +4037,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "baptisms_trend.png",
         plot_baptisms_trend,
         "Weekly baptism counts when available.",
+        ("week_start_date", "baptisms"),
     ),
     "holy_communion_trend": GraphSpec(
         "holy_communion_trend",
@@ -2112,6 +4046,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "holy_communion_trend.png",
         plot_holy_communion_trend,
         "Holy Communion attendance when available.",
+        ("week_start_date", "holy_communion"),
     ),
     "baptisms_vs_holy_communion": GraphSpec(
         "baptisms_vs_holy_communion",
@@ -2120,6 +4055,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "baptisms_vs_holy_communion.png",
         plot_baptisms_vs_holy_communion,
         "Grouped weekly event-count comparison.",
+        ("week_start_date", "baptisms", "holy_communion"),
     ),
     "holy_communion_expected_vs_attended": GraphSpec(
         "holy_communion_expected_vs_attended",
@@ -2128,6 +4064,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "holy_communion_expected_vs_attended.png",
         plot_holy_communion_expected_vs_attended,
         "Grouped comparison of holy communion expected vs attended.",
+        ("week_start_date", "holy_communion", "holy_communion_expected"),
     ),
     "board_business_meeting_trend": GraphSpec(
         "board_business_meeting_trend",
@@ -2136,6 +4073,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "board_business_meeting_trend.png",
         plot_board_business_meeting_trend,
         "Weekly board/business meeting attendance when available.",
+        ("week_start_date", "board_business_meeting_attendance"),
     ),
     "board_business_meeting_expected_vs_attended": GraphSpec(
         "board_business_meeting_expected_vs_attended",
@@ -2144,6 +4082,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "board_business_meeting_expected_vs_attended.png",
         plot_board_business_meeting_expected_vs_attended,
         "Grouped bar comparison of expected vs attended board/business meetings.",
+        ("week_start_date", "board_business_meeting_attendance", "board_business_meeting_expected"),
     ),
     "attendance_income_scatter": GraphSpec(
         "attendance_income_scatter",
@@ -2152,6 +4091,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "attendance_income_scatter.png",
         plot_attendance_income_scatter,
         "Scatter plot with trendline.",
+        ("total_attendance", "total_income"),
     ),
     "men_vs_tithe": GraphSpec(
         "men_vs_tithe",
@@ -2160,6 +4100,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "men_vs_tithe.png",
         lambda df: dual_axis(df, "men", "tithe", "Men vs Tithe over Time"),
         "Dual-axis chart comparing men attendance and tithe.",
+        ("week_start_date", "men", "tithe"),
     ),
     "women_vs_offerings": GraphSpec(
         "women_vs_offerings",
@@ -2168,6 +4109,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "women_vs_offerings.png",
         lambda df: dual_axis(df, "women", "offerings", "Women vs Offerings over Time"),
         "Dual-axis chart comparing women attendance and offerings.",
+        ("week_start_date", "women", "offerings"),
     ),
     "correlation_heatmap": GraphSpec(
         "correlation_heatmap",
@@ -2176,6 +4118,10 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "correlation_heatmap.png",
         plot_correlation_heatmap,
         "Correlation matrix heatmap for available numeric metrics.",
+        (
+            "men", "women", "youth", "children", "sunday_home_church", "total_attendance", "tithe", "offerings",
+            "total_income", "baptisms", "holy_communion", "sabbath_school_attendance",
+        ),
     ),
     "distribution_histograms": GraphSpec(
         "distribution_histograms",
@@ -2184,6 +4130,10 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "distribution_histograms.png",
         plot_distribution_histograms,
         "Histogram grid for attendance and finance metrics.",
+        (
+            "men", "women", "youth", "children", "sunday_home_church", "total_attendance", "tithe", "offerings",
+            "total_income",
+        ),
     ),
     "attendance_moving_average": GraphSpec(
         "attendance_moving_average",
@@ -2192,6 +4142,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "attendance_moving_average.png",
         plot_attendance_moving_average,
         "Actual attendance with a rolling average.",
+        ("week_start_date", "total_attendance"),
     ),
     "attendance_forecast": GraphSpec(
         "attendance_forecast",
@@ -2200,6 +4151,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "attendance_forecast.png",
         plot_attendance_forecast,
         "Simple four-week linear attendance forecast.",
+        ("week_start_date", "total_attendance"),
     ),
     "summary_dashboard": GraphSpec(
         "summary_dashboard",
@@ -2208,6 +4160,11 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "summary_dashboard.png",
         plot_summary_dashboard,
         "Compact 2x2 dashboard of attendance, income, and mix charts.",
+        (
+            "week_start_date", "total_attendance", "total_income", "men", "women", "youth", "children",
+            "sunday_home_church", "tithe", "offerings", "emergency_collection", "planned_collection",
+            "mission_offering", "local_church_budget",
+        ),
     ),
     # ── Presentation-grade graphs (church palette) ────────────────────────
     "sabbath_school_groups": GraphSpec(
@@ -2217,6 +4174,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "sabbath_school_groups.png",
         plot_sabbath_school_groups,
         "Grouped bar for each SS group × session; reads SABBATH SCHOOL DATA*.xlsx.",
+        ("week_start_date", "sabbath_school_attendance"),
     ),
     "sabbath_school_totals_trend": GraphSpec(
         "sabbath_school_totals_trend",
@@ -2225,6 +4183,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "sabbath_school_totals_trend.png",
         plot_sabbath_school_totals_trend,
         "Morning/afternoon compound totals trend from SABBATH SCHOOL DATA*.xlsx.",
+        ("week_start_date", "sabbath_school_attendance"),
     ),
     "home_church_attendance": GraphSpec(
         "home_church_attendance",
@@ -2233,6 +4192,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "home_church_attendance.png",
         plot_home_church_attendance,
         "Horizontal ranked bar for each home church total; reads HOME CHURCH DATA*.xlsx.",
+        (),
     ),
     "home_church_stacked": GraphSpec(
         "home_church_stacked",
@@ -2241,6 +4201,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "home_church_stacked.png",
         plot_home_church_stacked,
         "Stacked bar per home church (Adults/Youth/Ambassadors/Children/Visitors).",
+        (),
     ),
     "business_meeting_per_home_church": GraphSpec(
         "business_meeting_per_home_church",
@@ -2249,6 +4210,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "business_meeting_per_home_church.png",
         plot_business_meeting_per_home_church,
         "Grouped bar: business meeting attended vs expected per home church.",
+        ("week_start_date", "board_business_meeting_attendance", "board_business_meeting_expected"),
     ),
     "active_leaders_board": GraphSpec(
         "active_leaders_board",
@@ -2257,6 +4219,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "active_leaders_board.png",
         plot_active_leaders_board,
         "Monthly board meeting attended vs expected; reads BOARD MEETING*.xlsx.",
+        ("week_start_date", "board_business_meeting_attendance", "board_business_meeting_expected"),
     ),
     "church_composition_donut": GraphSpec(
         "church_composition_donut",
@@ -2265,6 +4228,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "church_composition_donut.png",
         plot_church_composition_donut,
         "Donut chart of average weekly Men/Women/Youth/Children split.",
+        ("men", "women", "youth", "children"),
     ),
     "demographic_trends_styled": GraphSpec(
         "demographic_trends_styled",
@@ -2273,6 +4237,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "demographic_trends_styled.png",
         plot_demographic_trends_styled,
         "Multi-line weekly attendance trend with church palette and fill.",
+        ("week_start_date", "men", "women", "youth", "children"),
     ),
     "financial_trend_styled": GraphSpec(
         "financial_trend_styled",
@@ -2281,6 +4246,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "financial_trend_styled.png",
         plot_financial_trend_styled,
         "Tithe & offerings trend with fill under curves, church palette.",
+        ("week_start_date", "tithe", "offerings"),
     ),
     "holy_communion_per_home_church": GraphSpec(
         "holy_communion_per_home_church",
@@ -2289,6 +4255,7 @@ GRAPH_SPECS: dict[str, GraphSpec] = {
         "holy_communion_per_home_church.png",
         plot_holy_communion_per_home_church,
         "Grouped bar: holy communion attended vs expected per home church.",
+        ("week_start_date", "holy_communion", "holy_communion_expected"),
     ),
 }
 
@@ -2336,6 +4303,20 @@ def parse_graph_selection(graph_values: Optional[Sequence[str]], group: Optional
     return deduped
 
 
+def required_columns(graph_ids: Iterable[str], tables: bool, export_clean: bool) -> Optional[set[str]]:
+    """
+    The columns a run reads: those of its graphs, plus the exported ones with
+    --export-clean.  None (every column) when the summary tables are written,
+    since they cover every numeric column.
+    """
+    if tables:
+        return None
+    columns = {column for graph_id in graph_ids for column in GRAPH_SPECS[graph_id].columns}
+    if export_clean:
+        columns.update(APP_WEEKLY_COLUMNS, OPTIONAL_METADATA_COLUMNS)
+    return columns
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TUI HELPERS  — safe input, colour, box drawing
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -2829,6 +4810,289 @@ def graph_browser(df: pd.DataFrame, settings: dict) -> Optional[list[str]]:
 # GENERATE + RESULTS SCREEN
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class RenderCache:
+    """
+    Graphs already rendered into an output directory, so an unchanged graph
+    is not built again.
+
+    A graph's fingerprint covers its id and file name, its builder's source
+    and that of this module (for the helpers builders share), the DPI, the
+    matplotlib and RENDER_VERSION versions, the --max-points budget and a
+    hash of only the columns its spec reads (plus the data/ workbooks for
+    the presentation graphs).  manifest.json in RENDER_CACHE_DIR maps each graph to its
+    fingerprint and PNG path, or the reason its builder skipped it; the
+    pickled figure next to it redraws the graph's graphs.pdf page.  Failed
+    graphs are not remembered, so they are tried again on the next run.  The
+    manifest also lists the pages of the last graphs.pdf, which is kept as it
+    is when a run would write the same pages.  With force, nothing is reused
+    but the manifest is still rewritten.
+    """
+
+    def __init__(self, out_dir: Path, df: pd.DataFrame, dpi: int, force: bool = False, svg: bool = False):
+        self.out_dir = out_dir
+        self.directory = out_dir / RENDER_CACHE_DIR
+        self.df = df
+        self.dpi = dpi
+        self.force = force
+        self.svg = svg
+        self._digests: dict[str, str] = {}
+        try:
+            self._module = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+        except OSError:
+            self._module = ""
+        try:
+            self.manifest: dict = json.loads((self.directory / "manifest.json").read_text())
+        except Exception:
+            self.manifest = {}
+        self.manifest.setdefault("graphs", {})
+        self.manifest.setdefault("pdf", [])
+
+    def _column_digest(self, column: str) -> str:
+        if column not in self._digests:
+            # Through the original dtypes, so --compact does not change the fingerprint.
+            frame = expand_frame(self.df, [column])
+            if column in frame.columns:
+                series = frame[column]
+                values = pd.util.hash_pandas_object(series, index=False).to_numpy()
+                self._digests[column] = hashlib.sha1(str(series.dtype).encode() + values.tobytes()).hexdigest()
+            else:
+                self._digests[column] = "missing"
+        return self._digests[column]
+
+    def fingerprint(self, graph_id: str) -> str:
+        spec = GRAPH_SPECS[graph_id]
+        try:
+            source = inspect.getsource(spec.builder)
+        except (OSError, TypeError):
+            source = spec.builder.__qualname__
+        parts = [graph_id, spec.group, spec.filename, hashlib.sha1(source.encode()).hexdigest(), self._module,
+                 self.dpi, matplotlib.__version__, RENDER_VERSION, _max_points, len(self.df)]
+        parts += [f"{column}={self._column_digest(column)}" for column in spec.columns]
+        if spec.group == "presentation":
+            parts += [file_signature(path) for path in sorted(_data_dir().glob("*.xlsx"))]
+        return hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+
+    def figure_path(self, graph_id: str) -> Path:
+        return self.directory / f"{graph_id}.pickle"
+
+    def lookup(self, graph_id: str) -> Optional[tuple[str, str]]:
+        """
+        ("cached", PNG path) or ("skipped", reason) if graph_id is unchanged
+        since its last run, else None.
+        """
+        entry = self.manifest["graphs"].get(graph_id)
+        if self.force or not entry or entry["fingerprint"] != self.fingerprint(graph_id):
+            return None
+        if entry["status"] == "skipped":
+            return "skipped", entry["reason"]
+        if entry["status"] != "ok":
+            return None
+        path = self.out_dir / entry["path"]
+        if not path.is_file() or not self.figure_path(graph_id).is_file():
+            return None
+        if self.svg and not path.with_suffix(".svg").is_file():
+            return None
+        return "cached", str(path)
+
+    def pdf_pages(self, graph_ids: Sequence[str]) -> Optional[list[list[str]]]:
+        """The [graph id, fingerprint] pages graphs.pdf would get, or None if a graph is not cached."""
+        pages = []
+        for graph_id in graph_ids:
+            found = self.lookup(graph_id)
+            if found is None:
+                return None
+            if found[0] == "cached":
+                pages.append([graph_id, self.fingerprint(graph_id)])
+        return pages
+
+    def pdf_unchanged(self, graph_ids: Sequence[str]) -> bool:
+        """Whether graphs.pdf already holds exactly the pages graph_ids would produce."""
+        return (self.out_dir / "graphs.pdf").is_file() and self.pdf_pages(graph_ids) == self.manifest["pdf"]
+
+    def record_pdf(self, graph_ids: Sequence[str]) -> None:
+        self.manifest["pdf"] = self.pdf_pages(graph_ids) or []
+
+    def figure(self, graph_id: str) -> Figure:
+        with open(self.figure_path(graph_id), "rb") as handle:
+            return pickle.load(handle)
+
+    def record(self, graph_id: str, status: str, detail: str) -> None:
+        """
+        Remember a graph's _render_graph status and its PNG path or reason
+        (detail).  An "error" forgets the graph instead.
+        """
+        if status == "error":
+            self.manifest["graphs"].pop(graph_id, None)
+            return
+        entry = {"fingerprint": self.fingerprint(graph_id), "status": status}
+        if status == "ok":
+            entry["path"] = Path(detail).relative_to(self.out_dir).as_posix()
+        else:
+            entry["reason"] = detail
+        self.manifest["graphs"][graph_id] = entry
+
+    def save(self) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entry = self.directory / "manifest.json"
+            temp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+            temp.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+            os.replace(temp, entry)
+        except Exception as exc:
+            log(f"Warning: could not write the render cache manifest: {exc}")
+
+
+def _render_graph(df: pd.DataFrame, graph_id: str, out_dir: Path, pdf: Optional[PdfPages],
+                  dpi: int, figure_path: Optional[Path] = None, svg: bool = False,
+                  writer: Optional[FigureWriter] = None) -> tuple[str, str, Optional[Figure]]:
+    """
+    Build and save one graph (see save_figure) as (status, path or reason,
+    figure).  status is "ok", "skipped" or "error"; the figure, already
+    closed, is only returned for "ok", and is also pickled to figure_path
+    when one is given.
+    """
+    spec = GRAPH_SPECS[graph_id]
+    try:
+        with TIMINGS.span("build", graph_id):
+            fig = spec.builder(expand_frame(df, spec.columns))
+    except Exception as exc:
+        plt.close("all")
+        return "error", str(exc), None
+    if fig is None:
+        return "skipped", "Required data not available", None
+    with TIMINGS.span("save", graph_id):
+        path = save_figure(fig, spec, out_dir, pdf, dpi, svg, writer)
+    plt.close(fig)
+    if figure_path is not None:
+        try:
+            figure_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = figure_path.with_name(f"{figure_path.name}.{os.getpid()}.tmp")
+            with open(temp, "wb") as handle:
+                pickle.dump(fig, handle)
+            os.replace(temp, figure_path)
+        except Exception as exc:
+            log(f"Warning: could not cache {spec.graph_id}: {exc}")
+    return "ok", str(path), fig
+
+
+# The frame every --render-jobs worker renders from, set once by _init_render_worker.
+_RENDER_FRAME: Optional[pd.DataFrame] = None
+
+
+def _init_render_worker(df: pd.DataFrame, rc: dict, max_points: int) -> None:
+    global _RENDER_FRAME
+    matplotlib.use("Agg")
+    matplotlib.rcParams.update(rc)
+    set_max_points(max_points)
+    _RENDER_FRAME = df
+    WORKBOOKS.clear()
+
+
+def _render_in_worker(graph_id: str, out_dir: Path, dpi: int, figure_path: Optional[Path], svg: bool,
+                      keep_figure: bool) -> tuple[str, str, Optional[Figure], int, int, list[dict]]:
+    """_render_graph on the worker's frame, plus the WORKBOOKS hits and misses and the timing spans it caused."""
+    hits, misses, mark = WORKBOOKS.hits, WORKBOOKS.misses, len(TIMINGS.spans)
+    status, detail, fig = _render_graph(_RENDER_FRAME, graph_id, out_dir, None, dpi, figure_path, svg)
+    return (status, detail, fig if keep_figure else None, WORKBOOKS.hits - hits, WORKBOOKS.misses - misses,
+            TIMINGS.spans[mark:])
+
+
+def _print_progress(done: int, total: int, title: str, current: Optional[int] = None) -> None:
+    """Redraw the progress line: done of total graphs finished, showing current (default done) and title."""
+    filled = int(done / total * 40)
+    bar = f"{GREEN}{'█' * filled}{DIM}{'░' * (40 - filled)}{RESET}"
+    print(f"\r  [{bar}]  {done if current is None else current}/{total}  {title[:35]:<35}", end="", flush=True)
+
+
+def render_graphs(df: pd.DataFrame, graph_ids: list[str], out_dir: Path, pdf: Optional[PdfPages],
+                  dpi: int, jobs: int = 1, cache: Optional[RenderCache] = None,
+                  svg: bool = False, progress: bool = True) -> list[tuple[str, str, str]]:
+    """
+    Render graph_ids, returning (title, status, path or reason) in their order.
+    Graphs the cache holds unchanged are not built again: a rendered one has
+    status "cached" and its PDF page is drawn from the cached figure.  The
+    others are rendered here, with their files written by a FigureWriter, or
+    with jobs > 1 built and saved in a process pool (Agg backend, df sent
+    once per worker).  The figures come back to this process for the PDF,
+    whose pages stay in graph_ids order.  progress=False leaves the
+    progress line alone, for --by partitions.
+    """
+    show_progress = _print_progress if progress else (lambda *args: None)
+    total = len(graph_ids)
+    results: list[Optional[tuple[str, str, str]]] = [None] * total
+    for i, gid in enumerate(graph_ids):
+        found = cache.lookup(gid) if cache is not None else None
+        if found is not None:
+            results[i] = (GRAPH_SPECS[gid].title, *found)
+
+    def figure_path(gid: str) -> Optional[Path]:
+        return cache.figure_path(gid) if cache is not None else None
+
+    def finish(i: int, status: str, detail: str) -> None:
+        results[i] = (GRAPH_SPECS[graph_ids[i]].title, status, detail)
+        if cache is not None:
+            cache.record(graph_ids[i], status, detail)
+
+    todo = [i for i in range(total) if results[i] is None]
+    if jobs <= 1 or len(todo) <= 1:
+        writer = FigureWriter()
+        try:
+            for i, gid in enumerate(graph_ids):
+                show_progress(i, total, GRAPH_SPECS[gid].title, i + 1)
+                if results[i] is not None:
+                    if pdf is not None and results[i][1] == "cached":
+                        pdf.savefig(cache.figure(gid))
+                    continue
+                status, detail, _ = _render_graph(df, gid, out_dir, pdf, dpi, figure_path(gid), svg, writer)
+                finish(i, status, detail)
+        finally:
+            failed = writer.close()
+        for gid, exc in failed.items():
+            finish(graph_ids.index(gid), "error", f"could not write: {exc}")
+        return results
+
+    rc = {key: value for key, value in matplotlib.rcParams.items() if not key.startswith("backend")}
+    figures: dict[int, Figure] = {}
+    next_page = 0
+
+    def add_pages() -> None:
+        # Add each PDF page once every graph before it has finished.
+        nonlocal next_page
+        while next_page < total and results[next_page] is not None:
+            fig = figures.pop(next_page, None)
+            if fig is None and pdf is not None and results[next_page][1] == "cached":
+                fig = cache.figure(graph_ids[next_page])
+            if fig is not None and pdf is not None:
+                pdf.savefig(fig)
+            next_page += 1
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(todo)), initializer=_init_render_worker,
+                             initargs=(df, rc, _max_points)) as pool:
+        index_of = {pool.submit(_render_in_worker, graph_ids[i], out_dir, dpi, figure_path(graph_ids[i]), svg,
+                                pdf is not None): i
+                    for i in todo}
+        pending = set(index_of)
+        show_progress(total - len(pending), total, "")
+        add_pages()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = index_of[future]
+                try:
+                    status, detail, fig, hits, misses, spans = future.result()
+                except Exception as exc:
+                    status, detail, fig, hits, misses, spans = "error", str(exc), None, 0, 0, []
+                WORKBOOKS.hits += hits
+                WORKBOOKS.misses += misses
+                TIMINGS.extend(spans)
+                finish(i, status, detail)
+                if fig is not None:
+                    figures[i] = fig
+                show_progress(total - len(pending), total, GRAPH_SPECS[graph_ids[i]].title)
+            add_pages()
+    return results
+
+
 def run_and_report(df: pd.DataFrame, graph_ids: list[str], settings: dict) -> int:
     """Generate the selected graphs and show a results summary screen."""
     out_dir  = Path(settings["output_dir"])
@@ -2836,14 +5100,15 @@ def run_and_report(df: pd.DataFrame, graph_ids: list[str], settings: dict) -> in
     dpi      = settings.get("dpi", 150)
     make_pdf = settings.get("pdf", False)
 
+    # In place, so columns computed for one bucket are kept for the next.
+    with TIMINGS.span("derive", "on demand"):
+        ensure_derived(df, required_columns(graph_ids, not settings.get("no_tables", False),
+                                            settings.get("export_clean", False)))
     if not settings.get("no_tables", False):
         save_stats_tables(df, out_dir)
 
     if settings.get("export_clean", False):
-        export_cols = [c for c in APP_WEEKLY_COLUMNS if c in df.columns]
-        export_cols += [c for c in OPTIONAL_METADATA_COLUMNS
-                        if c in df.columns and c not in export_cols]
-        df[export_cols].to_csv(out_dir / "normalized_data.csv", index=False)
+        export_clean_data(df, out_dir)
 
     clear()
     print_header(
@@ -2851,44 +5116,20 @@ def run_and_report(df: pd.DataFrame, graph_ids: list[str], settings: dict) -> in
         f"Saving to: {out_dir}  ·  DPI: {dpi}"
     )
 
-    pdf_obj: Optional[PdfPages] = PdfPages(str(out_dir / "graphs.pdf")) if make_pdf else None
-    generated, skipped = 0, 0
-    results: list[tuple[str, str, str]] = []   # (name, status, path/reason)
-
-    total = len(graph_ids)
-    for i, gid in enumerate(graph_ids, 1):
-        spec = GRAPH_SPECS[gid]
-        # progress bar
-        filled = int((i - 1) / total * 40)
-        bar = f"{GREEN}{'█' * filled}{DIM}{'░' * (40 - filled)}{RESET}"
-        print(f"\r  [{bar}]  {i}/{total}  {spec.title[:35]:<35}", end="", flush=True)
-
-        try:
-            fig = spec.builder(df)
-        except Exception as exc:
-            skipped += 1
-            results.append((spec.title, "error", str(exc)))
-            plt.close("all")
-            continue
-
-        if fig is None:
-            skipped += 1
-            results.append((spec.title, "skipped", "Required data not available"))
-            continue
-
-        path = save_figure(fig, spec, out_dir, pdf_obj, dpi)
-        plt.close(fig)
-        generated += 1
-        results.append((spec.title, "ok", str(path)))
-
-    if pdf_obj:
-        pdf_obj.close()
+    WORKBOOKS.clear()
+    set_max_points(settings.get("max_points", DEFAULT_MAX_POINTS))
+    # (name, status, path/reason)
+    results = generate_graphs(df, graph_ids, out_dir, settings, settings.get("render_jobs", 1))
+    generated = sum(status == "ok" for _, status, _ in results)
+    cached = sum(status == "cached" for _, status, _ in results)
+    skipped = len(results) - generated - cached
 
     print(f"\r  {' ' * (TERM_WIDTH - 2)}\r", end="")   # clear progress line
 
     # ── results summary ───────────────────────────────────────────────────────
     print_section("Results")
     ok_results   = [(n, p) for n, s, p in results if s == "ok"]
+    cached_results = [(n, p) for n, s, p in results if s == "cached"]
     skip_results = [(n, r) for n, s, r in results if s == "skipped"]
     err_results  = [(n, r) for n, s, r in results if s == "error"]
 
@@ -2898,6 +5139,12 @@ def run_and_report(df: pd.DataFrame, graph_ids: list[str], settings: dict) -> in
             short = path.replace(str(out_dir), "").lstrip("/\\")
             print(f"    {GREEN}✓{RESET}  {name:<45}  {DIM}{short}{RESET}")
 
+    if cached_results:
+        print(f"\n  {BOLD}{CYAN}Cached  ({len(cached_results)}){RESET}")
+        for name, path in cached_results:
+            short = path.replace(str(out_dir), "").lstrip("/\\")
+            print(f"    {CYAN}≡{RESET}  {name:<45}  {DIM}{short}{RESET}")
+
     if skip_results:
         print(f"\n  {BOLD}{YELLOW}Skipped  ({len(skip_results)}){RESET}")
         for name, reason in skip_results:
@@ -2911,49 +5158,694 @@ def run_and_report(df: pd.DataFrame, graph_ids: list[str], settings: dict) -> in
     print_section("Summary")
     print_status("Data rows loaded",  str(len(df)))
     print_status("Graphs generated",  str(generated), GREEN)
+    if cached:
+        print_status("Graphs cached", str(cached), CYAN)
     if skipped:
         print_status("Graphs skipped", str(skipped), YELLOW)
+    if WORKBOOKS.hits or WORKBOOKS.misses:
+        print_status("Workbook registry", f"{WORKBOOKS.hits} hit(s), {WORKBOOKS.misses} miss(es)")
     print_status("Output folder",     str(out_dir.resolve()), CYAN)
     if make_pdf:
         print_status("PDF bundle",     str((out_dir / "graphs.pdf").resolve()), CYAN)
+    report_timings(settings)
+    print()
+    return 0 if generated + cached > 0 else 1
+
+
+def generate_graphs(df: pd.DataFrame, graph_ids: list[str], out_dir: Path, settings: dict, jobs: int = 1,
+                    progress: bool = True, label: str = "") -> list[tuple[str, str, str]]:
+    """render_graphs into out_dir through its RenderCache, writing graphs.pdf there with settings["pdf"]."""
+    dpi = settings.get("dpi", 150)
+    svg = settings.get("svg", False)
+    cache = RenderCache(out_dir, df, dpi, force=settings.get("force_render", False), svg=svg)
+    write_pdf = settings.get("pdf", False) and not cache.pdf_unchanged(graph_ids)
+    pdf_obj: Optional[PdfPages] = PdfPages(str(out_dir / "graphs.pdf")) if write_pdf else None
+    try:
+        with TIMINGS.span("render", label):
+            results = render_graphs(df, graph_ids, out_dir, pdf_obj, dpi, jobs, cache, svg, progress)
+    finally:
+        if pdf_obj:
+            with TIMINGS.span("pdf", label):
+                pdf_obj.close()
+            cache.record_pdf(graph_ids)
+        cache.save()
+    return results
+
+
+def partition_folder(by: str, value: object) -> str:
+    """Folder for one --by partition: church_<id>, the source file's stem, or no_<by> for rows without one."""
+    if value is None or pd.isna(value):
+        return f"no_{by}"
+    if by == "church_id":
+        number = pd.to_numeric(value, errors="coerce")
+        name = f"church_{int(number) if pd.notna(number) and float(number).is_integer() else value}"
+    else:
+        name = Path(str(value)).stem
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._") or by
+
+
+def split_frame(df: pd.DataFrame, by: str) -> list[tuple[str, pd.DataFrame]]:
+    """
+    (folder, rows) for each value of df[by], in sorted order with the rows
+    that have none last.  Rows keep df's order and attrs.  Folders that
+    would clash, such as two files with the same stem, get a numeric suffix.
+    """
+    codes, values = pd.factorize(df[by], sort=True)
+    order = np.argsort(codes, kind="stable")
+    groups = np.split(order, np.flatnonzero(np.diff(codes[order])) + 1)
+    partitions: list[tuple[str, pd.DataFrame]] = []
+    used: set[str] = set()
+    for positions in sorted(groups, key=lambda group: bool(codes[group[0]] < 0)):
+        code = codes[positions[0]]
+        folder = base = partition_folder(by, values[code] if code >= 0 else None)
+        suffix = 2
+        while folder in used:
+            folder, suffix = f"{base}_{suffix}", suffix + 1
+        used.add(folder)
+        partitions.append((folder, df.take(positions)))
+    return partitions
+
+
+def render_partition(df: pd.DataFrame, graph_ids: list[str], out_dir: Path,
+                     settings: dict) -> list[tuple[str, str, str]]:
+    """Summary tables and graph_ids for one --by partition, written to out_dir."""
+    with TIMINGS.span("partition", out_dir.name):
+        out_dir.mkdir(parents=True, exist_ok=True)
+        if not settings.get("no_tables", False):
+            save_stats_tables(df, out_dir)
+        return generate_graphs(df, graph_ids, out_dir, settings, progress=False, label=out_dir.name)
+
+
+def _render_partition_in_worker(df: pd.DataFrame, graph_ids: list[str], out_dir: Path,
+                                settings: dict) -> tuple[list[tuple[str, str, str]], int, int, list[dict]]:
+    """render_partition, plus the WORKBOOKS hits and misses and the timing spans it caused."""
+    hits, misses, mark = WORKBOOKS.hits, WORKBOOKS.misses, len(TIMINGS.spans)
+    results = render_partition(df, graph_ids, out_dir, settings)
+    return results, WORKBOOKS.hits - hits, WORKBOOKS.misses - misses, TIMINGS.spans[mark:]
+
+
+def render_partitions(partitions: list[tuple[str, pd.DataFrame]], graph_ids: list[str], out_dir: Path,
+                      settings: dict, jobs: int = 1) -> list[list[tuple[str, str, str]]]:
+    """
+    render_partition for each partition into out_dir/<folder>, returning
+    their results in partition order.  With jobs > 1 whole partitions are
+    rendered in a process pool (Agg backend), largest first; each
+    partition's rows are sent to the one worker that renders it.
+    """
+    total = len(partitions)
+    results: list[Optional[list[tuple[str, str, str]]]] = [None] * total
+    if jobs <= 1 or total <= 1:
+        for i, (folder, part) in enumerate(partitions):
+            _print_progress(i, total, folder, i + 1)
+            results[i] = render_partition(part, graph_ids, out_dir / folder, settings)
+        return results
+
+    rc = {key: value for key, value in matplotlib.rcParams.items() if not key.startswith("backend")}
+    with ProcessPoolExecutor(max_workers=min(jobs, total), initializer=_init_render_worker,
+                             initargs=(None, rc, _max_points)) as pool:
+        largest_first = sorted(range(total), key=lambda i: -len(partitions[i][1]))
+        index_of = {pool.submit(_render_partition_in_worker, partitions[i][1], graph_ids,
+                                out_dir / partitions[i][0], settings): i
+                    for i in largest_first}
+        pending = set(index_of)
+        _print_progress(0, total, "")
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = index_of[future]
+                try:
+                    part_results, hits, misses, spans = future.result()
+                except Exception as exc:
+                    part_results = [(GRAPH_SPECS[gid].title, "error", str(exc)) for gid in graph_ids]
+                    hits, misses, spans = 0, 0, []
+                WORKBOOKS.hits += hits
+                WORKBOOKS.misses += misses
+                TIMINGS.extend(spans)
+                results[i] = part_results
+                _print_progress(total - len(pending), total, partitions[i][0])
+    return results
+
+
+def write_batch_index(out_dir: Path, by: str, partitions: list[tuple[str, pd.DataFrame]],
+                      results: list[list[tuple[str, str, str]]]) -> Path:
+    """Write BATCH_INDEX in out_dir: a row per partition, then each partition's graphs, PDF and tables."""
+    def week(part: pd.DataFrame, first: bool) -> str:
+        if "week_start_date" not in part.columns:
+            return ""
+        dates = pd.to_datetime(part["week_start_date"], errors="coerce")
+        value = dates.min() if first else dates.max()
+        return "" if pd.isna(value) else f"{value:%Y-%m-%d}"
+
+    def href(path: Path) -> str:
+        return html.escape(quote(path.as_posix()))
+
+    title = html.escape(f"Church analysis by {by}")
+    summary, sections = [], []
+    for (folder, part), part_results in zip(partitions, results):
+        name = html.escape(folder)
+        done = [(graph_title, detail) for graph_title, status, detail in part_results if status in ("ok", "cached")]
+        summary.append(f'<tr><td><a href="#{name}">{name}</a></td><td>{len(part):,}</td>'
+                       f"<td>{week(part, True)}</td><td>{week(part, False)}</td>"
+                       f"<td>{len(done)} of {len(part_results)}</td></tr>")
+        links = [path for path in (Path(folder) / "graphs.pdf",
+                                   Path(folder) / "tables" / "summary_statistics.csv",
+                                   Path(folder) / "tables" / "correlation_matrix.csv")
+                 if (out_dir / path).is_file()]
+        lines = [f'<section id="{name}"><h2>{name}</h2>']
+        if links:
+            lines.append("<p>" + " · ".join(f'<a href="{href(path)}">{path.name}</a>' for path in links) + "</p>")
+        for graph_title, detail in done:
+            path = Path(folder) / Path(os.path.relpath(detail, out_dir / folder))
+            lines.append(f'<a href="{href(path)}"><img src="{href(path)}" alt="{html.escape(graph_title)}" '
+                         f'title="{html.escape(graph_title)}" loading="lazy"></a>')
+        missing = [(graph_title, status, detail) for graph_title, status, detail in part_results
+                   if status not in ("ok", "cached")]
+        if missing:
+            lines.append("<ul>" + "".join(f"<li>{html.escape(graph_title)}: {status}, {html.escape(detail)}</li>"
+                                          for graph_title, status, detail in missing) + "</ul>")
+        lines.append("</section>")
+        sections.append("\n".join(lines))
+
+    page = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; color: {C_NAVY}; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 2px 12px; text-align: left; }}
+img {{ width: 320px; margin: 4px; border: 1px solid #ddd; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>{len(partitions)} partition(s), written {datetime.now():%Y-%m-%d %H:%M}.</p>
+<table>
+<tr><th>{html.escape(by)}</th><th>Rows</th><th>First week</th><th>Last week</th><th>Graphs</th></tr>
+{chr(10).join(summary)}
+</table>
+{chr(10).join(sections)}
+</body>
+</html>
+"""
+    path = out_dir / BATCH_INDEX
+    path.write_text(page, encoding="utf-8")
+    return path
+
+
+def run_batch(df: pd.DataFrame, graph_ids: list[str], by: str, settings: dict) -> int:
+    """
+    --by: split df on one column and generate graph_ids (and the summary
+    tables) for each partition in its own folder, then write BATCH_INDEX.
+    The data is loaded and derived once for the whole batch.
+    """
+    out_dir = Path(settings["output_dir"])
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with TIMINGS.span("derive", "on demand"):
+        ensure_derived(df, required_columns(graph_ids, not settings.get("no_tables", False), False))
+    WORKBOOKS.clear()
+    set_max_points(settings.get("max_points", DEFAULT_MAX_POINTS))
+    with TIMINGS.span("split", by):
+        partitions = split_frame(df, by)
+
+    clear()
+    print_header(
+        "Generating Graphs…",
+        f"One folder per {by} in: {out_dir}  ·  DPI: {settings.get('dpi', 150)}"
+    )
+    with TIMINGS.span("batch", by):
+        results = render_partitions(partitions, graph_ids, out_dir, settings, settings.get("render_jobs", 1))
+    index = write_batch_index(out_dir, by, partitions, results)
+
+    print(f"\r  {' ' * (TERM_WIDTH - 2)}\r", end="")   # clear progress line
+
+    print_section("Results")
+    generated = cached = skipped = 0
+    for (folder, part), part_results in zip(partitions, results):
+        counts = {status: sum(s == status for _, s, _ in part_results) for status in ("ok", "cached")}
+        other = len(part_results) - counts["ok"] - counts["cached"]
+        generated, cached, skipped = generated + counts["ok"], cached + counts["cached"], skipped + other
+        mark = f"{GREEN}✓{RESET}" if counts["ok"] + counts["cached"] else f"{YELLOW}○{RESET}"
+        print(f"    {mark}  {folder:<30} {len(part):>8,} rows  "
+              f"{DIM}{counts['ok']} generated, {counts['cached']} cached, {other} skipped{RESET}")
+
+    print_section("Summary")
+    print_status("Data rows loaded",  str(len(df)))
+    print_status("Partitions",        f"{len(partitions)} by {by}")
+    print_status("Graphs generated",  str(generated), GREEN)
+    if cached:
+        print_status("Graphs cached", str(cached), CYAN)
+    if skipped:
+        print_status("Graphs skipped", str(skipped), YELLOW)
+    if WORKBOOKS.hits or WORKBOOKS.misses:
+        print_status("Workbook registry", f"{WORKBOOKS.hits} hit(s), {WORKBOOKS.misses} miss(es)")
+    print_status("Output folder",     str(out_dir.resolve()), CYAN)
+    print_status("Batch index",       str(index.resolve()), CYAN)
+    report_timings(settings)
     print()
-    return 0 if generated > 0 else 1
+    return 0 if generated + cached > 0 else 1
+
+
+def report_timings(settings: dict) -> None:
+    """Write settings["run_report"] and print --timings, at the end of a results screen."""
+    if settings.get("run_report"):
+        TIMINGS.write(Path(settings["run_report"]))
+        print_status("Run report",     str(Path(settings["run_report"]).resolve()), CYAN)
+    if settings.get("timings"):
+        print_timings()
+
+
+def print_timings() -> None:
+    """The slowest stages and graphs so far in this process (--timings)."""
+    print_section("Timings")
+    print(f"\n  {BOLD}Slowest stages{RESET}  {DIM}(nested stages are also counted in the stage around them){RESET}")
+    print(f"    {DIM}{'stage':<20} {'spans':>6} {'wall s':>9} {'CPU s':>9}{RESET}")
+    for stage, spans, wall, cpu in TIMINGS.stages()[:TIMINGS_TOP]:
+        print(f"    {stage:<20} {spans:>6} {wall:>9.2f} {cpu:>9.2f}")
+    graphs = TIMINGS.graphs()
+    if graphs:
+        print(f"\n  {BOLD}Slowest graphs{RESET}")
+        print(f"    {DIM}{'graph':<45} {'build s':>8} {'save s':>8}{RESET}")
+        for graph_id, build, save in graphs[:TIMINGS_TOP]:
+            print(f"    {graph_id:<45} {build:>8.2f} {save:>8.2f}")
+
+
+def export_clean_data(df: pd.DataFrame, out_dir: Path) -> Path:
+    """Write normalized_data.csv: the app columns, then the metadata columns."""
+    with TIMINGS.span("export"):
+        df = expand_frame(df, APP_WEEKLY_COLUMNS + OPTIONAL_METADATA_COLUMNS)
+        export_cols = [c for c in APP_WEEKLY_COLUMNS if c in df.columns]
+        export_cols += [c for c in OPTIONAL_METADATA_COLUMNS
+                        if c in df.columns and c not in export_cols]
+        path = out_dir / "normalized_data.csv"
+        df[export_cols].to_csv(path, index=False)
+        return path
 
 
 def save_stats_tables(df: pd.DataFrame, out_dir: Path) -> None:
-    tables_dir = out_dir / "tables"
-    tables_dir.mkdir(parents=True, exist_ok=True)
+    with TIMINGS.span("tables"):
+        # Virtual columns are all NaN, which the tables leave out anyway.
+        df = ensure_derived(df)
+        df = expand_frame(df, df.columns)
+        tables_dir = out_dir / "tables"
+        tables_dir.mkdir(parents=True, exist_ok=True)
+
+        numeric_cols = [
+            column
+            for column in df.columns
+            if pd.api.types.is_numeric_dtype(df[column]) and STATS.count(df, column)
+        ]
+        if numeric_cols:
+            STATS.describe(df, numeric_cols).to_csv(tables_dir / "summary_statistics.csv")
+
+        corr = STATS.correlation(df)
+        corr_available = [c for c in corr.columns if STATS.count(df, c) >= 2]
+        if len(corr_available) >= 2:
+            corr.loc[corr_available, corr_available].to_csv(tables_dir / "correlation_matrix.csv")
+
+
+class FigureWriter:
+    """
+    Encodes and writes rendered figures on RENDER_WRITE_THREADS background
+    threads, so the next figure can be built while the last one is written.
+    At most RENDER_WRITE_BACKLOG writes wait at a time.  close() waits for
+    all of them and returns the errors by key.
+    """
 
-    numeric_cols = [
-        column
-        for column in df.columns
-        if pd.api.types.is_numeric_dtype(df[column]) and df[column].notna().any()
-    ]
-    if numeric_cols:
-        df[numeric_cols].describe().to_csv(tables_dir / "summary_statistics.csv")
+    def __init__(self) -> None:
+        self._pool = ThreadPoolExecutor(RENDER_WRITE_THREADS, thread_name_prefix="figure-writer")
+        self._pending: deque[Future] = deque()
+        self._keys: dict[Future, str] = {}
 
-    corr_cols = [
-        "men", "women", "youth", "children", "sunday_home_church",
-        "total_attendance", "tithe", "offerings", "total_income",
-        "baptisms", "holy_communion", "sabbath_school_attendance",
-    ]
-    corr_available = [c for c in corr_cols if c in df.columns and df[c].notna().sum() >= 2]
-    if len(corr_available) >= 2:
-        df[corr_available].corr(numeric_only=True).to_csv(tables_dir / "correlation_matrix.csv")
+    def submit(self, key: str, write: Callable[..., object], *args: object) -> None:
+        while len(self._pending) >= RENDER_WRITE_BACKLOG:
+            wait([self._pending.popleft()])
+        future = self._pool.submit(write, *args)
+        self._pending.append(future)
+        self._keys[future] = key
+
+    def close(self) -> dict[str, Exception]:
+        self._pool.shutdown(wait=True)
+        return {key: future.exception() for future, key in self._keys.items() if future.exception() is not None}
+
+
+def _tight_bbox(fig: Figure, dpi: int) -> Bbox:
+    """The padded box savefig(bbox_inches="tight") crops a dpi raster of fig to."""
+    original = fig.dpi
+    fig.dpi = dpi
+    try:
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer())
+    finally:
+        fig.dpi = original
+    return bbox.padded(matplotlib.rcParams["savefig.pad_inches"])
+
+
+def _write_png(path: Path, rgba: np.ndarray, dpi: int) -> None:
+    # What savefig's Agg canvas does with its buffer.
+    matplotlib.image.imsave(path, memoryview(rgba), format="png", origin="upper", dpi=dpi)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    path.write_bytes(data)
 
 
-def save_figure(fig: Figure, spec: GraphSpec, out_dir: Path,
-                pdf: Optional[PdfPages], dpi: int) -> Path:
+def save_figure(fig: Figure, spec: GraphSpec, out_dir: Path, pdf: Optional[PdfPages], dpi: int,
+                svg: bool = False, writer: Optional[FigureWriter] = None) -> Path:
+    """
+    Write fig as the spec's PNG, a graphs.pdf page and optionally an SVG
+    next to the PNG.  The layout and the tight crop are computed once for
+    every format.  With a writer, the PNG is rasterized here but encoded and
+    written, like the SVG, on the writer's threads; the PDF page is always
+    added here, in order.
+    """
     group_dir = out_dir / spec.group
     group_dir.mkdir(parents=True, exist_ok=True)
     fig.tight_layout()
     path = group_dir / spec.filename
-    fig.savefig(str(path), dpi=dpi, bbox_inches="tight")
+    bbox = _tight_bbox(fig, dpi)
+    raw = io.BytesIO()
+    if writer is not None:
+        fig.savefig(raw, format="rgba", dpi=dpi, bbox_inches=bbox)
+    # The raster's size, computed as savefig sizes the cropped canvas.
+    width, height = map(int, TransformedBbox(Bbox.from_bounds(0, 0, *bbox.size), Affine2D().scale(dpi)).size)
+    if writer is not None and raw.getbuffer().nbytes == width * height * 4:
+        writer.submit(spec.graph_id, _write_png, path,
+                      np.frombuffer(raw.getbuffer(), dtype=np.uint8).reshape(height, width, 4), dpi)
+    else:
+        fig.savefig(str(path), dpi=dpi, bbox_inches=bbox)
+    if svg:
+        vector = io.BytesIO()
+        fig.savefig(vector, format="svg", dpi=dpi, bbox_inches=bbox)
+        if writer is None:
+            _write_bytes(path.with_suffix(".svg"), vector.getvalue())
+        else:
+            writer.submit(spec.graph_id, _write_bytes, path.with_suffix(".svg"), vector.getvalue())
     if pdf is not None:
         pdf.savefig(fig)
     return path
 
 
+def figure_bytes(fig: Figure, fmt: str, dpi: int) -> bytes:
+    """fig as PNG or SVG bytes, laid out and cropped the way save_figure writes it."""
+    fig.tight_layout()
+    bbox = _tight_bbox(fig, dpi)
+    data = io.BytesIO()
+    fig.savefig(data, format=fmt, dpi=dpi, bbox_inches=bbox)
+    return data.getvalue()
+
+
+class RenderServer:
+    """
+    The data and rendered images behind --serve.
+
+    Each source (input file or --db database) is read once and its prepared
+    frames are kept, with the frame derived from all of them.  reload()
+    re-reads only the sources whose size or mtime changed and those added to
+    the input folders.  When the only change is new files, their rows go
+    through append_metrics, as with the parsed-file cache.  render() keeps
+    its images and skips, but not its failures, in an LRU of at most
+    cache_bytes, keyed by graph, format, DPI, record filter and data
+    generation.  Renders and reloads take one
+    lock, as pyplot is not thread-safe; cached images are served without it.
+    WORKBOOKS is never cleared, so the presentation workbooks are parsed once
+    and again only when they change.
+    """
+
+    def __init__(self, inputs: Sequence[str], databases: Sequence[Path], options: ReadOptions,
+                 record_filter: Optional[RecordFilter], cache: Optional[ParsedFileCache] = None,
+                 jobs: int = 1, derive_jobs: int = 1, cache_bytes: int = DEFAULT_SERVE_CACHE_MB * 1024 * 1024):
+        self.inputs = list(inputs)
+        self.databases = list(databases)
+        self.options = options
+        self.record_filter = record_filter
+        self.cache = cache
+        self.jobs = jobs
+        self.derive_jobs = derive_jobs
+        self.cache_bytes = cache_bytes
+        self.df = pd.DataFrame()
+        self.generation = 0
+        self.loaded_at: Optional[datetime] = None
+        self.hits = 0
+        self.misses = 0
+        # path -> (file signature, prepared frames)
+        self._sources: dict[Path, tuple[tuple, list[pd.DataFrame]]] = {}
+        self._derived = pd.DataFrame()
+        # (graph, format, dpi, filter, generation) -> (status, image bytes or reason)
+        self._images: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+        self._image_bytes = 0
+        self._render_lock = threading.Lock()
+        self._image_lock = threading.Lock()
+
+    def _read(self, paths: list[Path]) -> dict[Path, Optional[list[pd.DataFrame]]]:
+        files = [path for path in paths if path not in self.databases]
+        read = dict(zip(files, read_each_input(files, self.options, self.jobs, self.cache)))
+        for database in (path for path in paths if path in self.databases):
+            try:
+                read[database] = read_database(database, self.options.force_year, self.record_filter)
+            except Exception as exc:
+                log(f"Warning: could not read {database}: {exc}")
+                read[database] = None
+        return read
+
+    def reload(self) -> dict:
+        """
+        Re-read the sources that changed, were added or were removed, and
+        re-derive; report what changed.  If that fails, the last data is still
+        served and the next reload reads every source again.  The timing spans
+        a reload records are dropped, as --serve never reports them.
+        """
+        with self._render_lock:
+            mark = len(TIMINGS.spans)
+            try:
+                return self._reload()
+            except Exception:
+                self._sources.clear()
+                self._derived = pd.DataFrame()
+                raise
+            finally:
+                del TIMINGS.spans[mark:]
+
+    def _reload(self) -> dict:
+        signatures: dict[Path, tuple] = {}
+        for path in [*resolve_input_paths(self.inputs), *self.databases]:
+            try:
+                signatures[path] = file_signature(path)
+            except OSError as exc:
+                log(f"Warning: could not read {path}: {exc}")
+        removed = [path for path in self._sources if path not in signatures]
+        changed = [path for path in signatures if path in self._sources and self._sources[path][0] != signatures[path]]
+        added = [path for path in signatures if path not in self._sources]
+        if self.generation and not (removed or changed or added):
+            return self._reload_summary([], [], [])
+
+        append = bool(self.generation and not removed and not changed and not self._derived.empty)
+        for path in removed:
+            del self._sources[path]
+        for path, frames in self._read([*changed, *added]).items():
+            if frames is None:
+                # Not kept, so the next reload tries it again.
+                self._sources.pop(path, None)
+            else:
+                self._sources[path] = (signatures[path], frames)
+
+        # Shallow copies: _combine_frames may reuse a lone frame, and the
+        # kept frames must stay as they were read.
+        def frames_of(paths: Iterable[Path]) -> list[pd.DataFrame]:
+            return [frame.copy(deep=False) for path in paths if path in self._sources
+                    for frame in self._sources[path][1]]
+
+        if append:
+            new_frames = frames_of(added)
+            if new_frames:
+                self._derived = append_metrics(self._derived, _combine_frames(new_frames, self.record_filter))
+        else:
+            frames = frames_of(signatures)
+            self._derived = (derive_metrics(_combine_frames(frames, self.record_filter), jobs=self.derive_jobs)
+                             if frames else pd.DataFrame())
+        self.df = _finish_load(self._derived, None, False) if not self._derived.empty else pd.DataFrame()
+        self.generation += 1
+        self.loaded_at = datetime.now()
+        with self._image_lock:
+            self._images.clear()
+            self._image_bytes = 0
+        return self._reload_summary(changed, added, removed)
+
+    def _reload_summary(self, changed: list[Path], added: list[Path], removed: list[Path]) -> dict:
+        return {"changed": [path.name for path in changed], "added": [path.name for path in added],
+                "removed": [path.name for path in removed], "rows": len(self.df), "generation": self.generation}
+
+    def render(self, graph_id: str, fmt: str = "png", dpi: int = 150,
+               record_filter: Optional[RecordFilter] = None) -> tuple[str, bytes]:
+        """("ok", image bytes), or ("skipped" / "error", reason as bytes), for graph_id on the filtered data."""
+        with self._render_lock:
+            key = (graph_id, fmt, dpi, record_filter, self.generation)
+            with self._image_lock:
+                found = self._images.get(key)
+                if found is not None:
+                    self._images.move_to_end(key)
+                    self.hits += 1
+                    return found
+                self.misses += 1
+            df = self.df if record_filter is None or record_filter.is_empty() else record_filter.apply(self.df)
+            if df.empty:
+                result = ("skipped", b"No records match the request")
+            else:
+                try:
+                    fig = GRAPH_SPECS[graph_id].builder(df)
+                except Exception as exc:
+                    plt.close("all")
+                    result = ("error", str(exc).encode())
+                else:
+                    if fig is None:
+                        result = ("skipped", b"Required data not available")
+                    else:
+                        try:
+                            result = ("ok", figure_bytes(fig, fmt, dpi))
+                        except Exception as exc:
+                            result = ("error", str(exc).encode())
+                        finally:
+                            plt.close(fig)
+        self._remember(key, result)
+        return result
+
+    def cached(self, graph_id: str, fmt: str, dpi: int, record_filter: Optional[RecordFilter]) -> Optional[tuple[str, bytes]]:
+        """The LRU entry for this request, without waiting for a render or reload in progress."""
+        key = (graph_id, fmt, dpi, record_filter, self.generation)
+        with self._image_lock:
+            found = self._images.get(key)
+            if found is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+            return found
+
+    def _remember(self, key: tuple, result: tuple[str, bytes]) -> None:
+        with self._image_lock:
+            if result[0] == "error" or key[-1] != self.generation or key in self._images:
+                return
+            self._images[key] = result
+            self._image_bytes += len(result[1])
+            while self._image_bytes > self.cache_bytes and len(self._images) > 1:
+                _, (_, evicted) = self._images.popitem(last=False)
+                self._image_bytes -= len(evicted)
+
+    def status(self) -> dict:
+        with self._image_lock:
+            images = {"entries": len(self._images), "bytes": self._image_bytes,
+                      "hits": self.hits, "misses": self.misses}
+        return {"rows": len(self.df), "sources": sorted(path.name for path in self._sources),
+                "generation": self.generation,
+                "loaded_at": self.loaded_at.isoformat(timespec="seconds") if self.loaded_at else None,
+                "images": images}
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP front end of the RenderServer in self.server.graphs:
+
+        GET  /graph/<graph_id>.png?dpi=150&church_id=3&date_from=2026-01-01&date_to=2026-03-31
+        GET  /graph/<graph_id>.svg      the same, as SVG
+        GET  /graphs                    graph IDs, titles, groups and descriptions (JSON)
+        GET  /status                    rows, sources and image cache counters (JSON)
+        POST /reload                    re-read changed input files (JSON summary)
+
+    church_id may be repeated.  Graphs without data answer 404 and builder
+    failures 500, with the reason as JSON.
+    """
+
+    server_version = "ChurchAnalysis/1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path in ("/", "/status"):
+            self._json(200, self.server.graphs.status())
+        elif url.path == "/graphs":
+            self._json(200, [{"id": spec.graph_id, "title": spec.title, "group": spec.group,
+                              "description": spec.description} for spec in GRAPH_SPECS.values()])
+        elif url.path.startswith("/graph/"):
+            self._graph(url.path[len("/graph/"):], parse_qs(url.query))
+        elif url.path == "/reload":
+            self._json(405, {"error": "use POST /reload"})
+        else:
+            self._json(404, {"error": f"unknown path {url.path}"})
+
+    def do_POST(self) -> None:
+        if urlsplit(self.path).path == "/reload":
+            try:
+                summary = self.server.graphs.reload()
+            except Exception as exc:
+                log(f"Warning: reload failed: {exc}")
+                self._json(500, {"error": f"reload failed: {exc}"})
+                return
+            self._json(200, summary)
+        else:
+            self._json(404, {"error": f"unknown path {self.path}"})
+
+    def _graph(self, name: str, query: dict[str, list[str]]) -> None:
+        graph_id, _, fmt = name.rpartition(".")
+        if graph_id not in GRAPH_SPECS or fmt not in SERVE_FORMATS:
+            self._json(404, {"error": f"unknown graph {name} (see /graphs; use .png or .svg)"})
+            return
+        try:
+            dpi = int(query.get("dpi", ["150"])[-1])
+            if not SERVE_DPI_RANGE[0] <= dpi <= SERVE_DPI_RANGE[1]:
+                raise ValueError(f"dpi must be between {SERVE_DPI_RANGE[0]} and {SERVE_DPI_RANGE[1]}")
+            church_ids = tuple(sorted({int(value) for values in query.get("church_id", [])
+                                       for value in values.split(",") if value}))
+            date_from, date_to = (pd.Timestamp(query[field][-1]) if field in query else None
+                                  for field in ("date_from", "date_to"))
+        except ValueError as exc:
+            self._json(400, {"error": str(exc)})
+            return
+        record_filter = RecordFilter(church_ids, date_from, date_to)
+        server = self.server.graphs
+        found = server.cached(graph_id, fmt, dpi, record_filter)
+        status, body = found if found is not None else server.render(graph_id, fmt, dpi, record_filter)
+        if status != "ok":
+            self._json(404 if status == "skipped" else 500, {"graph": graph_id, "status": status,
+                                                             "error": body.decode()})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", SERVE_FORMATS[fmt])
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, code: int, payload: object) -> None:
+        body = json.dumps(payload, indent=1).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        log(f"{self.log_date_time_string()}  {format % args}")
+
+
+def make_render_server(graphs: RenderServer, port: int = DEFAULT_SERVE_PORT) -> ThreadingHTTPServer:
+    """An HTTP server for graphs bound to SERVE_HOST (port 0 picks a free port); call serve_forever()."""
+    server = ThreadingHTTPServer((SERVE_HOST, port), RenderRequestHandler)
+    server.daemon_threads = True
+    server.graphs = graphs
+    return server
+
+
+def build_cache(args: argparse.Namespace, output_dir: str) -> Optional[ParsedFileCache]:
+    """Return the parsed-file cache that sits next to output_dir, or None with --no-cache."""
+    if args.no_cache:
+        return None
+    directory = Path(output_dir).expanduser().resolve().parent / CACHE_DIR_NAME
+    return ParsedFileCache(directory, args.cache_max_mb * 1024 * 1024, rebuild=args.rebuild_cache)
+
+
+def build_record_filter(args: argparse.Namespace) -> Optional[RecordFilter]:
+    """Return the --church-id / --date-from / --date-to filter, or None without one."""
+    record_filter = RecordFilter(tuple(args.church_id or ()), args.date_from, args.date_to)
+    return None if record_filter.is_empty() else record_filter
+
+
 def default_inputs() -> list[str]:
     for candidate in ["data/netFinalData.csv", "data/finalData.csv", "data/church_data.csv"]:
         path = SCRIPT_DIR / candidate
@@ -2962,6 +5854,34 @@ def default_inputs() -> list[str]:
     return []
 
 
+def serve(args: argparse.Namespace, inputs: Sequence[str], databases: Sequence[Path],
+          record_filter: Optional[RecordFilter]) -> int:
+    """--serve: load the inputs once, then answer graph requests on SERVE_HOST until Ctrl-C."""
+    set_max_points(args.max_points)
+    graphs = RenderServer(inputs, databases, ReadOptions(args.force_year, args.chunk_rows, args.keep_unknown_columns),
+                          record_filter, build_cache(args, args.output_dir), args.jobs, args.derive_jobs,
+                          args.serve_cache_mb * 1024 * 1024)
+    log(f"Loading {len(inputs) + len(databases)} input(s)…")
+    summary = graphs.reload()
+    log(f"Loaded {summary['rows']} weekly record(s) from {len(graphs.status()['sources'])} source(s).")
+    if not summary["rows"]:
+        log("Warning: no usable records loaded; graphs answer 404 until POST /reload finds some.")
+    try:
+        server = make_render_server(graphs, args.port)
+    except OSError as exc:
+        print_error(f"Could not listen on {SERVE_HOST}:{args.port}: {exc}")
+        return 1
+    host, port = server.server_address[:2]
+    log(f"Serving {len(GRAPH_SPECS)} graphs on http://{host}:{port}/ (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log("Stopped.")
+    finally:
+        server.server_close()
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate church analytics graphs from CSV or XLSX data.",
@@ -2969,6 +5889,14 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--input", nargs="*", default=None,
                         help="CSV/XLSX files or directories.")
+    parser.add_argument("--db", action="append", default=None, metavar="PATH",
+                        help="Flutter app SQLite database to read weekly_records from (repeatable).")
+    parser.add_argument("--church-id", type=int, action="append", default=None,
+                        help="Only load records for this church ID (repeatable).")
+    parser.add_argument("--date-from", type=pd.Timestamp, default=None,
+                        help="Only load weeks starting on or after this date (YYYY-MM-DD).")
+    parser.add_argument("--date-to", type=pd.Timestamp, default=None,
+                        help="Only load weeks starting on or before this date (YYYY-MM-DD).")
     parser.add_argument("--output-dir", "--output", default="church_analysis",
                         help="Directory for output files.")
     parser.add_argument("--graphs", nargs="*", default=None,
@@ -2979,17 +5907,79 @@ def build_parser() -> argparse.ArgumentParser:
                         help="List all graph IDs and exit.")
     parser.add_argument("--pdf", action="store_true",
                         help="Bundle all graphs into a PDF.")
+    parser.add_argument("--svg", action="store_true",
+                        help="Also write each graph as an SVG next to its PNG.")
     parser.add_argument("--dpi", type=int, default=150,
                         help="PNG export resolution.")
+    parser.add_argument("--max-points", type=int, default=DEFAULT_MAX_POINTS,
+                        help="Most points drawn per line in time-series graphs; longer histories are "
+                             "downsampled keeping peaks (0 = draw every week).")
     parser.add_argument("--force-year", type=int, default=None,
                         help="Force all parsed dates to this year.")
     parser.add_argument("--export-clean", action="store_true",
                         help="Write a normalised weekly-record CSV.")
     parser.add_argument("--no-tables", action="store_true",
                         help="Skip summary statistics tables.")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes used to read input files (1 = in-process).")
+    parser.add_argument("--derive-jobs", type=int, default=1,
+                        help=f"Worker processes used to derive metrics for frames of at least "
+                             f"{DERIVE_POOL_MIN_ROWS:,} rows, split by church (1 = in-process).")
+    parser.add_argument("--render-jobs", type=int, default=1,
+                        help="Worker processes used to render graphs, or whole partitions with --by "
+                             "(1 = in-process).")
+    parser.add_argument("--by", choices=BATCH_KEYS, default=None,
+                        help=f"Generate the selected graphs for each {' or '.join(BATCH_KEYS)} in its own "
+                             f"folder under the output directory, with an {BATCH_INDEX} linking them.")
+    parser.add_argument("--force-render", action="store_true",
+                        help=f"Render every graph, even those unchanged since the last run "
+                             f"(see {RENDER_CACHE_DIR}/ in the output directory).")
+    parser.add_argument("--chunk-rows", type=int, default=0,
+                        help="Stream CSV inputs this many rows at a time, keeping only known "
+                             "columns (0 = read whole files).")
+    parser.add_argument("--keep-unknown-columns", action="store_true",
+                        help="Keep input columns that do not map to a known column "
+                             "(they are skipped at read time by default).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Do not read or write the {CACHE_DIR_NAME}/ parsed-file cache.")
+    parser.add_argument("--rebuild-cache", action="store_true",
+                        help="Re-parse every input file and overwrite its cache entry.")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_MB,
+                        help="Size cap for the parsed-file cache; least recently used entries are evicted.")
+    parser.add_argument("--compact", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"Store the loaded data with small integer and categorical dtypes "
+                             f"(None = only for {COMPACT_MIN_ROWS:,} rows or more).")
+    parser.add_argument("--mem-report", action="store_true",
+                        help="After loading, print peak RSS and each load stage's allocations (tracemalloc).")
+    parser.add_argument("--timings", action="store_true",
+                        help="End the results screen with the slowest stages and graphs.")
+    parser.add_argument("--run-report", default=None, metavar="PATH",
+                        help="Write every timed stage and graph (wall, CPU time, peak RSS) to this JSON file.")
+    parser.add_argument("--serve", action="store_true",
+                        help=f"Load the inputs once and render graphs on request over HTTP on {SERVE_HOST} "
+                             f"(GET /graph/<graph_id>.png?dpi=..&church_id=.., POST /reload).")
+    parser.add_argument("--port", type=int, default=DEFAULT_SERVE_PORT,
+                        help="Port for --serve (0 = any free port).")
+    parser.add_argument("--serve-cache-mb", type=int, default=DEFAULT_SERVE_CACHE_MB,
+                        help="Size cap for the images --serve keeps in memory; least recently used are evicted.")
     return parser
 
 
+def compact_summary(df: pd.DataFrame) -> str:
+    """One line on what compact_frame saved, for the load summary."""
+    record = df.attrs[COMPACT_ATTR]
+    mb = 1024 * 1024
+    size = df.memory_usage(deep=True).sum()
+    return (f"{size / mb:.1f} MB in memory, {record['saved_bytes'] / mb:.1f} MB saved "
+            f"({len(record['dtypes'])} column(s) narrowed, {len(record['virtual'])} empty column(s) virtual)")
+
+
+def start_memory_report(paths: Sequence[Path], databases: Sequence[Path]) -> None:
+    """Turn on MEMORY tracing for a load of these inputs (--mem-report)."""
+    MEMORY.input_bytes = sum(path.stat().st_size for path in [*paths, *databases])
+    MEMORY.start()
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = build_parser()
     argv_list = list(sys.argv[1:] if argv is None else argv)
@@ -3004,38 +5994,68 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # NON-INTERACTIVE (CLI flags supplied)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    headless = bool(args.input or args.graphs or args.group)
+    databases = [Path(value).expanduser() for value in args.db or []]
+    for database in databases:
+        if not database.is_file():
+            parser.error(f"Database not found: {database}")
+    record_filter = build_record_filter(args)
+
+    if args.serve:
+        input_values = args.input if args.input or databases else default_inputs()
+        if not input_values and not databases:
+            parser.error("No input files provided and no default data files found.")
+        return serve(args, input_values or [], databases, record_filter)
+
+    headless = bool(args.input or args.db or args.graphs or args.group or args.by)
     if headless:
-        input_values = args.input if args.input else default_inputs()
-        if not input_values:
+        input_values = args.input if args.input or databases else default_inputs()
+        if not input_values and not databases:
             parser.error("No input files provided and no default data files found.")
 
-        paths = resolve_input_paths(input_values)
-        if not paths:
+        paths = resolve_input_paths(input_values or [])
+        if not paths and not databases:
             parser.error("No readable CSV/XLSX files found in the provided inputs.")
 
-        log(f"Loading {len(paths)} input file(s)…")
-        df = load_data(paths, args.force_year)
+        graph_ids = parse_graph_selection(args.graphs, args.group)
+        log(f"Loading {len(paths) + len(databases)} input file(s)…")
+        if args.mem_report:
+            start_memory_report(paths, databases)
+        cache = build_cache(args, args.output_dir)
+        with TIMINGS.span("load"):
+            df = load_data(paths, args.force_year, jobs=args.jobs, cache=cache,
+                           databases=databases, record_filter=record_filter,
+                           chunk_rows=args.chunk_rows, keep_unknown_columns=args.keep_unknown_columns,
+                           derive_jobs=args.derive_jobs, compact=args.compact,
+                           columns=required_columns(graph_ids, not args.no_tables, args.export_clean))
+        if cache is not None:
+            log(f"Parsed-file cache: {cache.hits} hit(s), {cache.misses} miss(es) in {cache.directory}")
+        if COMPACT_ATTR in df.attrs:
+            log(f"Compact dtypes: {compact_summary(df)}")
+        if args.mem_report:
+            MEMORY.report()
         if df.empty:
             parser.error("No usable records loaded — check your input files.")
+        if args.by and args.by not in df.columns:
+            parser.error(f"--by {args.by}: the loaded records have no {args.by} column.")
 
         out_dir = Path(args.output_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
 
         if args.export_clean:
-            export_cols = [c for c in APP_WEEKLY_COLUMNS if c in df.columns]
-            export_cols += [c for c in OPTIONAL_METADATA_COLUMNS
-                            if c in df.columns and c not in export_cols]
-            df[export_cols].to_csv(out_dir / "normalized_data.csv", index=False)
-            log(f"Generated {out_dir / 'normalized_data.csv'}")
+            log(f"Generated {export_clean_data(df, out_dir)}")
 
-        if not args.no_tables:
+        if not args.no_tables and not args.by:
             save_stats_tables(df, out_dir)
             log(f"Generated summary tables in {out_dir / 'tables'}")
 
-        graph_ids = parse_graph_selection(args.graphs, args.group)
-        settings = dict(output_dir=str(out_dir), pdf=args.pdf,
-                        dpi=args.dpi, export_clean=False, no_tables=True)
+        settings = dict(output_dir=str(out_dir), pdf=args.pdf, svg=args.svg, dpi=args.dpi,
+                        render_jobs=args.render_jobs, force_render=args.force_render,
+                        max_points=args.max_points, timings=args.timings, run_report=args.run_report,
+                        export_clean=False, no_tables=True)
+        if args.by:
+            # Each partition gets its own summary tables.
+            settings["no_tables"] = args.no_tables
+            return run_batch(df, graph_ids, args.by, settings)
         return run_and_report(df, graph_ids, settings)
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -3046,6 +6066,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             default_out=args.output_dir,
             default_dpi=args.dpi,
         )
+        settings["render_jobs"] = args.render_jobs
+        settings["force_render"] = args.force_render
+        settings["svg"] = args.svg
+        settings["max_points"] = args.max_points
+        settings["timings"] = args.timings
+        settings["run_report"] = args.run_report
     except KeyboardInterrupt:
         print(f"\n\n  {YELLOW}Cancelled — goodbye.{RESET}\n")
         return 0
@@ -3053,17 +6079,29 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     # Load data after wizard so errors are reported clearly
     try:
         paths = resolve_input_paths(settings["inputs"])
-        if not paths:
+        if not paths and not databases:
             print_error("No readable CSV/XLSX files found — check your paths.")
             return 1
 
         clear()
         print_header("Loading Data…")
-        df = load_data(paths, settings.get("force_year"))
+        if args.mem_report:
+            start_memory_report(paths, databases)
+        cache = build_cache(args, settings["output_dir"])
+        # Derived columns are added as the buckets generated need them.
+        with TIMINGS.span("load"):
+            df = load_data(paths, settings.get("force_year"), jobs=args.jobs, cache=cache,
+                           databases=databases, record_filter=record_filter,
+                           chunk_rows=args.chunk_rows, keep_unknown_columns=args.keep_unknown_columns,
+                           derive_jobs=args.derive_jobs, compact=args.compact, columns=())
+        if args.mem_report:
+            MEMORY.report()
         if df.empty:
             print_error("No usable records found in the data files.")
             return 1
-        print_success(f"Loaded {len(df)} weekly record(s) from {len(paths)} file(s).")
+        print_success(f"Loaded {len(df)} weekly record(s) from {len(paths) + len(databases)} file(s).")
+        if COMPACT_ATTR in df.attrs:
+            print_status("Compact dtypes", compact_summary(df))
         input(f"\n  {DIM}Press Enter to open the Graph Browser…{RESET}")
 
     except KeyboardInterrupt:
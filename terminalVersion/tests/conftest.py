@@ -0,0 +1,33 @@
+"""Shared fixtures for the data.py tests (run python -m pytest from terminalVersion/)."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import benchmark  # noqa: E402
+import data  # noqa: E402
+
+
+@pytest.fixture
+def weekly_csv(tmp_path: Path) -> Path:
+    """An app export CSV of 3 churches × 12 weeks from the benchmark generator."""
+    return benchmark.write_inputs(tmp_path / "inputs", churches=3, weeks=12, formats=("csv",))[0]
+
+
+@pytest.fixture
+def weekly(weekly_csv: Path) -> pd.DataFrame:
+    """weekly_csv as load_data returns it, every derived column computed."""
+    return data.ensure_derived(data.load_data([weekly_csv], None, compact=False))
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    """Module-level caches start empty for each test."""
+    data.STATS.clear()
+    data.WORKBOOKS.clear()
+    yield
+    data.STATS.clear()
@@ -0,0 +1,32 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import data
+
+
+def test_expand_frame_round_trips(weekly):
+    weekly["mission_offering"] = np.nan
+    compact = data.compact_frame(weekly)
+    assert "mission_offering" in compact.attrs[data.COMPACT_ATTR]["virtual"]
+    assert "mission_offering" not in compact.columns
+
+    expanded = data.expand_frame(compact)
+    pd.testing.assert_frame_equal(expanded, weekly)
+    assert data.COMPACT_ATTR not in expanded.attrs
+
+
+def test_expand_frame_columns_without_warnings(weekly):
+    weekly["mission_offering"] = np.nan
+    compact = data.compact_frame(weekly)
+    columns = ["mission_offering", "men", "source_file", "week_start_date", "not_a_column"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        expanded = data.expand_frame(compact, columns)
+    assert list(expanded.columns) == [column for column in weekly.columns if column in columns]
+    pd.testing.assert_frame_equal(expanded, weekly[list(expanded.columns)])
+
+
+def test_expand_frame_leaves_plain_frames_alone(weekly):
+    assert data.expand_frame(weekly, ["men"]) is weekly
@@ -0,0 +1,68 @@
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+import pytest
+
+import benchmark
+import data
+
+
+# WeeklyRecords in lib/database/app_database.dart.
+DRIFT_COLUMNS = [
+    "id", "church_id", "created_by_admin_id", "week_start_date", "men", "women", "youth", "children",
+    "sunday_home_church", "baptisms", "holy_communion", "tithe", "offerings", "emergency_collection",
+    "planned_collection", "sabbath_school_attendance", "visitors_count", "mission_offering",
+    "local_church_budget", "created_at", "updated_at",
+]
+
+
+def camel_case(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(part.title() for part in rest)
+
+
+def write_database(path, records: pd.DataFrame, camel: bool, text_dates: bool) -> None:
+    """records as weekly_records in one of Drift's layouts: column naming and DateTime storage."""
+    table = records[DRIFT_COLUMNS].copy()
+    for column in data.DB_DATETIME_COLUMNS:
+        stamps = pd.to_datetime(table[column])
+        if text_dates:
+            table[column] = stamps.dt.strftime("%Y-%m-%dT%H:%M:%S.000")
+        else:
+            table[column] = [data._local_epoch(stamp) if column == "week_start_date"
+                             else int(stamp.to_pydatetime().timestamp()) for stamp in stamps]
+    if camel:
+        table = table.rename(columns=camel_case)
+    with closing(sqlite3.connect(path)) as conn:
+        table.to_sql(data.DB_TABLE, conn, index=False)
+
+
+LAYOUTS = [(camel, text_dates) for camel in (False, True) for text_dates in (False, True)]
+
+
+@pytest.mark.parametrize("camel, text_dates", LAYOUTS, ids=lambda value: str(value))
+def test_read_database_layouts(tmp_path, camel, text_dates):
+    records = benchmark.synthetic_records(churches=3, weeks=8)
+    path = tmp_path / "app.sqlite"
+    write_database(path, records, camel, text_dates)
+
+    frames = data.read_database(path, None)
+    assert len(frames) == 1
+    df = frames[0].sort_values(["church_id", "week_start_date"]).reset_index(drop=True)
+    assert len(df) == len(records)
+    assert set(DRIFT_COLUMNS) <= set(df.columns)
+    for column in data.DB_DATETIME_COLUMNS:
+        assert pd.api.types.is_datetime64_dtype(df[column])
+    assert list(df["week_start_date"]) == list(records["week_start_date"])
+    for column in ("church_id", "men", "tithe", "holy_communion", "local_church_budget"):
+        assert pd.api.types.is_numeric_dtype(df[column])
+        assert df[column].tolist() == pytest.approx(records[column].tolist())
+    assert set(df["source_table"]) == {data.DB_TABLE}
+
+    dates = records["week_start_date"].drop_duplicates().tolist()
+    record_filter = data.RecordFilter((2, 3), dates[2], dates[5])
+    pushed = data.read_database(path, None, record_filter)[0].reset_index(drop=True)
+    after = record_filter.apply(data.read_database(path, None)[0]).reset_index(drop=True)
+    assert 0 < len(pushed) < len(records)
+    pd.testing.assert_frame_equal(pushed, after)
@@ -0,0 +1,23 @@
+import benchmark
+import data
+
+
+def test_unreadable_file_is_retried_next_run(tmp_path, monkeypatch):
+    paths = benchmark.write_inputs(tmp_path / "inputs", churches=4, weeks=10, formats=("csv", "messy_csv"))
+    cache = data.ParsedFileCache(tmp_path / "cache", 64 * 1024 * 1024)
+    expected = data.load_data(paths, None, compact=False)
+    read_input_file = data.read_input_file
+
+    def locked(path, options):
+        if path == paths[1]:
+            raise PermissionError("locked")
+        return read_input_file(path, options)
+
+    monkeypatch.setattr(data, "read_input_file", locked)
+    first = data.load_data(paths, None, cache=cache, compact=False)
+    assert set(first["source_file"]) == {paths[0].name}
+
+    monkeypatch.setattr(data, "read_input_file", read_input_file)
+    second = data.load_data(paths, None, cache=cache, compact=False)
+    assert len(second) == len(expected)
+    assert set(second["source_file"]) == {path.name for path in paths}
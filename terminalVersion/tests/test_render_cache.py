@@ -0,0 +1,22 @@
+from pathlib import Path
+
+import data
+
+
+def test_fingerprint_covers_shared_helpers(weekly, tmp_path, monkeypatch):
+    fingerprint = data.RenderCache(tmp_path, weekly, 100).fingerprint("total_attendance_trend")
+    assert data.RenderCache(tmp_path, weekly, 100).fingerprint("total_attendance_trend") == fingerprint
+
+    edited = tmp_path / "data.py"
+    edited.write_text(Path(data.__file__).read_text() + "\n# a change to a plotting helper\n")
+    monkeypatch.setattr(data, "__file__", str(edited))
+    assert data.RenderCache(tmp_path, weekly, 100).fingerprint("total_attendance_trend") != fingerprint
+
+
+def test_failures_are_not_remembered(weekly, tmp_path):
+    cache = data.RenderCache(tmp_path, weekly, 100)
+    cache.record("income_distribution", "skipped", "Required data not available")
+    assert cache.lookup("income_distribution") == ("skipped", "Required data not available")
+    cache.record("income_distribution", "error", "could not write: disk full")
+    assert cache.lookup("income_distribution") is None
+    assert "income_distribution" not in cache.manifest["graphs"]
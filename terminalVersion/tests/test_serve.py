@@ -0,0 +1,69 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+import data
+
+
+@pytest.fixture
+def server(weekly_csv):
+    graphs = data.RenderServer([str(weekly_csv.parent)], [], data.ReadOptions(), None)
+    graphs.reload()
+    http = data.make_render_server(graphs, 0)
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://{data.SERVE_HOST}:{http.server_address[1]}"
+    http.shutdown()
+    http.server_close()
+
+
+def request(url: str, body: bytes = None) -> tuple[int, str, bytes]:
+    try:
+        with urllib.request.urlopen(url, data=body, timeout=60) as response:
+            return response.status, response.headers["Content-Type"], response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.headers["Content-Type"], error.read()
+
+
+def test_graph_png(server):
+    status, content_type, body = request(f"{server}/graph/total_attendance_trend.png?church_id=2&dpi=60")
+    assert (status, content_type) == (200, "image/png")
+    assert body.startswith(b"\x89PNG")
+
+
+def test_unknown_graph(server):
+    status, content_type, body = request(f"{server}/graph/no_such_graph.png")
+    assert (status, content_type) == (404, "application/json")
+    assert "no_such_graph" in json.loads(body)["error"]
+
+
+def test_failing_render(server, monkeypatch):
+    def broken(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(data, "figure_bytes", broken)
+    status, content_type, body = request(f"{server}/graph/income_distribution.png?dpi=60")
+    assert (status, content_type) == (500, "application/json")
+    assert json.loads(body) == {"graph": "income_distribution", "status": "error", "error": "disk full"}
+
+    monkeypatch.undo()
+    assert request(f"{server}/graph/income_distribution.png?dpi=60")[0] == 200
+
+
+def test_reload(server, monkeypatch):
+    status, content_type, body = request(f"{server}/reload", b"")
+    assert (status, content_type) == (200, "application/json")
+    assert json.loads(body)["changed"] == []
+    assert request(f"{server}/reload")[0] == 405
+
+    def broken(*args, **kwargs):
+        raise MemoryError("out of memory")
+
+    monkeypatch.setattr(data, "resolve_input_paths", broken)
+    status, content_type, body = request(f"{server}/reload", b"")
+    assert (status, content_type) == (500, "application/json")
+    assert "out of memory" in json.loads(body)["error"]
+    assert json.loads(request(f"{server}/status")[2])["rows"] == 36
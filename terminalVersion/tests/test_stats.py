@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+import data
+
+
+def test_compact_consumers_share_statistics(weekly):
+    weekly["mission_offering"] = np.nan
+    expected_corr = weekly[[column for column in data.CORRELATION_COLUMNS
+                            if weekly[column].count()]].corr(numeric_only=True)
+    compact = data.compact_frame(weekly)
+
+    tables = data.expand_frame(compact, compact.columns)
+    graph = data.expand_frame(compact, data.GRAPH_SPECS["correlation_heatmap"].columns)
+    corr = data.STATS.correlation(tables)
+    assert data.STATS.correlation(graph) is corr
+    pd.testing.assert_frame_equal(corr, expected_corr)
+
+    trend = data.expand_frame(compact, data.GRAPH_SPECS["total_attendance_trend"].columns)
+    assert data.STATS.correlation(trend) is corr
+    assert data.STATS.count(trend, "tithe") == weekly["tithe"].count()
+    assert data.STATS.count(trend, "mission_offering") == 0
+
+
+def test_statistics_follow_the_frame(weekly):
+    first = data.STATS.count(weekly, "men")
+    assert first == len(weekly)
+    fewer = weekly.iloc[:5]
+    assert data.STATS.count(fewer, "men") == 5